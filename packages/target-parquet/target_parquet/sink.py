@@ -95,13 +95,17 @@ class ParquetSink(BatchSink):
     """Parquery target sample class."""
 
     max_size = 100000  # Max records to write in any batch
+    accepts_arrow_batches = True
 
     def process_batch(self, context: dict) -> None:
         """Write any prepped records out and return only once fully written."""
-        records_to_drain = context["records"]
         schema = json_schema_to_arrow(self.schema)
         writer = pq.ParquetWriter(self.config["filepath"], schema)
 
-        table = pa.Table.from_pylist(records_to_drain, schema=schema)
+        if "arrow_table" in context:
+            # Parquet BATCH files are written as-is, without a dict per row
+            table = context["arrow_table"].select(schema.names).cast(schema)
+        else:
+            table = pa.Table.from_pylist(context["records"], schema=schema)
         writer.write_table(table)
         writer.close()
@@ -8,6 +8,8 @@ from uuid import uuid4
 from singer_sdk.batch import BaseBatcher, lazy_chunked_generator
 
 if t.TYPE_CHECKING:
+    import pyarrow as pa
+
     from singer_sdk.helpers.types import Record
 
 __all__ = ["ParquetBatcher"]
@@ -54,3 +56,76 @@ class ParquetBatcher(BaseBatcher):
 
             file_url = storage.get_url(filename)
             yield [file_url]
+
+    def get_batches_from_arrow(
+        self,
+        record_batches: t.Iterable[pa.RecordBatch],
+    ) -> t.Iterator[list[str]]:
+        """Yield manifest of batches written from Arrow record batches.
+
+        Record batches are written to Parquet files of up to ``batch_size`` rows,
+        without converting them to Python objects.
+
+        Args:
+            record_batches: The record batches to write. All record batches must have
+                the same schema.
+
+        Yields:
+            A list of file paths (called a manifest).
+
+        .. versionadded:: 0.50.0
+        """
+        import pyarrow.parquet as pq  # noqa: PLC0415
+
+        sync_id = f"{self.tap_name}--{self.stream_name}-{uuid4()}"
+        prefix = self.batch_config.storage.prefix or ""
+        compression: t.Literal["gzip", "snappy"] = (
+            "gzip" if self.batch_config.encoding.compression == "gzip" else "snappy"
+        )
+
+        for i, chunk in enumerate(
+            _chunk_record_batches(record_batches, self.batch_config.batch_size),
+            start=1,
+        ):
+            filename = f"{prefix}{sync_id}={i}.parquet"
+            if self.batch_config.encoding.compression == "gzip":
+                filename = f"{filename}.gz"
+            storage = self.batch_config.storage
+            with (
+                storage.open(filename, "wb") as f,
+                pq.ParquetWriter(f, chunk[0].schema, compression=compression) as w,
+            ):
+                for record_batch in chunk:
+                    w.write_batch(record_batch)
+
+            file_url = storage.get_url(filename)
+            yield [file_url]
+
+
+def _chunk_record_batches(
+    record_batches: t.Iterable[pa.RecordBatch],
+    chunk_size: int,
+) -> t.Iterator[list[pa.RecordBatch]]:
+    """Split record batches into chunks of up to ``chunk_size`` rows.
+
+    Args:
+        record_batches: The record batches to split.
+        chunk_size: The maximum number of rows in a chunk.
+
+    Yields:
+        Lists of record batch slices, with ``chunk_size`` rows except for the last.
+    """
+    chunk: list[pa.RecordBatch] = []
+    rows = 0
+    for record_batch in record_batches:
+        offset = 0
+        while offset < record_batch.num_rows:
+            length = min(chunk_size - rows, record_batch.num_rows - offset)
+            chunk.append(record_batch.slice(offset, length))
+            offset += length
+            rows += length
+            if rows == chunk_size:
+                yield chunk
+                chunk, rows = [], 0
+    if chunk:
+        yield chunk
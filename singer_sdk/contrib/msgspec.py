@@ -6,6 +6,7 @@ import datetime
 import decimal
 import logging
 import sys
+import time
 import typing as t
 
 import msgspec
@@ -91,6 +92,11 @@ class MsgSpecReader(GenericSingerReader[str]):
 class MsgSpecWriter(GenericSingerWriter[bytes, Message]):
     """Interface for all plugins writing Singer messages to stdout."""
 
+    def __init__(self) -> None:
+        """Initialize the writer."""
+        self._buffer = bytearray()
+        self._last_flush = time.monotonic()
+
     def serialize_message(self, message: Message) -> bytes:  # noqa: PLR6301
         """Serialize a dictionary into a line of json.
 
@@ -108,5 +114,24 @@ class MsgSpecWriter(GenericSingerWriter[bytes, Message]):
         Args:
             message: The message to write.
         """
-        sys.stdout.buffer.write(self.format_message(message))
+        data = self.format_message(message)
+        self.bytes_written += len(data)
+        if not self.buffer_size:
+            sys.stdout.buffer.write(data)
+            sys.stdout.flush()
+            return
+
+        self._buffer += data
+        if self._should_flush(message, len(self._buffer)):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any buffered messages to stdout.
+
+        .. versionadded:: 0.50.0
+        """
+        if self.buffer_size and self._buffer:
+            sys.stdout.buffer.write(self._buffer)
+            self._buffer.clear()
         sys.stdout.flush()
+        self._last_flush = time.monotonic()
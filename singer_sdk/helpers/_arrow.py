@@ -0,0 +1,59 @@
+"""Helpers for Arrow record batches."""
+
+from __future__ import annotations
+
+import typing as t
+
+if t.TYPE_CHECKING:
+    import pyarrow as pa
+
+    from singer_sdk.singerlib import SelectionMask
+
+
+def get_record_batch_columns(
+    column_names: t.Iterable[str],
+    schema: dict,
+    mask: SelectionMask,
+    *,
+    drop_unmapped: bool,
+) -> tuple[list[str], list[str]]:
+    """Get the columns of a record batch that should be written.
+
+    Args:
+        column_names: The columns of the record batch.
+        schema: The stream schema.
+        mask: The stream selection mask.
+        drop_unmapped: Whether columns missing from the schema should be dropped.
+
+    Returns:
+        The selected columns and the unmapped columns.
+    """
+    properties = schema.get("properties", {})
+    drop_unmapped = drop_unmapped and not schema.get("additionalProperties")
+    selected: list[str] = []
+    unmapped: list[str] = []
+    for name in column_names:
+        if not mask["properties", name]:
+            continue
+        if drop_unmapped and name not in properties:
+            unmapped.append(name)
+            continue
+        selected.append(name)
+    return selected, unmapped
+
+
+def get_max_value(batch: pa.RecordBatch, column: str) -> t.Any:  # noqa: ANN401
+    """Get the maximum value of a record batch column.
+
+    Args:
+        batch: The record batch.
+        column: The column name.
+
+    Returns:
+        The maximum value, or None if the column is missing or only has nulls.
+    """
+    import pyarrow.compute as pc  # noqa: PLC0415
+
+    if column not in batch.schema.names:
+        return None
+    return pc.max(batch.column(column)).as_py()
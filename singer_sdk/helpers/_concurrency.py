@@ -0,0 +1,111 @@
+"""Helpers for syncing streams concurrently."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+_T = t.TypeVar("_T")
+
+
+def release_while_iterating(
+    iterable: t.Iterable[_T],
+    lock: threading.Lock,
+) -> t.Iterator[_T]:
+    """Iterate over items while releasing a held lock for each item fetched.
+
+    The caller must hold the lock. It is released while the next item is produced,
+    which typically involves I/O, and re-acquired before the item is yielded.
+
+    Args:
+        iterable: The items to iterate over.
+        lock: The lock held by the caller.
+
+    Yields:
+        Each item, with the lock held.
+    """
+    iterator = iter(iterable)
+    while True:
+        lock.release()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            lock.acquire()
+        yield item
+
+
+EXHAUSTED = object()
+"""Yielded by :func:`interleave` after the last item of a source."""
+
+
+class _SourceError(t.NamedTuple):
+    exception: BaseException
+
+
+def interleave(  # noqa: C901
+    sources: t.Sequence[t.Callable[[], t.Iterable[_T]]],
+    max_workers: int,
+    *,
+    buffer_size: int = 1000,
+) -> t.Iterator[tuple[int, _T | object]]:
+    """Iterate over several sources concurrently, in a pool of threads.
+
+    Items of a source are yielded in order, but interleaved with the items of other
+    sources. At most ``buffer_size`` items are read ahead of the consumer.
+
+    Args:
+        sources: Callables returning the iterables to read.
+        max_workers: Maximum number of sources read at the same time.
+        buffer_size: Maximum number of items waiting for the consumer.
+
+    Yields:
+        Tuples of the source index and an item, or :data:`EXHAUSTED` once the source
+        has no more items.
+
+    Raises:
+        BaseException: The first exception raised by a source.
+    """
+    items: queue.Queue[tuple[int, t.Any]] = queue.Queue(maxsize=buffer_size)
+    stop = threading.Event()
+
+    def put(item: tuple[int, t.Any]) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def read(index: int, source: t.Callable[[], t.Iterable[_T]]) -> None:
+        try:
+            for item in source():
+                if not put((index, item)):
+                    return
+        # Exceptions that don't derive from Exception, like KeyboardInterrupt, are
+        # passed on too, so that the consumer doesn't wait for the source forever
+        except BaseException as e:  # noqa: BLE001
+            put((index, _SourceError(e)))
+        else:
+            put((index, EXHAUSTED))
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for index, source in enumerate(sources):
+            executor.submit(read, index, source)
+
+        remaining = len(sources)
+        while remaining:
+            index, item = items.get()
+            if isinstance(item, _SourceError):
+                raise item.exception
+            if item is EXHAUSTED:
+                remaining -= 1
+            yield index, item
+    finally:
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -5,6 +5,8 @@ from __future__ import annotations
 import re
 from string import ascii_lowercase, digits
 
+_DIGIT_LETTERS = dict(zip(digits, ascii_lowercase, strict=False))
+
 
 def snakecase(string: str) -> str:
     """Convert string into snake case.
@@ -41,9 +43,6 @@ def replace_leading_digit(string: str) -> str:
         A modified string if original starts with a number,
         else the unmodified original.
     """
-    if string[0] in digits:
-        letters = list(ascii_lowercase)
-        numbers = [int(d) for d in digits]
-        digit_map = {n: letters[n] for n in numbers}
-        return digit_map[int(string[0])] + string[1:]
+    if string[0] in _DIGIT_LETTERS:
+        return _DIGIT_LETTERS[string[0]] + string[1:]
     return string
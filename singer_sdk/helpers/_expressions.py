@@ -0,0 +1,438 @@
+"""Compile stream map expressions into Python functions.
+
+Expressions are evaluated with the same semantics and safety restrictions as
+`simpleeval`, but the abstract syntax tree is only walked once, when the
+expression is compiled, instead of once per record.
+"""
+
+from __future__ import annotations
+
+import ast
+import typing as t
+
+import simpleeval  # type: ignore[import-untyped]
+
+CompiledExpression: t.TypeAlias = t.Callable[[dict], t.Any]
+
+# Operators that behave exactly like the `simpleeval` defaults when evaluated
+# natively. Operators with safety limits, like `**`, always call the `simpleeval`
+# implementation.
+_NATIVE_OPERATORS = frozenset(
+    (
+        ast.BitAnd,
+        ast.BitOr,
+        ast.BitXor,
+        ast.Div,
+        ast.Eq,
+        ast.FloorDiv,
+        ast.Gt,
+        ast.GtE,
+        ast.In,
+        ast.Invert,
+        ast.Is,
+        ast.IsNot,
+        ast.Lt,
+        ast.LtE,
+        ast.Mod,
+        ast.Not,
+        ast.NotEq,
+        ast.NotIn,
+        ast.Sub,
+        ast.UAdd,
+        ast.USub,
+    ),
+)
+
+_RECORD = "_record"
+
+
+class UnsupportedExpressionError(Exception):
+    """Raised when an expression cannot be compiled."""
+
+
+def _too_long(value: t.Any) -> bool:  # noqa: ANN401
+    return hasattr(value, "__len__") and len(value) > simpleeval.MAX_STRING_LENGTH
+
+
+class _ExpressionCompiler:
+    """Translate a `simpleeval` expression into an equivalent Python lambda.
+
+    Every name in the expression is rewritten into a lookup against the record or
+    the fixed names, so expressions cannot reach anything else in the namespace of
+    the generated function. Nodes that `simpleeval` does not allow, or whose
+    semantics would be hard to reproduce exactly (comprehensions, for example),
+    raise `UnsupportedExpressionError`.
+    """
+
+    def __init__(
+        self,
+        expr: str,
+        evaluator: simpleeval.EvalWithCompoundTypes,
+        names: t.Mapping[str, t.Any],
+        record_aliases: t.Collection[str],
+        self_property: str | None,
+    ) -> None:
+        self.expr = expr
+        self.evaluator = evaluator
+        self.names = names
+        self.record_aliases = record_aliases
+        self.self_property = self_property
+        self.namespace: dict[str, t.Any] = {"__builtins__": {}}
+
+    def _constant(self, value: t.Any) -> ast.expr:  # noqa: ANN401
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return ast.Name(id=name, ctx=ast.Load())
+
+    def _call(self, func: t.Any, *args: ast.expr) -> ast.Call:  # noqa: ANN401
+        return ast.Call(func=self._constant(func), args=list(args), keywords=[])
+
+    def _operator(self, op: ast.AST) -> t.Callable | None:
+        """Return the `simpleeval` function for an operator, or None if native."""
+        operators = self.evaluator.operators
+        op_type = type(op)
+        if op_type not in operators:
+            raise UnsupportedExpressionError
+        func = operators[op_type]
+        if op_type in _NATIVE_OPERATORS and func is simpleeval.DEFAULT_OPERATORS.get(
+            op_type
+        ):
+            return None
+        return func  # type: ignore[no-any-return]
+
+    def compile(self, parsed: ast.AST) -> CompiledExpression:
+        """Compile a parsed expression.
+
+        Args:
+            parsed: The first statement of the parsed expression.
+
+        Returns:
+            A function that evaluates the expression against a record.
+
+        Raises:
+            UnsupportedExpressionError: If the expression cannot be compiled.
+        """
+        if not isinstance(parsed, ast.Expr):
+            raise UnsupportedExpressionError
+
+        body = self.visit(parsed.value)
+        function = ast.Expression(
+            body=ast.Lambda(
+                args=ast.arguments(
+                    posonlyargs=[],
+                    args=[ast.arg(arg=_RECORD)],
+                    kwonlyargs=[],
+                    kw_defaults=[],
+                    defaults=[],
+                ),
+                body=body,
+            ),
+        )
+        ast.fix_missing_locations(function)
+        code = compile(function, f"<stream map expression {self.expr!r}>", "eval")
+        return eval(code, self.namespace)  # type: ignore[no-any-return]  # noqa: S307
+
+    def visit(self, node: ast.AST) -> ast.expr:
+        """Translate a single node.
+
+        Args:
+            node: The node to translate.
+
+        Returns:
+            The translated node.
+
+        Raises:
+            UnsupportedExpressionError: If the node cannot be compiled.
+        """
+        visitor = getattr(self, f"_visit_{type(node).__name__}", None)
+        if visitor is None:
+            raise UnsupportedExpressionError
+        return visitor(node)  # type: ignore[no-any-return]
+
+    @staticmethod
+    def _visit_Constant(node: ast.Constant) -> ast.expr:  # noqa: N802
+        if _too_long(node.value):
+            raise UnsupportedExpressionError
+        return ast.Constant(value=node.value)
+
+    def _visit_Name(self, node: ast.Name) -> ast.expr:  # noqa: N802
+        record = ast.Name(id=_RECORD, ctx=ast.Load())
+        if node.id in self.record_aliases:
+            return record
+        if node.id in self.names:
+            return self._constant(self.names[node.id])
+
+        # Look the name up in the record, then in the available functions
+        if node.id in self.evaluator.functions:
+            fallback = self._constant(self.evaluator.functions[node.id])
+        else:
+            fallback = self._call(
+                _raise_name_not_defined,
+                ast.Constant(value=node.id),
+                ast.Constant(value=self.expr),
+            )
+        lookup = _record_lookup(node.id, fallback)
+
+        # `self` is the original value of the property being transformed
+        if node.id == "self" and self.self_property:
+            return _record_lookup(self.self_property, lookup)
+        return lookup
+
+    def _visit_UnaryOp(self, node: ast.UnaryOp) -> ast.expr:  # noqa: N802
+        operand = self.visit(node.operand)
+        func = self._operator(node.op)
+        if func is None:
+            return ast.UnaryOp(op=node.op, operand=operand)
+        return self._call(func, operand)
+
+    def _visit_BinOp(self, node: ast.BinOp) -> ast.expr:  # noqa: N802
+        left, right = self.visit(node.left), self.visit(node.right)
+        func = self._operator(node.op)
+        if func is None:
+            return ast.BinOp(left=left, op=node.op, right=right)
+        return self._call(func, left, right)
+
+    def _visit_BoolOp(self, node: ast.BoolOp) -> ast.expr:  # noqa: N802
+        return ast.BoolOp(op=node.op, values=[self.visit(v) for v in node.values])
+
+    def _visit_Compare(self, node: ast.Compare) -> ast.expr:  # noqa: N802
+        left = self.visit(node.left)
+        comparators = [self.visit(c) for c in node.comparators]
+        funcs = [self._operator(op) for op in node.ops]
+        if all(func is None for func in funcs):
+            return ast.Compare(left=left, ops=node.ops, comparators=comparators)
+        if len(funcs) == 1:
+            return self._call(funcs[0], left, comparators[0])
+        raise UnsupportedExpressionError
+
+    def _visit_IfExp(self, node: ast.IfExp) -> ast.expr:  # noqa: N802
+        return ast.IfExp(
+            test=self.visit(node.test),
+            body=self.visit(node.body),
+            orelse=self.visit(node.orelse),
+        )
+
+    def _visit_Call(self, node: ast.Call) -> ast.expr:  # noqa: N802
+        if isinstance(node.func, ast.Attribute):
+            func = self.visit(node.func)
+        elif isinstance(node.func, ast.Name):
+            function = self.evaluator.functions.get(node.func.id)
+            if function is None or function in simpleeval.DISALLOW_FUNCTIONS:
+                raise UnsupportedExpressionError
+            func = self._constant(function)
+        else:
+            raise UnsupportedExpressionError
+
+        if any(isinstance(arg, ast.Starred) for arg in node.args) or any(
+            keyword.arg is None for keyword in node.keywords
+        ):
+            raise UnsupportedExpressionError
+
+        return ast.Call(
+            func=func,
+            args=[self.visit(arg) for arg in node.args],
+            keywords=[
+                ast.keyword(arg=keyword.arg, value=self.visit(keyword.value))
+                for keyword in node.keywords
+            ],
+        )
+
+    def _visit_Attribute(self, node: ast.Attribute) -> ast.expr:  # noqa: N802
+        if (
+            node.attr.startswith(tuple(simpleeval.DISALLOW_PREFIXES))
+            or node.attr in simpleeval.DISALLOW_METHODS
+        ):
+            raise UnsupportedExpressionError
+        return self._call(
+            _get_attribute,
+            self.visit(node.value),
+            ast.Constant(value=node.attr),
+            ast.Constant(value=self.evaluator.ATTR_INDEX_FALLBACK),
+            ast.Constant(value=self.expr),
+        )
+
+    def _visit_Subscript(self, node: ast.Subscript) -> ast.expr:  # noqa: N802
+        return ast.Subscript(
+            value=self.visit(node.value),
+            slice=self.visit(node.slice),
+            ctx=ast.Load(),
+        )
+
+    def _visit_Slice(self, node: ast.Slice) -> ast.expr:  # noqa: N802
+        return ast.Slice(
+            lower=None if node.lower is None else self.visit(node.lower),
+            upper=None if node.upper is None else self.visit(node.upper),
+            step=None if node.step is None else self.visit(node.step),
+        )
+
+    def _visit_JoinedStr(self, node: ast.JoinedStr) -> ast.expr:  # noqa: N802
+        return self._call(_join_strings, *(self.visit(v) for v in node.values))
+
+    def _visit_FormattedValue(self, node: ast.FormattedValue) -> ast.expr:  # noqa: N802
+        # simpleeval ignores conversions like `!r`
+        value = self.visit(node.value)
+        if node.format_spec is None:
+            return value
+        return self._call(_format_value, value, self.visit(node.format_spec))
+
+    def _visit_Dict(self, node: ast.Dict) -> ast.expr:  # noqa: N802
+        if any(key is None for key in node.keys):
+            raise UnsupportedExpressionError
+        return ast.Dict(
+            keys=[self.visit(key) for key in node.keys],  # type: ignore[arg-type]
+            values=[self.visit(value) for value in node.values],
+        )
+
+    def _visit_List(self, node: ast.List) -> ast.expr:  # noqa: N802
+        elts: list[ast.expr] = [
+            ast.Starred(value=self.visit(elt.value), ctx=ast.Load())
+            if isinstance(elt, ast.Starred)
+            else self.visit(elt)
+            for elt in node.elts
+        ]
+        return ast.List(elts=elts, ctx=ast.Load())
+
+    def _visit_Tuple(self, node: ast.Tuple) -> ast.expr:  # noqa: N802
+        return ast.Tuple(elts=[self.visit(elt) for elt in node.elts], ctx=ast.Load())
+
+    def _visit_Set(self, node: ast.Set) -> ast.expr:  # noqa: N802
+        return ast.Set(elts=[self.visit(elt) for elt in node.elts])
+
+
+def _record_lookup(key: str, fallback: ast.expr) -> ast.expr:
+    """Build ``record[key] if key in record else fallback``."""
+    return ast.IfExp(
+        test=ast.Compare(
+            left=ast.Constant(value=key),
+            ops=[ast.In()],
+            comparators=[ast.Name(id=_RECORD, ctx=ast.Load())],
+        ),
+        body=ast.Subscript(
+            value=ast.Name(id=_RECORD, ctx=ast.Load()),
+            slice=ast.Constant(value=key),
+            ctx=ast.Load(),
+        ),
+        orelse=fallback,
+    )
+
+
+def _raise_name_not_defined(name: str, expr: str) -> t.NoReturn:
+    raise simpleeval.NameNotDefined(name, expr)
+
+
+def _get_attribute(
+    value: t.Any,  # noqa: ANN401
+    attr: str,
+    index_fallback: bool,  # noqa: FBT001
+    expr: str,
+) -> t.Any:  # noqa: ANN401
+    try:
+        return getattr(value, attr)
+    except (AttributeError, TypeError):
+        pass
+
+    if index_fallback:
+        try:
+            return value[attr]
+        except (KeyError, TypeError):
+            pass
+
+    raise simpleeval.AttributeDoesNotExist(attr, expr)
+
+
+def _join_strings(*values: t.Any) -> str:
+    strings = []
+    for value in values:
+        string = str(value)
+        # Like simpleeval, limit the length of each value rather than the total
+        if len(string) > simpleeval.MAX_STRING_LENGTH:
+            msg = "Sorry, I will not evaluate something this long."
+            raise simpleeval.IterableTooLong(msg)
+        strings.append(string)
+    return "".join(strings)
+
+
+def _format_value(value: t.Any, format_spec: str) -> str:  # noqa: ANN401
+    return ("{:" + format_spec + "}").format(value)
+
+
+def compile_expression(
+    expr: str,
+    parsed: ast.AST,
+    evaluator: simpleeval.EvalWithCompoundTypes,
+    *,
+    names: t.Mapping[str, t.Any],
+    record_aliases: t.Collection[str] = ("_", "record"),
+    self_property: str | None = None,
+) -> CompiledExpression | None:
+    """Compile a stream map expression into a function of the record.
+
+    The compiled function raises the same `simpleeval` exceptions as evaluating
+    the expression with ``evaluator`` would.
+
+    Args:
+        expr: The expression source, used in error messages.
+        parsed: The first statement of the parsed expression.
+        evaluator: The evaluator whose functions and operators should be used.
+        names: Names with a fixed value, which take precedence over record
+            properties.
+        record_aliases: Names that refer to the record itself.
+        self_property: Property whose value the ``self`` name refers to.
+
+    Returns:
+        A function that evaluates the expression against a record, or ``None`` if
+        the expression uses features that cannot be compiled, such as
+        comprehensions.
+    """
+    compiler = _ExpressionCompiler(
+        expr,
+        evaluator,
+        names=names,
+        record_aliases=record_aliases,
+        self_property=self_property,
+    )
+    try:
+        return compiler.compile(parsed)
+    except UnsupportedExpressionError:
+        return None
+
+
+def get_record_key(
+    parsed: ast.AST,
+    names: t.Collection[str],
+    record_aliases: t.Collection[str] = ("_", "record"),
+) -> str | None:
+    """Return the record property an expression reads as-is, if any.
+
+    This is the case for expressions like ``name``, ``_['name']`` or
+    ``record['name']``, which evaluate to ``record['name']`` whenever the record
+    has that property.
+
+    Args:
+        parsed: The first statement of the parsed expression.
+        names: Names with a fixed value, which take precedence over record
+            properties.
+        record_aliases: Names that refer to the record itself.
+
+    Returns:
+        The property name, or ``None`` if the expression does anything else.
+    """
+    if not isinstance(parsed, ast.Expr):
+        return None
+
+    node = parsed.value
+    if isinstance(node, ast.Name):
+        if node.id in names or node.id in record_aliases or node.id == "self":
+            return None
+        return node.id
+
+    if (
+        isinstance(node, ast.Subscript)
+        and isinstance(node.value, ast.Name)
+        and node.value.id in record_aliases
+        and isinstance(node.slice, ast.Constant)
+        and isinstance(node.slice.value, str)
+    ):
+        return node.slice.value
+
+    return None
@@ -0,0 +1,195 @@
+"""Incremental decoding of JSON documents."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+import typing as t
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_START = "-0123456789"
+_NUMBER_PART = re.compile(r"[0-9.eE+\-]*")
+
+
+class JSONChunkReader:
+    """Read JSON values from a document received in chunks.
+
+    Values are decoded with :meth:`json.JSONDecoder.raw_decode` as soon as they are
+    complete, so only the value being decoded needs to be held in memory.
+    """
+
+    def __init__(
+        self,
+        chunks: t.Iterable[bytes],
+        decoder: json.JSONDecoder,
+    ) -> None:
+        """Create a new reader.
+
+        Args:
+            chunks: The chunks of a UTF-8 encoded JSON document.
+            decoder: The decoder for JSON values.
+        """
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._decoder = decoder
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read(self) -> bool:
+        """Append the next chunk to the buffer.
+
+        Returns:
+            False if the end of the document was reached.
+        """
+        if self._eof:
+            return False
+
+        text = ""
+        for chunk in self._chunks:
+            if text := self._text_decoder.decode(chunk):
+                break
+        else:
+            self._eof = True
+            text = self._text_decoder.decode(b"", final=True)
+
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        return bool(text) or not self._eof
+
+    def _read_more(self) -> bool:
+        """Read until the unread part of the buffer has at least doubled.
+
+        Growing the buffer geometrically bounds how many times a large value is
+        decoded before it is complete.
+
+        Returns:
+            False if there was nothing left to read.
+        """
+        target = max(2 * (len(self._buffer) - self._pos), 1)
+        read = False
+        while len(self._buffer) - self._pos < target and self._read():
+            read = True
+        return read
+
+    def peek(self) -> str:
+        """Get the next character that is not whitespace, without consuming it.
+
+        Returns:
+            The next character, or an empty string at the end of the document.
+        """
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read():
+                return ""
+
+    def expect(self, characters: str) -> str:
+        """Consume the next character that is not whitespace.
+
+        Args:
+            characters: The allowed characters.
+
+        Returns:
+            The consumed character.
+
+        Raises:
+            JSONDecodeError: If the next character is not allowed.
+        """
+        char = self.peek()
+        if not char or char not in characters:
+            msg = f"Expecting one of {characters!r}"
+            raise json.JSONDecodeError(msg, self._buffer, self._pos)
+        self._pos += 1
+        return char
+
+    def decode(self) -> t.Any:  # noqa: ANN401
+        """Decode the next JSON value.
+
+        Returns:
+            The decoded value.
+
+        Raises:
+            JSONDecodeError: If the value is not valid JSON.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._read_more():
+                    continue
+                raise
+
+            # A number at the end of the buffer may continue in the next chunk
+            if (
+                self._buffer[self._pos] in _NUMBER_START
+                and _NUMBER_PART.match(self._buffer, end).end() == len(self._buffer)  # type: ignore[union-attr]
+                and self._read_more()
+            ):
+                continue
+
+            self._pos = end
+            return value
+
+
+def _seek_key(reader: JSONChunkReader, key: str) -> bool:
+    """Consume an object up to the value of a key.
+
+    Args:
+        reader: A reader positioned at the start of a value.
+        key: The key to look for.
+
+    Returns:
+        True if the reader is positioned at the value of the key, False if the value
+        is not an object or does not have the key.
+    """
+    if reader.peek() != "{":
+        reader.decode()
+        return False
+
+    reader.expect("{")
+    if reader.peek() == "}":
+        return False
+    while True:
+        name = reader.decode()
+        reader.expect(":")
+        if name == key:
+            return True
+        reader.decode()
+        if reader.expect(",}") == "}":
+            return False
+
+
+def iter_array_items(
+    reader: JSONChunkReader,
+    path: t.Sequence[str],
+) -> t.Generator[t.Any, None, None]:
+    """Decode the items of an array nested in object keys, one at a time.
+
+    Args:
+        reader: A reader positioned at the start of the document.
+        path: Keys of the nested objects that lead to the array.
+
+    Yields:
+        Each item of the array. A value that is not an array is yielded as-is, as
+        in ``$[*]`` JSONPath expressions.
+    """
+    if not all(_seek_key(reader, key) for key in path):
+        return
+
+    if reader.peek() != "[":
+        value = reader.decode()
+        if value is not None:
+            yield value
+        return
+
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.decode()
+        if reader.expect(",]") == "]":
+            return
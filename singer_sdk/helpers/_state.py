@@ -5,6 +5,7 @@ from __future__ import annotations
 import copy
 import logging
 import typing as t
+from collections.abc import Mapping
 
 from singer_sdk.exceptions import InvalidStreamSortException
 from singer_sdk.helpers._typing import to_json_compatible
@@ -26,11 +27,117 @@ STARTING_MARKER = "starting_replication_value"
 logger = logging.getLogger("singer_sdk")
 
 
+def _get_partition_key(value: t.Any) -> t.Hashable:  # noqa: ANN401
+    """Return a hashable key that is equal for equal partition contexts.
+
+    Args:
+        value: A partition context, or a value in a partition context.
+
+    Returns:
+        A hashable key.
+
+    Raises:
+        TypeError: If the context contains unhashable values.
+    """
+    if isinstance(value, Mapping):
+        return frozenset((k, _get_partition_key(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_get_partition_key(v) for v in value))
+    hash(value)
+    return t.cast("t.Hashable", value)
+
+
+class PartitionStateIndex:
+    """Index of the partition states of a stream, keyed by partition context.
+
+    The index maps a canonical key of each partition context to the partition
+    state in the Singer ``partitions`` list, so that finding the state of a
+    partition does not depend on the number of partitions. The list itself is
+    left untouched. The index is built once and then extended as partitions are
+    appended to the list, and is rebuilt if the list is replaced or shrinks.
+    """
+
+    _DUPLICATE: t.ClassVar[dict] = {}
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self._partitions: list[dict] | None = None
+        self._index: dict[t.Hashable, dict] = {}
+        self._indexed = 0
+
+    def _update(self, partitions: list[dict]) -> None:
+        if partitions is not self._partitions or len(partitions) < self._indexed:
+            self._partitions = partitions
+            self._index = {}
+            self._indexed = 0
+        for partition_state in partitions[self._indexed :]:
+            try:
+                key = _get_partition_key(partition_state["context"])
+            except TypeError:
+                key = object()
+            self._index[key] = (
+                self._DUPLICATE if key in self._index else partition_state
+            )
+        self._indexed = len(partitions)
+
+    def find(
+        self,
+        partitions: list[dict],
+        state_partition_context: types.Context,
+    ) -> dict | None:
+        """Find the state of a partition.
+
+        Args:
+            partitions: The Singer ``partitions`` list of the stream state.
+            state_partition_context: The partition context to look for.
+
+        Returns:
+            The partition state, or None if the partition is not in the list.
+        """
+        try:
+            key = _get_partition_key(state_partition_context)
+        except TypeError:
+            return _find_in_partitions_list(partitions, state_partition_context)
+
+        self._update(partitions)
+        found = self._index.get(key)
+        if found is self._DUPLICATE or (
+            found is not None and found["context"] != state_partition_context
+        ):
+            # Let the linear scan report duplicates and handle mutated contexts
+            self._partitions = None
+            return _find_in_partitions_list(partitions, state_partition_context)
+        return found
+
+    def create(
+        self,
+        partitions: list[dict],
+        state_partition_context: types.Context,
+    ) -> dict:
+        """Append a new partition state to the list.
+
+        Args:
+            partitions: The Singer ``partitions`` list of the stream state.
+            state_partition_context: The partition context.
+
+        Returns:
+            The new partition state.
+        """
+        new_partition_state = _create_in_partitions_list(
+            partitions,
+            state_partition_context,
+        )
+        self._update(partitions)
+        return new_partition_state
+
+
 def get_state_if_exists(
     tap_state: types.TapState,
     tap_stream_id: str,
     state_partition_context: types.Context | None = None,
     key: str | None = None,
+    *,
+    partition_index: PartitionStateIndex | None = None,
 ) -> t.Any | None:  # noqa: ANN401
     """Return the stream or partition state, creating a new one if it does not exist.
 
@@ -41,6 +148,8 @@ def get_state_if_exists(
             by default None (not partitioned)
         key: name of the key searched for, by default None (return entire state if
             found)
+        partition_index: an index of the stream partitions, to avoid scanning the
+            partitions list
 
     Returns:
         Returns the state if exists, otherwise None
@@ -57,10 +166,8 @@ def get_state_if_exists(
     if "partitions" not in stream_state:
         return None  # No partitions defined
 
-    matched_partition = _find_in_partitions_list(
-        stream_state["partitions"],
-        state_partition_context,
-    )
+    find = partition_index.find if partition_index else _find_in_partitions_list
+    matched_partition = find(stream_state["partitions"], state_partition_context)
     if matched_partition is None:
         return None  # Partition definition not present
     return matched_partition.get(key, None) if key else matched_partition
@@ -106,6 +213,8 @@ def get_writeable_state_dict(
     tap_state: types.TapState,
     tap_stream_id: str,
     state_partition_context: types.Context | None = None,
+    *,
+    partition_index: PartitionStateIndex | None = None,
 ) -> dict:
     """Return the stream or partition state, creating a new one if it does not exist.
 
@@ -114,6 +223,8 @@ def get_writeable_state_dict(
         tap_stream_id: the id of the stream
         state_partition_context: keys which identify the partition context,
             by default None (not partitioned)
+        partition_index: an index of the stream partitions, to avoid scanning the
+            partitions list
 
     Returns:
         Returns a writeable dict at the stream or partition level.
@@ -134,6 +245,14 @@ def get_writeable_state_dict(
 
     stream_state.setdefault("partitions", [])
     stream_state_partitions: list[dict] = stream_state["partitions"]
+    if partition_index is not None:
+        if found := partition_index.find(
+            stream_state_partitions,
+            state_partition_context,
+        ):
+            return found
+        return partition_index.create(stream_state_partitions, state_partition_context)
+
     if found := _find_in_partitions_list(
         stream_state_partitions,
         state_partition_context,
@@ -310,13 +429,52 @@ def log_sort_error(
     log_fn(msg)
 
 
+_MISSING = object()
+
+
+def _snapshot_state(value: t.Any, previous: t.Any = _MISSING) -> t.Any:  # noqa: ANN401
+    """Return a deep copy of a state value, sharing unchanged parts with a snapshot.
+
+    Parts of ``value`` that are equal to the same part of ``previous`` are not
+    copied, so taking a new snapshot only copies the streams and partitions whose
+    state changed since the previous one.
+
+    Args:
+        value: The state, or a value within the state.
+        previous: The previous snapshot of the same value, if any.
+
+    Returns:
+        A snapshot of the value that is not affected by later changes to it.
+    """
+    if previous is not _MISSING and value == previous:
+        return previous
+    if isinstance(value, dict):
+        previous_dict = previous if isinstance(previous, dict) else {}
+        return {
+            key: _snapshot_state(item, previous_dict.get(key, _MISSING))
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        previous_list = previous if isinstance(previous, list) else []
+        return [
+            _snapshot_state(
+                item,
+                previous_list[i] if i < len(previous_list) else _MISSING,
+            )
+            for i, item in enumerate(value)
+        ]
+    return copy.deepcopy(value)
+
+
 class StateWriter:
     """Centralized state message writer that prevents duplicate state emissions.
 
     This class manages the writing of STATE messages to ensure that duplicate
     state messages are not emitted across multiple streams or tap-level operations.
     It tracks the last emitted state and only writes new messages when the state
-    has actually changed.
+    has actually changed. The last emitted state is kept as a snapshot that shares
+    unchanged streams and partitions with the previous one, so only the parts of
+    the state that changed are copied.
     """
 
     def __init__(self, message_writer: GenericSingerWriter) -> None:
@@ -339,6 +497,9 @@ class StateWriter:
             state: The current tap state to potentially emit.
         """
         # Check if state has changed since last emission
-        if self._last_emitted_state is None or state != self._last_emitted_state:
+        if self._last_emitted_state is None:
+            self._message_writer.write_message(StateMessage(value=state))
+            self._last_emitted_state = _snapshot_state(state)
+        elif state != self._last_emitted_state:
             self._message_writer.write_message(StateMessage(value=state))
-            self._last_emitted_state = copy.deepcopy(state)
+            self._last_emitted_state = _snapshot_state(state, self._last_emitted_state)
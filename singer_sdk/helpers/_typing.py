@@ -410,116 +410,229 @@ def conform_record_data_types(
 
     Any property names not found in the schema catalog will be removed, and a single
     warning will be logged listing each unmapped property name.
+
+    This compiles a new :class:`TypeConformer` on every call. Callers that conform
+    many records against the same schema should create a conformer once and reuse
+    it instead.
     """
-    rec, unmapped_properties = _conform_record_data_types(record, schema, level, None)
+    return TypeConformer(schema, level).conform_record(stream_name, record, logger)
+
+
+# Value types that may need to be converted to a JSON-compatible value, regardless
+# of the property schema
+_CONVERTIBLE_TYPES = (
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    bytes,
+    float,
+    decimal.Decimal,
+)
+
+
+class _PropertyConformer:
+    """Conformance plan for a single property."""
+
+    __slots__ = (
+        "exclusive_boolean",
+        "items",
+        "object",
+        "properties",
+        "schema",
+        "uniform_list",
+        "uniform_list_error",
+    )
 
-    if len(unmapped_properties) > 0:
-        _warn_unmapped_properties(stream_name, tuple(unmapped_properties), logger)
+    def __init__(self, schema: dict, level: TypeConformanceLevel) -> None:
+        self.schema = schema
+        # Boolean schemas (e.g. `true`) accept any value as-is
+        is_dict = isinstance(schema, dict)
+        self.exclusive_boolean = is_dict and _is_exclusive_boolean_type(schema)
+        self.uniform_list = False
+        self.uniform_list_error: Exception | None = None
+        if is_dict:
+            try:
+                self.uniform_list = bool(is_uniform_list(schema))
+            except (EmptySchemaTypeError, ValueError) as e:
+                # Only relevant if an array value is ever found for this property
+                self.uniform_list_error = e
+        self.object = (
+            is_dict and bool(is_object_type(schema)) and "properties" in schema
+        )
 
-    return rec
+        # Only compiled when needed, i.e. for recursive conformance
+        self.properties: TypeConformer | None = None
+        self.items: TypeConformer | _PropertyConformer | None = None
+        if level == TypeConformanceLevel.RECURSIVE and self.object:
+            self.properties = TypeConformer(schema, level)
+        if level == TypeConformanceLevel.RECURSIVE and self.uniform_list:
+            item_schema = schema["items"]
+            if is_object_type(item_schema) and "properties" in item_schema:
+                self.items = TypeConformer(item_schema, level)
+            else:
+                self.items = _PropertyConformer(item_schema, level)
+
+    def conform_primitive(self, elem: t.Any) -> t.Any:  # noqa: ANN401
+        """Conform a primitive (i.e. not object or array) value."""
+        if isinstance(elem, _CONVERTIBLE_TYPES):
+            return _conform_primitive_property(elem, self.schema)
+        if self.exclusive_boolean:
+            return None if elem is None else elem != 0
+        return elem
 
 
-# TODO: This is in dire need of refactoring. It's a mess.
-def _conform_record_data_types(
-    input_object: dict[str, t.Any],
-    schema: dict,
-    level: TypeConformanceLevel,
-    parent: str | None,
-) -> tuple[dict[str, t.Any], list[str]]:
-    """Translate values in record dictionary to singer-compatible data types.
+class TypeConformer:
+    """Translate record values to singer-compatible data types.
 
-    Any property names not found in the schema catalog will be removed, and a single
-    warning will be logged listing each unmapped property name.
+    The schema is inspected once, when the conformer is created. Conforming a record
+    then only costs a type check per value, and records that need no changes are
+    returned as-is instead of being copied.
+    """
 
-    This is called recursively to process nested objects and arrays.
+    def __init__(self, schema: dict, level: TypeConformanceLevel) -> None:
+        """Compile a conformer for the given schema.
+
+        Args:
+            schema: JSON schema the records are expected to meet.
+            level: Specifies how recursive the conformance process should be.
+        """
+        self.schema = schema
+        self.level = level
+        self._recursive = level == TypeConformanceLevel.RECURSIVE
+        self._additional_properties = bool(schema.get("additionalProperties"))
+        self._properties: dict[str, _PropertyConformer] = {}
+        if level != TypeConformanceLevel.NONE:
+            self._properties = {
+                name: _PropertyConformer(property_schema, level)
+                for name, property_schema in schema.get("properties", {}).items()
+            }
+
+    def conform_record(
+        self,
+        stream_name: str,
+        record: dict[str, t.Any],
+        logger: logging.Logger,
+    ) -> dict[str, t.Any]:
+        """Translate values in a record to singer-compatible data types.
+
+        Any property names not found in the schema will be removed, and a single
+        warning will be logged listing each unmapped property name.
+
+        Args:
+            stream_name: Name of the stream, for logging.
+            record: A single record.
+            logger: Logger to warn about unmapped properties.
+
+        Returns:
+            The conformed record. This is the input record if nothing changed.
+        """
+        rec, unmapped_properties = self.conform(record)
+
+        if unmapped_properties:
+            _warn_unmapped_properties(stream_name, tuple(unmapped_properties), logger)
+
+        return rec
+
+    def conform(
+        self,
+        input_object: dict[str, t.Any],
+        parent: str | None = None,
+    ) -> tuple[dict[str, t.Any], list[str]]:
+        """Translate values in a (nested) object to singer-compatible data types.
+
+        Args:
+            input_object: A single record or nested object.
+            parent: '.' separated path to this element from the object root (for
+                logging).
+
+        Returns:
+            The conformed object and the paths of the unmapped properties.
+        """
+        unmapped_properties: list[str] = []
+        if self.level == TypeConformanceLevel.NONE:
+            return input_object, unmapped_properties
+
+        properties = self._properties
+        changes: dict[str, t.Any] = {}
+        unmapped_names: set[str] = set()
+
+        for property_name, elem in input_object.items():
+            prop = properties.get(property_name)
+            if prop is None:
+                if not self._additional_properties:
+                    unmapped_names.add(property_name)
+                    unmapped_properties.append(
+                        property_name if parent is None else f"{parent}.{property_name}"
+                    )
+                continue
+
+            if isinstance(elem, (list, dict)):
+                path = property_name if parent is None else f"{parent}.{property_name}"
+                output = self._conform_container(elem, prop, path, unmapped_properties)
+            else:
+                output = prop.conform_primitive(elem)
 
-    Args:
-        input_object: A single record
-        schema: JSON schema the given input_object is expected to meet
-        level:  Specifies how recursive the conformance process should be
-        parent: '.' separated path to this element from the object root (for logging)
-    """
-    output_object: dict[str, t.Any] = {}
-    unmapped_properties: list[str] = []
+            if output is not elem:
+                changes[property_name] = output
+
+        if unmapped_names:
+            return {
+                key: changes.get(key, value)
+                for key, value in input_object.items()
+                if key not in unmapped_names
+            }, unmapped_properties
+
+        if changes:
+            output_object = input_object.copy()
+            output_object.update(changes)
+            return output_object, unmapped_properties
 
-    if level == TypeConformanceLevel.NONE:
         return input_object, unmapped_properties
 
-    for property_name, elem in input_object.items():
-        property_path = property_name if parent is None else f"{parent}.{property_name}"
-        if property_name not in schema["properties"]:
-            if schema.get("additionalProperties"):
-                output_object[property_name] = elem
-            else:
-                unmapped_properties.append(property_path)
-            continue
-
-        property_schema = schema["properties"][property_name]
-        if isinstance(elem, list) and is_uniform_list(property_schema):
-            if level == TypeConformanceLevel.RECURSIVE:
-                output, sub_unmapped_properties = _conform_uniform_list(
-                    elem,
-                    path=property_path,
-                    schema=property_schema,
-                    level=level,
-                )
-                output_object[property_name] = output
-                unmapped_properties.extend(sub_unmapped_properties)
-            else:
-                output_object[property_name] = elem
-        elif (
-            isinstance(elem, dict)
-            and is_object_type(property_schema)
-            and "properties" in property_schema
-        ):
-            if level == TypeConformanceLevel.RECURSIVE:
-                (
-                    output_object[property_name],
-                    sub_unmapped_properties,
-                ) = _conform_record_data_types(
-                    elem,
-                    property_schema,
-                    level,
-                    property_path,
-                )
+    def _conform_container(
+        self,
+        elem: list | dict,
+        prop: _PropertyConformer,
+        path: str,
+        unmapped_properties: list[str],
+    ) -> t.Any:  # noqa: ANN401
+        if isinstance(elem, list):
+            if prop.uniform_list_error is not None:
+                raise prop.uniform_list_error
+            if prop.uniform_list:
+                if not self._recursive:
+                    return elem
+                return self._conform_list(elem, prop, path, unmapped_properties)
+        elif prop.object:
+            if prop.properties is None:
+                return elem
+            output, sub_unmapped_properties = prop.properties.conform(elem, path)
+            unmapped_properties.extend(sub_unmapped_properties)
+            return output
+        return prop.conform_primitive(elem)
+
+    @staticmethod
+    def _conform_list(
+        element: list,
+        prop: _PropertyConformer,
+        path: str,
+        unmapped_properties: list[str],
+    ) -> list:
+        items = prop.items
+        output = []
+        changed = False
+        for item in element:
+            if isinstance(items, TypeConformer) and isinstance(item, dict):
+                output_item, sub_unmapped_properties = items.conform(item, path)
                 unmapped_properties.extend(sub_unmapped_properties)
+            elif isinstance(items, _PropertyConformer):
+                output_item = items.conform_primitive(item)
             else:
-                output_object[property_name] = elem
-        else:
-            output_object[property_name] = _conform_primitive_property(
-                elem,
-                property_schema,
-            )
-    return output_object, unmapped_properties
-
-
-def _conform_uniform_list(
-    element: list,
-    *,
-    path: str,
-    schema: dict,
-    level: TypeConformanceLevel,
-) -> tuple[list, list[str]]:
-    item_schema = schema["items"]
-    unmapped_properties = []
-    output = []
-    for item in element:
-        if is_object_type(item_schema) and isinstance(item, dict):
-            (
-                output_item,
-                sub_unmapped_properties,
-            ) = _conform_record_data_types(
-                item,
-                item_schema,
-                level,
-                path,
-            )
-            unmapped_properties.extend(sub_unmapped_properties)
+                output_item = _conform_primitive_property(item, prop.schema["items"])
+            changed = changed or output_item is not item
             output.append(output_item)
-        else:
-            output.append(_conform_primitive_property(item, item_schema))
 
-    return output, unmapped_properties
+        return output if changed else element
 
 
 def _conform_primitive_property(  # noqa: PLR0911
@@ -0,0 +1,402 @@
+"""Compile JSON schemas into specialized Python validation functions."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import numbers
+import re
+import typing as t
+from collections.abc import Mapping, Sequence
+
+from singer_sdk.typing import DEFAULT_JSONSCHEMA_VALIDATOR
+
+if t.TYPE_CHECKING:
+    import jsonschema
+
+SchemaCheck: t.TypeAlias = t.Callable[[t.Any], bool]
+
+# Keywords the compiler knows how to translate to Python code
+_SUPPORTED_KEYWORDS = frozenset(
+    (
+        "additionalProperties",
+        "allOf",
+        "anyOf",
+        "const",
+        "enum",
+        "exclusiveMaximum",
+        "exclusiveMinimum",
+        "format",
+        "items",
+        "maxItems",
+        "maxLength",
+        "maxProperties",
+        "maximum",
+        "minItems",
+        "minLength",
+        "minProperties",
+        "minimum",
+        "not",
+        "oneOf",
+        "pattern",
+        "properties",
+        "required",
+        "type",
+    ),
+)
+
+# Keywords that have validation semantics but no compiled equivalent. A schema that
+# uses any of these is not compiled at all.
+_UNSUPPORTED_KEYWORDS = (
+    frozenset(DEFAULT_JSONSCHEMA_VALIDATOR.VALIDATORS) - _SUPPORTED_KEYWORDS
+)
+
+_TYPE_EXPRESSIONS = {
+    "array": "isinstance({0}, list)",
+    "boolean": "isinstance({0}, bool)",
+    "integer": (
+        "(isinstance({0}, int) and not isinstance({0}, bool)"
+        " or isinstance({0}, float) and {0}.is_integer())"
+    ),
+    "null": "{0} is None",
+    "number": "(isinstance({0}, _Number) and not isinstance({0}, bool))",
+    "object": "isinstance({0}, dict)",
+    "string": "isinstance({0}, str)",
+}
+
+_MISSING = object()
+_TRUE = object()
+_FALSE = object()
+
+
+class UnsupportedSchemaError(Exception):
+    """Raised when a schema cannot be compiled."""
+
+
+def schema_hash(schema: dict) -> str:
+    """Return a stable hash of a JSON schema.
+
+    Args:
+        schema: A JSON schema.
+
+    Returns:
+        A hex digest that is equal for equal schemas, regardless of key order.
+    """
+    dumped = json.dumps(schema, sort_keys=True, default=str)
+    return hashlib.sha256(dumped.encode()).hexdigest()
+
+
+def _unbool(value: t.Any) -> t.Any:  # noqa: ANN401
+    if value is True:
+        return _TRUE
+    if value is False:
+        return _FALSE
+    return value
+
+
+def json_equal(one: t.Any, two: t.Any) -> bool:  # noqa: ANN401
+    """Compare two JSON values the way JSON Schema does.
+
+    Unlike Python's ``==``, booleans are never equal to numbers.
+
+    Args:
+        one: A JSON value.
+        two: Another JSON value.
+
+    Returns:
+        True if both values are equal.
+    """
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return bool(one == two)
+    if isinstance(one, Sequence) and isinstance(two, Sequence):
+        return len(one) == len(two) and all(
+            json_equal(i, j) for i, j in zip(one, two, strict=True)
+        )
+    if isinstance(one, Mapping) and isinstance(two, Mapping):
+        return one.keys() == two.keys() and all(
+            json_equal(one[key], two[key]) for key in one
+        )
+    return bool(_unbool(one) == _unbool(two))
+
+
+class _SchemaCompiler:
+    """Generate the source code of a validation function for a JSON schema."""
+
+    def __init__(self, format_checker: jsonschema.FormatChecker | None) -> None:
+        self.format_checker = format_checker
+        self.namespace: dict[str, t.Any] = {
+            "_MISSING": _MISSING,
+            "_Number": numbers.Number,
+            "_json_equal": json_equal,
+        }
+        self.functions: list[str] = []
+        self._counter = 0
+
+    def _name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def _constant(self, value: t.Any) -> str:  # noqa: ANN401
+        name = self._name("_c")
+        self.namespace[name] = value
+        return name
+
+    def compile(self, schema: dict | bool) -> str:  # noqa: FBT001
+        """Compile a schema into a function and return its name.
+
+        Args:
+            schema: The JSON schema to compile.
+
+        Returns:
+            The name of the generated function in the namespace.
+        """
+        name = self._name("_check")
+        lines = [f"def {name}(v0):"]
+        self._emit(schema, "v0", lines, 1)
+        lines.append("    return True")
+        self.functions.append("\n".join(lines))
+        return name
+
+    def _emit(  # noqa: C901, PLR0912
+        self,
+        schema: dict | bool,  # noqa: FBT001
+        var: str,
+        lines: list[str],
+        depth: int,
+    ) -> None:
+        indent = "    " * depth
+        if schema is True:
+            return
+        if schema is False:
+            lines.append(f"{indent}return False")
+            return
+        if not isinstance(schema, dict):
+            raise UnsupportedSchemaError
+
+        if _UNSUPPORTED_KEYWORDS.intersection(schema):
+            raise UnsupportedSchemaError
+
+        if "type" in schema:
+            self._emit_type(schema["type"], var, lines, indent)
+
+        if "enum" in schema:
+            self._emit_enum(schema["enum"], var, lines, indent)
+
+        if "const" in schema:
+            const = self._constant(schema["const"])
+            lines.append(f"{indent}if not _json_equal({var}, {const}):")
+            lines.append(f"{indent}    return False")
+
+        if "format" in schema and self.format_checker is not None:
+            fmt = schema["format"]
+            if fmt in self.format_checker.checkers:
+                checker = self._constant(self.format_checker)
+                lines.append(f"{indent}if not {checker}.conforms({var}, {fmt!r}):")
+                lines.append(f"{indent}    return False")
+
+        self._emit_string(schema, var, lines, indent)
+        self._emit_number(schema, var, lines, indent)
+        self._emit_array(schema, var, lines, depth)
+        self._emit_object(schema, var, lines, depth)
+
+        for subschema in schema.get("allOf", ()):
+            self._emit(subschema, var, lines, depth)
+
+        if "anyOf" in schema:
+            calls = [f"{self.compile(s)}({var})" for s in schema["anyOf"]]
+            lines.append(f"{indent}if not ({' or '.join(calls) or 'False'}):")
+            lines.append(f"{indent}    return False")
+
+        if "oneOf" in schema:
+            calls = [f"{self.compile(s)}({var})" for s in schema["oneOf"]]
+            lines.append(f"{indent}if [{', '.join(calls)}].count(True) != 1:")
+            lines.append(f"{indent}    return False")
+
+        if "not" in schema:
+            lines.append(f"{indent}if {self.compile(schema['not'])}({var}):")
+            lines.append(f"{indent}    return False")
+
+    @staticmethod
+    def _emit_type(
+        types: str | list[str],
+        var: str,
+        lines: list[str],
+        indent: str,
+    ) -> None:
+        if isinstance(types, str):
+            types = [types]
+        try:
+            expressions = [_TYPE_EXPRESSIONS[type_].format(var) for type_ in types]
+        except (KeyError, TypeError) as e:
+            raise UnsupportedSchemaError from e
+        lines.append(f"{indent}if not ({' or '.join(expressions) or 'False'}):")
+        lines.append(f"{indent}    return False")
+
+    def _emit_enum(
+        self,
+        enum: list[t.Any],
+        var: str,
+        lines: list[str],
+        indent: str,
+    ) -> None:
+        if all(isinstance(value, str) for value in enum):
+            values = self._constant(frozenset(enum))
+            lines.append(
+                f"{indent}if not (isinstance({var}, str) and {var} in {values}):"
+            )
+        else:
+            values = self._constant(tuple(enum))
+            lines.append(
+                f"{indent}if not any(_json_equal({var}, e) for e in {values}):",
+            )
+        lines.append(f"{indent}    return False")
+
+    def _emit_string(
+        self,
+        schema: dict,
+        var: str,
+        lines: list[str],
+        indent: str,
+    ) -> None:
+        checks = []
+        if "minLength" in schema:
+            checks.append(f"len({var}) < {schema['minLength']!r}")
+        if "maxLength" in schema:
+            checks.append(f"len({var}) > {schema['maxLength']!r}")
+        if "pattern" in schema:
+            pattern = self._constant(re.compile(schema["pattern"]))
+            checks.append(f"not {pattern}.search({var})")
+        if checks:
+            lines.append(
+                f"{indent}if isinstance({var}, str) and ({' or '.join(checks)}):",
+            )
+            lines.append(f"{indent}    return False")
+
+    def _emit_number(
+        self,
+        schema: dict,
+        var: str,
+        lines: list[str],
+        indent: str,
+    ) -> None:
+        checks = []
+        for keyword, operator in (
+            ("minimum", "<"),
+            ("maximum", ">"),
+            ("exclusiveMinimum", "<="),
+            ("exclusiveMaximum", ">="),
+        ):
+            if keyword in schema:
+                checks.append(f"{var} {operator} {self._constant(schema[keyword])}")
+        if checks:
+            lines.append(
+                f"{indent}if {_TYPE_EXPRESSIONS['number'].format(var)} and "
+                f"({' or '.join(checks)}):",
+            )
+            lines.append(f"{indent}    return False")
+
+    def _emit_array(
+        self,
+        schema: dict,
+        var: str,
+        lines: list[str],
+        depth: int,
+    ) -> None:
+        indent = "    " * depth
+        body: list[str] = []
+        if "minItems" in schema:
+            body.append(f"{indent}    if len({var}) < {schema['minItems']!r}:")
+            body.append(f"{indent}        return False")
+        if "maxItems" in schema:
+            body.append(f"{indent}    if len({var}) > {schema['maxItems']!r}:")
+            body.append(f"{indent}        return False")
+        if "items" in schema and schema["items"] is not True:
+            item = self._name("v")
+            item_lines: list[str] = []
+            self._emit(schema["items"], item, item_lines, depth + 2)
+            if item_lines:
+                body.append(f"{indent}    for {item} in {var}:")
+                body.extend(item_lines)
+        if body:
+            lines.append(f"{indent}if isinstance({var}, list):")
+            lines.extend(body)
+
+    def _emit_object(
+        self,
+        schema: dict,
+        var: str,
+        lines: list[str],
+        depth: int,
+    ) -> None:
+        indent = "    " * depth
+        body: list[str] = []
+        if "minProperties" in schema:
+            body.append(f"{indent}    if len({var}) < {schema['minProperties']!r}:")
+            body.append(f"{indent}        return False")
+        if "maxProperties" in schema:
+            body.append(f"{indent}    if len({var}) > {schema['maxProperties']!r}:")
+            body.append(f"{indent}        return False")
+        if required := schema.get("required"):
+            checks = " or ".join(f"{key!r} not in {var}" for key in required)
+            body.append(f"{indent}    if {checks}:")
+            body.append(f"{indent}        return False")
+
+        properties = schema.get("properties", {})
+        for key, subschema in properties.items():
+            value = self._name("v")
+            value_lines: list[str] = []
+            self._emit(subschema, value, value_lines, depth + 2)
+            if value_lines:
+                body.append(f"{indent}    {value} = {var}.get({key!r}, _MISSING)")
+                body.append(f"{indent}    if {value} is not _MISSING:")
+                body.extend(value_lines)
+
+        additional = schema.get("additionalProperties", True)
+        if additional is not True:
+            known = self._constant(frozenset(properties))
+            if additional is False:
+                body.append(f"{indent}    if not {known}.issuperset({var}):")
+                body.append(f"{indent}        return False")
+            else:
+                key, value = self._name("k"), self._name("v")
+                value_lines = []
+                self._emit(additional, value, value_lines, depth + 3)
+                if value_lines:
+                    body.append(f"{indent}    for {key}, {value} in {var}.items():")
+                    body.append(f"{indent}        if {key} not in {known}:")
+                    body.extend(value_lines)
+
+        if body:
+            lines.append(f"{indent}if isinstance({var}, dict):")
+            lines.extend(body)
+
+
+def compile_schema(
+    schema: dict,
+    format_checker: jsonschema.FormatChecker | None = None,
+) -> SchemaCheck | None:
+    """Compile a JSON schema into a Python function that checks instances.
+
+    The returned function only answers whether an instance is valid. Callers
+    should use a regular ``jsonschema`` validator to describe validation errors.
+
+    Args:
+        schema: The JSON schema to compile.
+        format_checker: Format checker to use for the ``format`` keyword. Formats
+            are not checked if this is ``None``.
+
+    Returns:
+        A validation function, or ``None`` if the schema uses keywords that
+        cannot be compiled, such as ``$ref``.
+    """
+    compiler = _SchemaCompiler(format_checker)
+    try:
+        name = compiler.compile(schema)
+    except UnsupportedSchemaError:
+        return None
+
+    source = "\n\n".join(compiler.functions)
+    exec(compile(source, f"<compiled schema {name}>", "exec"), compiler.namespace)  # noqa: S102
+    return compiler.namespace[name]  # type: ignore[no-any-return]
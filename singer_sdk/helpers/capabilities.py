@@ -277,6 +277,18 @@ TARGET_VALIDATE_RECORDS_CONFIG = PropertiesList(
         description="Whether to validate the schema of the incoming streams.",
         default=True,
     ),
+    Property(
+        "validation_backend",
+        StringType(),
+        title="Validation Backend",
+        description=(
+            "The library used to validate records. `jsonschema` interprets the "
+            "stream schema for every record. `compiled` generates and caches "
+            "Python code specialized for each stream schema, which is faster."
+        ),
+        allowed_values=["jsonschema", "compiled"],
+        default="jsonschema",
+    ),
 ).to_dict()
 TARGET_BATCH_SIZE_ROWS_CONFIG = PropertiesList(
     Property(
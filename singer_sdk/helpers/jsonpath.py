@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
-import logging
+import json
+import re
 import typing as t
 from functools import lru_cache
 
 from jsonpath_ng.ext import parse
 
+from singer_sdk.helpers._json_stream import JSONChunkReader, iter_array_items
+
 if t.TYPE_CHECKING:
     import jsonpath_ng
 
-
-logger = logging.getLogger(__name__)
+_SIMPLE_PATH = re.compile(
+    r"\$((?:\.[A-Za-z_][A-Za-z0-9_]*|\['[^'\\]*'\]|\[\"[^\"\\]*\"\])*)\[\*\]"
+)
+_SIMPLE_PATH_KEY = re.compile(
+    r"\.([A-Za-z_][A-Za-z0-9_]*)|\['([^']*)'\]|\[\"([^\"]*)\"\]"
+)
 
 
 def extract_jsonpath(
@@ -21,6 +28,9 @@ def extract_jsonpath(
 ) -> t.Generator[t.Any, None, None]:
     """Extract records from an input based on a JSONPath expression.
 
+    Simple expressions such as ``$[*]`` or ``$.data.items[*]`` are evaluated by
+    looking up the keys directly, without going through :mod:`jsonpath_ng`.
+
     Args:
         expression: JSONPath expression to match against the input.
         input: JSON object or array to extract records from.
@@ -28,15 +38,42 @@ def extract_jsonpath(
     Yields:
         Records matched with JSONPath expression.
     """
+    path = _get_simple_path(expression)
+    if path is not None:
+        yield from _extract_simple_path(path, input)
+        return
+
     compiled_jsonpath = _compile_jsonpath(expression)
 
     match: jsonpath_ng.DatumInContext
-    matches = compiled_jsonpath.find(input)
+    for match in compiled_jsonpath.find(input):
+        yield match.value
 
-    logger.info("JSONPath %s match count: %d", expression, len(matches))
 
-    for match in matches:
-        yield match.value
+def _extract_simple_path(
+    path: tuple[str, ...],
+    input: t.Any,  # noqa: A002, ANN401
+) -> t.Generator[t.Any, None, None]:
+    """Extract the items of an array nested in object keys.
+
+    Args:
+        path: Keys of the nested objects that lead to the array.
+        input: JSON object or array to extract records from.
+
+    Yields:
+        Each item of the array. A value that is not an array is yielded as-is, as
+        in ``$[*]`` JSONPath expressions.
+    """
+    value = input
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return
+        value = value[key]
+
+    if isinstance(value, list):
+        yield from value
+    elif value is not None:
+        yield value
 
 
 @lru_cache
@@ -50,3 +87,56 @@ def _compile_jsonpath(expression: str) -> jsonpath_ng.JSONPath:
         A compiled JSONPath object.
     """
     return parse(expression)
+
+
+def extract_jsonpath_from_chunks(
+    expression: str,
+    chunks: t.Iterable[bytes],
+    *,
+    parse_float: t.Callable[[str], t.Any] | None = None,
+) -> t.Generator[t.Any, None, None]:
+    """Extract records from a JSON document read in chunks.
+
+    Records matched by simple expressions such as ``$[*]`` or ``$.data.items[*]``
+    are decoded one at a time while the document is read, so the whole document is
+    never decoded at once. Other expressions are matched against the whole decoded
+    document with :func:`extract_jsonpath`.
+
+    .. versionadded:: 0.50.0
+
+    Args:
+        expression: JSONPath expression to match against the document.
+        chunks: The chunks of a UTF-8 encoded JSON document.
+        parse_float: Function to decode JSON floats with.
+
+    Yields:
+        Records matched with JSONPath expression.
+    """
+    path = _get_simple_path(expression)
+    if path is None:
+        document = json.loads(b"".join(chunks), parse_float=parse_float)
+        yield from extract_jsonpath(expression, input=document)
+        return
+
+    reader = JSONChunkReader(chunks, json.JSONDecoder(parse_float=parse_float))
+    yield from iter_array_items(reader, path)
+
+
+@lru_cache
+def _get_simple_path(expression: str) -> tuple[str, ...] | None:
+    """Get the object keys leading to the array matched by a simple expression.
+
+    Args:
+        expression: A JSONPath expression.
+
+    Returns:
+        The keys, or None if the expression is not a chain of object keys ending
+        with ``[*]``.
+    """
+    match = _SIMPLE_PATH.fullmatch(expression.strip())
+    if match is None:
+        return None
+    return tuple(
+        next(group for group in key.groups() if group is not None)
+        for key in _SIMPLE_PATH_KEY.finditer(match.group(1))
+    )
@@ -21,6 +21,7 @@ import simpleeval  # type: ignore[import-untyped]
 import singer_sdk.typing as th
 from singer_sdk.exceptions import MapExpressionError, StreamMapConfigError
 from singer_sdk.helpers._catalog import get_selected_schema
+from singer_sdk.helpers._expressions import compile_expression, get_record_key
 from singer_sdk.helpers._flattening import (
     flatten_record,
     flatten_schema,
@@ -167,6 +168,23 @@ class StreamMap(metaclass=abc.ABCMeta):
         """
         return self.flatten_record(record)
 
+    def transform_batch(self, records: t.Sequence[dict]) -> list[dict | None]:
+        """Transform a batch of records and return the results.
+
+        Override this method to transform many records in a single pass. The default
+        implementation calls :meth:`transform` for each record.
+
+        Args:
+            records: Record dictionaries in a stream.
+
+        Returns:
+            The transformed records, in order, with `None` in place of excluded
+            records.
+
+        .. versionadded:: 0.50.0
+        """
+        return [self.transform(record) for record in records]
+
     @abc.abstractmethod
     def get_filter_result(self, record: dict) -> bool:
         """Exclude records from a stream.
@@ -198,6 +216,20 @@ class RemoveRecordTransform(DefaultStreamMap):
         """
         _ = record  # Drop the record
 
+    def transform_batch(  # noqa: PLR6301
+        self,
+        records: t.Sequence[dict],
+    ) -> list[dict | None]:
+        """Return None for every record (always exclude).
+
+        Args:
+            records: Record dictionaries in a stream.
+
+        Returns:
+            A list of `None`, one for each record.
+        """
+        return [None] * len(records)
+
     def get_filter_result(self, record: dict) -> bool:  # noqa: ARG002, PLR6301
         """Exclude all records.
 
@@ -224,6 +256,19 @@ class SameRecordTransform(DefaultStreamMap):
         """
         return super().transform(record)
 
+    def transform_batch(self, records: t.Sequence[dict]) -> list[dict | None]:
+        """Return original records unchanged.
+
+        Args:
+            records: Record dictionaries in a stream.
+
+        Returns:
+            The original records unchanged.
+        """
+        if self.flattening_enabled:
+            return [self.flatten_record(record) for record in records]
+        return list(records)
+
     def get_filter_result(self, record: dict) -> bool:  # noqa: ARG002, PLR6301
         """Return True (always include).
 
@@ -273,16 +318,17 @@ class CustomStreamMap(StreamMap):
         self.map_config = map_config
         self.faker_config = faker_config
         self.stream_name = stream_name
+        self.expr_evaluator = simpleeval.EvalWithCompoundTypes(functions=self.functions)
+        self.fake = self._init_faker_instance()
 
         self._transform_fn: t.Callable[[dict], dict | None]
+        self._transform_batch_fn: t.Callable[[t.Sequence[dict]], list[dict | None]]
         self._filter_fn: t.Callable[[dict], bool]
         (
             self._filter_fn,
             self._transform_fn,
             self.transformed_schema,
         ) = self._init_functions_and_schema(stream_map=map_transform)
-        self.expr_evaluator = simpleeval.EvalWithCompoundTypes(functions=self.functions)
-        self.fake = self._init_faker_instance()
 
     def transform(self, record: dict) -> dict | None:
         """Return a transformed record.
@@ -296,6 +342,17 @@ class CustomStreamMap(StreamMap):
         transformed_record = self._transform_fn(record)
         return super().transform(transformed_record) if transformed_record else None
 
+    def transform_batch(self, records: t.Sequence[dict]) -> list[dict | None]:
+        """Return transformed records.
+
+        Args:
+            records: Record dictionaries in a stream.
+
+        Returns:
+            The transformed records, with `None` in place of excluded records.
+        """
+        return self._transform_batch_fn(records)
+
     def get_filter_result(self, record: dict) -> bool:
         """Return True to include or False to exclude.
 
@@ -372,6 +429,70 @@ class CustomStreamMap(StreamMap):
 
         return result
 
+    @property
+    def _expression_names(self) -> dict[str, t.Any]:
+        """Names with a fixed value in map expressions."""
+        names: dict[str, t.Any] = {
+            "config": self.map_config,
+            "__stream_name__": self.stream_alias,
+            "__original_stream_name__": self.stream_name,
+        }
+        if self.fake:
+            names["fake"] = self.fake
+        return names
+
+    def _compile(
+        self,
+        expr: str,
+        expr_parsed: ast.Expr,
+        property_name: str | None,
+    ) -> t.Callable[[dict], t.Any]:
+        """Compile an expression into a function of the record.
+
+        Expressions that cannot be compiled, such as those with comprehensions, are
+        evaluated with `simpleeval` instead.
+
+        Args:
+            expr: String expression to compile.
+            expr_parsed: Parsed expression abstract syntax tree.
+            property_name: Name of property to transform in the record.
+
+        Returns:
+            A function that evaluates the expression for a record.
+        """
+        compiled = compile_expression(
+            expr,
+            expr_parsed,
+            self.expr_evaluator,
+            names=self._expression_names,
+            self_property=property_name,
+        )
+
+        if compiled is None:
+            logger.debug("Expression %s will be evaluated with simpleeval", expr)
+
+            def _evaluate(record: dict) -> t.Any:  # noqa: ANN401
+                return self._eval(
+                    expr=expr,
+                    expr_parsed=expr_parsed,
+                    record=record,
+                    property_name=property_name,
+                )
+
+            return _evaluate
+
+        def _evaluate_compiled(record: dict) -> t.Any:  # noqa: ANN401
+            try:
+                result = compiled(record)
+            except simpleeval.InvalidExpression as ex:
+                msg = f"Failed to evaluate simpleeval expressions {expr}."
+                raise MapExpressionError(msg) from ex
+
+            logger.debug("Eval result: %s = %s", expr, result)
+            return result
+
+        return _evaluate_compiled
+
     def _eval_type(  # noqa: PLR0911
         self,
         expr: str,
@@ -495,7 +616,9 @@ class CustomStreamMap(StreamMap):
         if "properties" not in transformed_schema:
             transformed_schema["properties"] = {}
 
-        stream_map_parsed: list[tuple[str, str | None, ast.Expr | None]] = []
+        stream_map_parsed: list[
+            tuple[str, t.Callable[[dict], t.Any] | None, str | None]
+        ] = []
         for prop_key, prop_def in list(stream_map.items()):
             if prop_def in {None, NULL_STRING}:
                 if prop_key in (self.transformed_key_properties or []):
@@ -514,7 +637,7 @@ class CustomStreamMap(StreamMap):
                         for item in transformed_schema["required"]
                         if item != prop_key
                     ]
-                stream_map_parsed.append((prop_key, prop_def, None))
+                stream_map_parsed.append((prop_key, None, None))
             elif isinstance(prop_def, str):
                 default_type: th.JSONTypeHelper = th.StringType()  # Fallback to string
                 existing_schema: dict = (
@@ -535,10 +658,16 @@ class CustomStreamMap(StreamMap):
                 )
                 try:
                     parsed_def: ast.Expr = ast.parse(prop_def).body[0]  # type: ignore[assignment]
-                    stream_map_parsed.append((prop_key, prop_def, parsed_def))
                 except (SyntaxError, IndexError) as ex:
                     msg = f"Failed to parse expression {prop_def}."
                     raise MapExpressionError(msg) from ex
+                stream_map_parsed.append(
+                    (
+                        prop_key,
+                        self._compile(prop_def, parsed_def, prop_key),
+                        get_record_key(parsed_def, self._expression_names),
+                    )
+                )
 
             else:
                 msg = (
@@ -565,13 +694,10 @@ class CustomStreamMap(StreamMap):
             filter_rule: str,
             filter_rule_parsed: ast.Expr,
         ) -> t.Callable[[dict], bool]:
+            evaluate = self._compile(filter_rule, filter_rule_parsed, None)
+
             def _inner(record: dict) -> bool:
-                filter_result = self._eval(
-                    expr=filter_rule,
-                    expr_parsed=filter_rule_parsed,
-                    record=record,
-                    property_name=None,
-                )
+                filter_result = evaluate(record)
                 logger.debug(
                     "Filter result for '%s' in '{self.name}' stream: %s",
                     filter_rule,
@@ -600,45 +726,59 @@ class CustomStreamMap(StreamMap):
             )
             raise StreamMapConfigError(msg)
 
-        def transform_fn(record: dict) -> dict | None:
-            nonlocal include_by_default, stream_map
-
-            if not self.get_filter_result(record):
-                return None
-
+        # Precompute the output key plan, so records are built in a single pass
+        removed_keys = tuple(
+            prop_key for prop_key, evaluate, _ in stream_map_parsed if evaluate is None
+        )
+        assignments = [
+            (prop_key, evaluate, source_key)
+            for prop_key, evaluate, source_key in stream_map_parsed
+            if evaluate is not None
+        ]
+        key_properties = tuple(self.transformed_key_properties or ())
+
+        def build_record(record: dict) -> dict:
             if include_by_default:
+                # Copying and popping is much faster than a dict comprehension
                 result = record.copy()
+                for key in removed_keys:
+                    result.pop(key, None)
             else:
                 # Start with only the defined (or transformed) key properties
-                result = {}
-                for key_property in self.transformed_key_properties or []:
-                    if key_property in record:
-                        result[key_property] = record[key_property]
-
-            for prop_key, prop_def, prop_def_parsed in stream_map_parsed:
-                if prop_def in {None, NULL_STRING}:
-                    # Remove property from result
-                    result.pop(prop_key, None)
-                    continue
+                result = {key: record[key] for key in key_properties if key in record}
 
-                if isinstance(prop_def_parsed, ast.Expr):
-                    # Apply property transform
-                    result[prop_key] = self._eval(
-                        expr=prop_def,  # type: ignore[arg-type]
-                        expr_parsed=prop_def_parsed,
-                        record=record,
-                        property_name=prop_key,
-                    )
-                    continue
-
-                msg = (
-                    f"Unexpected mapping type '{type(prop_def).__name__}' "
-                    f"in map expression '{prop_def}'. Expected 'str' or 'None'."
-                )
-                raise StreamMapConfigError(msg)
+            for prop_key, evaluate, source_key in assignments:
+                # Apply property transform, copying plain property references
+                if source_key is not None and source_key in record:
+                    result[prop_key] = record[source_key]
+                else:
+                    result[prop_key] = evaluate(record)
 
             return result
 
+        def transform_fn(record: dict) -> dict | None:
+            if not self.get_filter_result(record):
+                return None
+            return build_record(record)
+
+        def transform_batch_fn(records: t.Sequence[dict]) -> list[dict | None]:
+            get_filter_result = self.get_filter_result
+            flatten = self.flatten_record if self.flattening_enabled else None
+            results: list[dict | None] = []
+            for record in records:
+                if not get_filter_result(record):
+                    results.append(None)
+                    continue
+                result = build_record(record)
+                if not result:
+                    results.append(None)
+                elif flatten is not None:
+                    results.append(flatten(result))
+                else:
+                    results.append(result)
+            return results
+
+        self._transform_batch_fn = transform_batch_fn
         return filter_fn, transform_fn, transformed_schema
 
     def _init_faker_instance(self) -> Faker | None:
@@ -53,6 +53,10 @@ class InlineMapper(BaseSingerReader, BaseSingerWriter, metaclass=abc.ABCMeta):
         for message in messages:
             self.write_message(message)
 
+    def process_endofpipe(self) -> None:
+        """Write any buffered messages after all input lines have been read."""
+        self.message_writer.flush()
+
     def _process_schema_message(self, message_dict: dict) -> None:
         self._write_messages(self.map_schema_message(message_dict))
 
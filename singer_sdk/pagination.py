@@ -149,6 +149,24 @@ class BaseAPIPaginator(t.Generic[TPageToken], metaclass=ABCMeta):
         """
         return True
 
+    def predict_next(self, value: TPageToken) -> TPageToken | None:  # noqa: ARG002, PLR6301
+        """Predict the token of the page after a given page, before its response.
+
+        Streams that keep several requests in flight use this to request pages ahead
+        of time. Predictions are checked against :meth:`get_next` once the response
+        arrives, and pages requested for a wrong prediction are discarded.
+
+        .. versionadded:: 0.50.0
+
+        Args:
+            value: The token of a page.
+
+        Returns:
+            The token of the following page, or ``None`` if it depends on the
+            response.
+        """
+        return None
+
     @abstractmethod
     def get_next(self, response: requests.Response) -> TPageToken | None:
         """Get the next pagination token or index from the API response.
@@ -370,6 +388,20 @@ class BasePageNumberPaginator(BaseAPIPaginator[int], metaclass=ABCMeta):
         """
         return self._value + 1
 
+    @override
+    def predict_next(self, value: int) -> int:
+        """Predict the number of the page after a given page.
+
+        .. versionadded:: 0.50.0
+
+        Args:
+            value: A page number.
+
+        Returns:
+            The next page number.
+        """
+        return value + 1
+
 
 class BaseOffsetPaginator(BaseAPIPaginator[int], metaclass=ABCMeta):
     """Paginator class for APIs that use page offset."""
@@ -404,6 +436,20 @@ class BaseOffsetPaginator(BaseAPIPaginator[int], metaclass=ABCMeta):
         """
         return self._value + self._page_size
 
+    @override
+    def predict_next(self, value: int) -> int:
+        """Predict the offset of the page after a given page.
+
+        .. versionadded:: 0.50.0
+
+        Args:
+            value: A page offset.
+
+        Returns:
+            The next page offset.
+        """
+        return value + self._page_size
+
 
 class LegacyPaginatedStreamProtocol(t.Protocol[TPageToken]):
     """Protocol for legacy paginated streams classes."""
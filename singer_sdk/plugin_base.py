@@ -784,6 +784,15 @@ class BaseSingerReader(BaseSingerIO, metaclass=abc.ABCMeta):
     message_reader_class: type[GenericSingerReader] = SingerReader
     """The message writer class to use for writing messages."""
 
+    record_batch_size: int | None = None
+    """Max number of consecutive RECORD messages of a stream to process as a block.
+
+    If set, consecutive RECORD messages for the same stream are dispatched together
+    to :meth:`~singer_sdk.plugin_base.BaseSingerReader._process_record_messages`
+    instead of one at a time. Defaults to ``None``, meaning that every RECORD message
+    is processed individually.
+    """
+
     def __init__(
         self,
         *,
@@ -853,8 +862,23 @@ class BaseSingerReader(BaseSingerIO, metaclass=abc.ABCMeta):
                 SingerMessageType.ACTIVATE_VERSION: self._process_activate_version_message,  # noqa: E501
                 SingerMessageType.BATCH: self._process_batch_message,
             },
+            **self._get_record_batch_kwargs(),
         )
 
+    def _get_record_batch_kwargs(self) -> dict[str, t.Any]:
+        """Get the record batching arguments for the message reader.
+
+        Returns:
+            Keyword arguments for the reader's ``process_lines`` method.
+        """
+        if not self.record_batch_size:
+            return {}
+
+        return {
+            "record_batch_callback": self._process_record_messages,
+            "record_batch_size": self.record_batch_size,
+        }
+
     def process_endofpipe(self) -> None:
         """Process end of pipe."""
 
@@ -873,6 +897,17 @@ class BaseSingerReader(BaseSingerIO, metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def _process_record_message(self, message_dict: dict) -> None: ...
 
+    def _process_record_messages(self, message_dicts: list[dict]) -> None:
+        """Process a block of consecutive RECORD messages for the same stream.
+
+        The default implementation processes each message individually.
+
+        Args:
+            message_dicts: The RECORD messages, in the order they were received.
+        """
+        for message_dict in message_dicts:
+            self._process_record_message(message_dict)
+
     @abc.abstractmethod
     def _process_state_message(self, message_dict: dict) -> None: ...
 
@@ -920,3 +955,21 @@ class BaseSingerWriter(BaseSingerIO):
     def write_message(self, message: t.Any) -> None:  # noqa: ANN401
         """Write a message to the tap's message writer."""
         self.message_writer.write_message(message)
+
+    def _handle_termination(  # pragma: no cover
+        self,
+        signum: int,
+        frame: FrameType | None,
+    ) -> None:
+        """Handle termination signal.
+
+        Writes any buffered messages before exiting.
+
+        Args:
+            signum: Signal number.
+            frame: Frame.
+        """
+        try:
+            self.message_writer.flush()
+        finally:
+            super()._handle_termination(signum, frame)
@@ -0,0 +1,225 @@
+"""Client-side rate limiting for HTTP streams."""
+
+from __future__ import annotations
+
+import datetime
+import threading
+import time
+import typing as t
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+
+if t.TYPE_CHECKING:
+    import requests
+
+__all__ = ["RateLimiter"]
+
+# Reset values larger than this are epoch timestamps rather than a number of seconds
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """Parse a ``Retry-After`` header value.
+
+    Args:
+        value: Number of seconds, or an HTTP date.
+
+    Returns:
+        Number of seconds to wait, or None if the value is invalid.
+    """
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    now = datetime.datetime.now(tz=retry_at.tzinfo or datetime.timezone.utc)
+    return max((retry_at - now).total_seconds(), 0)
+
+
+def _parse_rate_limit_reset(value: str) -> float | None:
+    """Parse a ``X-RateLimit-Reset`` or ``RateLimit-Reset`` header value.
+
+    Args:
+        value: Number of seconds, or an epoch timestamp.
+
+    Returns:
+        Number of seconds until the rate limit resets, or None if the value is
+        invalid.
+    """
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+
+    if reset > _EPOCH_THRESHOLD:
+        reset -= time.time()
+    return max(reset, 0)
+
+
+def _get_header(response: requests.Response, name: str) -> str | None:
+    return response.headers.get(f"X-{name}") or response.headers.get(name)
+
+
+class RateLimiter:
+    """Limit the rate and concurrency of HTTP requests.
+
+    Requests are limited to ``requests_per_second`` with a token bucket holding up to
+    ``burst`` requests. The number of requests in flight is limited with additive
+    increase, multiplicative decrease (AIMD): the limit starts at ``max_concurrency``,
+    is halved when the API throttles a request, and grows back by about one request
+    per round of successful requests. The limit is halved at most once per round of
+    requests: requests that were already in flight when it was halved were sent
+    before the cut, so their throttled responses don't halve it again.
+
+    The API throttles a request when it responds with a ``429 Too Many Requests``
+    status code or a ``Retry-After`` header. Requests are then paused for the
+    duration given by ``Retry-After``. Requests are also paused until the rate limit
+    resets when ``X-RateLimit-Remaining`` or ``RateLimit-Remaining`` drops to zero.
+
+    A rate limiter can be shared by streams, for example to apply a limit to a whole
+    tap or to every stream using the same authenticator.
+
+    .. versionadded:: 0.50.0
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_second: float | None = None,
+        burst: int = 1,
+        max_concurrency: int | None = None,
+        min_concurrency: int = 1,
+    ) -> None:
+        """Create a new rate limiter.
+
+        Args:
+            requests_per_second: Maximum average number of requests per second, or
+                None to not limit the request rate.
+            burst: Maximum number of requests sent at once when the limiter was idle.
+            max_concurrency: Maximum number of requests in flight, or None to only
+                limit concurrency after the API throttles a request.
+            min_concurrency: Minimum number of requests in flight the limit can
+                decrease to.
+        """
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+
+        self._condition = threading.Condition()
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._in_flight = 0
+        self._concurrency_limit: float | None = max_concurrency
+        # Requests to complete before the concurrency limit can be halved again
+        self._uncounted_requests = 0
+
+    @property
+    def concurrency_limit(self) -> int | None:
+        """The current limit of requests in flight, or None if there is no limit."""
+        if self._concurrency_limit is None:
+            return None
+        return int(self._concurrency_limit)
+
+    def _refill(self, now: float) -> None:
+        if self.requests_per_second is not None:
+            elapsed = now - self._last_refill
+            self._tokens = min(
+                self._tokens + elapsed * self.requests_per_second,
+                self.burst,
+            )
+        self._last_refill = now
+
+    def _get_wait_time(self, now: float) -> float | None:
+        """Get the time to wait before a request can be sent.
+
+        Args:
+            now: The current monotonic time.
+
+        Returns:
+            Number of seconds to wait, 0 if a request can be sent now, or None to wait
+            for a request in flight to complete.
+        """
+        limit = self.concurrency_limit
+        if limit is not None and self._in_flight >= limit:
+            return None
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self.requests_per_second is not None and self._tokens < 1:
+            return (1 - self._tokens) / self.requests_per_second
+        return 0
+
+    def acquire(self) -> None:
+        """Wait until a request can be sent.
+
+        Every call must be followed by a call to :meth:`release` once the request
+        completes.
+        """
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait_time = self._get_wait_time(now)
+                if wait_time == 0:
+                    break
+                self._condition.wait(wait_time)
+
+            if self.requests_per_second is not None:
+                self._tokens -= 1
+            self._in_flight += 1
+
+    def release(self, response: requests.Response | None) -> None:
+        """Record the completion of a request.
+
+        Args:
+            response: The response, or None if the request failed without one.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if response is not None:
+                self._update(response)
+            self._condition.notify_all()
+
+    def _update(self, response: requests.Response) -> None:
+        """Adapt the limits to the response.
+
+        Args:
+            response: An API response.
+        """
+        delay: float | None = None
+        retry_after = response.headers.get("Retry-After")
+        throttled = (
+            response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+            or retry_after is not None
+        )
+        if retry_after is not None:
+            delay = _parse_retry_after(retry_after)
+        elif _get_header(response, "RateLimit-Remaining") == "0" and (
+            reset := _get_header(response, "RateLimit-Reset")
+        ):
+            delay = _parse_rate_limit_reset(reset)
+
+        if delay:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+        if self._uncounted_requests:
+            # Sent before the last cut, so a throttled response is already counted
+            self._uncounted_requests -= 1
+            if throttled:
+                return
+
+        if throttled:
+            limit = self._concurrency_limit or max(self._in_flight + 1, 1)
+            self._concurrency_limit = max(limit / 2, self.min_concurrency)
+            self._uncounted_requests = self._in_flight
+        elif self._concurrency_limit is not None:
+            limit = self._concurrency_limit + 1 / self._concurrency_limit
+            if self.max_concurrency is not None:
+                limit = min(limit, self.max_concurrency)
+            self._concurrency_limit = limit
@@ -6,6 +6,7 @@ import abc
 import enum
 import logging
 import sys
+import time
 import typing as t
 from collections import Counter, defaultdict
 
@@ -24,6 +25,8 @@ logger = logging.getLogger(__name__)
 T = t.TypeVar("T", str, bytes)
 M = t.TypeVar("M")
 
+DEFAULT_RECORD_BATCH_SIZE = 1000
+
 
 class SingerMessageType(str, enum.Enum):
     """Singer specification message types."""
@@ -47,18 +50,32 @@ class GenericSingerReader(t.Generic[T], metaclass=abc.ABCMeta):
         self,
         file_input: t.IO[T] | None,
         callbacks: dict[str, t.Callable[[dict], None]],
+        *,
+        record_batch_callback: t.Callable[[list[dict]], None] | None = None,
+        record_batch_size: int = DEFAULT_RECORD_BATCH_SIZE,
     ) -> t.Counter[str]:
         """Internal method to process jsonl lines from a Singer tap.
 
+        If ``record_batch_callback`` is provided, consecutive RECORD messages for the
+        same stream are grouped into blocks of at most ``record_batch_size`` messages
+        and dispatched to it instead of the RECORD callback. Any other message, or a
+        RECORD message for a different stream, flushes the pending block first so the
+        relative order of messages is preserved.
+
         Args:
             file_input: Readable stream of messages, each on a separate line.
             callbacks: Dictionary of message type to callback function.
+            record_batch_callback: Optional callback for blocks of RECORD messages.
+            record_batch_size: Maximum number of RECORD messages in a block.
 
         Returns:
             A counter object for the processed lines.
         """
         stats: dict[str, int] = defaultdict(int)
         filein = file_input or self.default_input
+        record_block: list[dict] = []
+        block_stream: str | None = None
+
         for line in filein:
             self._current_message = line
 
@@ -66,12 +83,32 @@ class GenericSingerReader(t.Generic[T], metaclass=abc.ABCMeta):
             self.assert_line_requires(line_dict, requires={"type"})
 
             record_type: SingerMessageType = line_dict["type"]
+            stats[record_type] += 1
+
+            if record_batch_callback is not None:
+                if record_type == SingerMessageType.RECORD:
+                    stream_name = line_dict.get("stream")
+                    if record_block and stream_name != block_stream:
+                        record_batch_callback(record_block)
+                        record_block = []
+                    block_stream = stream_name
+                    record_block.append(line_dict)
+                    if len(record_block) >= record_batch_size:
+                        record_batch_callback(record_block)
+                        record_block = []
+                    continue
+
+                if record_block:
+                    record_batch_callback(record_block)
+                    record_block = []
+
             if callback := callbacks.get(record_type):
                 callback(line_dict)
             else:
                 self._process_unknown_message(line_dict)
 
-            stats[record_type] += 1
+        if record_block and record_batch_callback is not None:
+            record_batch_callback(record_block)
 
         return Counter(**stats)
 
@@ -117,6 +154,32 @@ class GenericSingerReader(t.Generic[T], metaclass=abc.ABCMeta):
 class GenericSingerWriter(t.Generic[T, M], metaclass=abc.ABCMeta):
     """Interface for all plugins writing Singer messages as strings or bytes."""
 
+    buffer_size: int = 0
+    """Approximate number of bytes of serialized messages to buffer.
+
+    If set, RECORD messages are held in memory and written to stdout in large blocks,
+    once the buffer reaches this size or ``flush_interval`` seconds have passed.
+    Any other message is written immediately, together with the buffered records.
+    Defaults to ``0``, meaning that every message is written and flushed as soon as
+    it is received.
+
+    .. versionadded:: 0.50.0
+    """
+
+    flush_interval: float = 1.0
+    """Maximum number of seconds to buffer messages for, if ``buffer_size`` is set.
+
+    .. versionadded:: 0.50.0
+    """
+
+    bytes_written: int = 0
+    """Approximate number of bytes of messages written by this writer.
+
+    .. versionadded:: 0.50.0
+    """
+
+    _last_flush: float = 0.0
+
     def format_message(self, message: M) -> T:
         """Format a message as a JSON string.
 
@@ -135,3 +198,25 @@ class GenericSingerWriter(t.Generic[T, M], metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def write_message(self, message: M) -> None:
         """Write a message to stdout."""
+
+    def flush(self) -> None:
+        """Write any buffered messages to stdout.
+
+        .. versionadded:: 0.50.0
+        """
+
+    def _should_flush(self, message: M, buffered_size: int) -> bool:
+        """Check whether buffered messages should be written after a message.
+
+        Args:
+            message: The message that was just buffered.
+            buffered_size: The size of the buffer.
+
+        Returns:
+            True if the buffer should be flushed.
+        """
+        if buffered_size >= self.buffer_size:
+            return True
+        if getattr(message, "type", None) != SingerMessageType.RECORD:
+            return True
+        return time.monotonic() - self._last_flush >= self.flush_interval
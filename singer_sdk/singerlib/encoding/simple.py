@@ -6,6 +6,7 @@ import json
 import json.decoder
 import logging
 import sys
+import time
 import typing as t
 from collections.abc import Mapping  # noqa: TC003
 from dataclasses import asdict, dataclass, field
@@ -226,6 +227,12 @@ class SimpleSingerReader(GenericSingerReader[str]):
 class SimpleSingerWriter(GenericSingerWriter[str, Message]):
     """Interface for all plugins writing Singer messages to stdout."""
 
+    def __init__(self) -> None:
+        """Initialize the writer."""
+        self._buffer: list[str] = []
+        self._buffered_size = 0
+        self._last_flush = time.monotonic()
+
     def serialize_message(self, message: Message) -> str:  # noqa: PLR6301
         """Serialize a dictionary into a line of json.
 
@@ -243,5 +250,26 @@ class SimpleSingerWriter(GenericSingerWriter[str, Message]):
         Args:
             message: The message to write.
         """
-        sys.stdout.write(self.format_message(message) + "\n")
+        line = self.format_message(message) + "\n"
+        self.bytes_written += len(line)
+        if not self.buffer_size:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+            return
+
+        self._buffer.append(line)
+        self._buffered_size += len(line)
+        if self._should_flush(message, self._buffered_size):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any buffered messages to stdout.
+
+        .. versionadded:: 0.50.0
+        """
+        if self.buffer_size and self._buffer:
+            sys.stdout.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffered_size = 0
         sys.stdout.flush()
+        self._last_flush = time.monotonic()
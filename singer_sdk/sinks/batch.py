@@ -12,6 +12,9 @@ from singer_sdk.sinks.core import Sink
 class BatchSink(Sink):
     """Base class for batched record writers."""
 
+    # The batch context is shared by all records until the sink is drained
+    _context_depends_on_record = False
+
     def _get_context(self, record: dict) -> dict:  # noqa: ARG002
         """Return a batch context. If no batch is active, return a new batch context.
 
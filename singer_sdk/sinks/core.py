@@ -9,11 +9,15 @@ import importlib.util
 import sys
 import time
 import typing as t
+from collections import OrderedDict
+from contextlib import nullcontext
 from functools import cached_property
 from gzip import open as gzip_open
+from itertools import islice
 from types import MappingProxyType
 
 import jsonschema
+from joblib import Parallel, delayed
 
 from singer_sdk import metrics
 from singer_sdk.exceptions import (
@@ -32,6 +36,7 @@ from singer_sdk.helpers._typing import (
     get_datelike_property_type,
     handle_invalid_timestamp_in_record,
 )
+from singer_sdk.helpers._validation import compile_schema, schema_hash
 from singer_sdk.singerlib.json import deserialize_json
 from singer_sdk.typing import DEFAULT_JSONSCHEMA_VALIDATOR
 
@@ -45,9 +50,43 @@ if t.TYPE_CHECKING:
     from logging import Logger
 
     from singer_sdk.helpers._batch import BaseBatchFileEncoding
+    from singer_sdk.helpers._validation import SchemaCheck
     from singer_sdk.target_base import Target
 
 
+_DATELIKE_PARSERS: dict[str, t.Callable[[str], t.Any]] = {
+    "date": date_fromisoformat,
+    "date-time": datetime_fromisoformat,
+    "time": time_fromisoformat,
+}
+
+
+_SDC_METADATA_PROPERTIES = frozenset(
+    (
+        "_sdc_extracted_at",
+        "_sdc_received_at",
+        "_sdc_batched_at",
+        "_sdc_deleted_at",
+        "_sdc_sequence",
+        "_sdc_table_version",
+        "_sdc_sync_started_at",
+    ),
+)
+
+
+class _TimestampParsingPlan(t.NamedTuple):
+    """Date-like fields of a schema and how to parse them."""
+
+    fields: tuple[tuple[str, t.Callable[[str], t.Any], str], ...]
+    """Field name, parser and date-like type of every date-like field."""
+
+    known_fields: set[str]
+    """Fields that don't need a missing-from-schema warning."""
+
+    additional_properties: bool
+    """Whether the schema allows additional properties."""
+
+
 class BaseJSONSchemaValidator(abc.ABC):
     """Abstract base class for JSONSchema validator."""
 
@@ -125,6 +164,199 @@ class JSONSchemaValidator(BaseJSONSchemaValidator):
             raise InvalidRecord(e.message, record) from e
 
 
+class CompiledJSONSchemaValidator(BaseJSONSchemaValidator):
+    """Validate records using Python code generated for the stream schema.
+
+    The schema is translated once into a specialized Python function that only
+    checks whether a record is valid. Invalid records are passed on to a
+    :class:`JSONSchemaValidator` so error messages are the same for both backends.
+    Schemas that use keywords without a compiled equivalent, such as ``$ref``, are
+    validated with :class:`JSONSchemaValidator` alone.
+
+    Compiled validators are cached by schema hash, so sinks that are re-created
+    for a repeated schema don't pay the compilation cost again. Only the
+    ``cache_size`` most recently used validators are kept.
+    """
+
+    cache_size: t.ClassVar[int] = 64
+    """Maximum number of compiled validators to keep in the cache."""
+
+    _cache: t.ClassVar[
+        OrderedDict[tuple[str, bool], tuple[SchemaCheck | None, JSONSchemaValidator]]
+    ] = OrderedDict()
+
+    def __init__(
+        self,
+        schema: dict,
+        *,
+        validate_formats: bool = False,
+        format_checker: jsonschema.FormatChecker | None = None,
+    ):
+        """Initialize the validator.
+
+        Args:
+            schema: Schema of the stream to sink.
+            validate_formats: Whether JSON string formats (e.g. ``date-time``) should
+                be validated.
+            format_checker: User-defined format checker. Validators that use a
+                custom format checker are not cached.
+        """
+        super().__init__(schema)
+
+        key = (schema_hash(schema), validate_formats)
+        if format_checker is None and key in self._cache:
+            self._check, self._fallback = self._cache[key]
+            self._cache.move_to_end(key)
+            return
+
+        self._fallback = JSONSchemaValidator(
+            schema,
+            validate_formats=validate_formats,
+            format_checker=format_checker,
+        )
+        self._check = compile_schema(
+            schema,
+            format_checker=self._fallback.validator.format_checker,
+        )
+        if format_checker is None:
+            self._cache[key] = (self._check, self._fallback)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    @override
+    def validate(self, record: dict):  # noqa: ANN201
+        """Validate a record message.
+
+        Args:
+            record: Record message to validate.
+        """
+        if self._check is not None:
+            try:
+                if self._check(record):
+                    return
+            except Exception:  # noqa: BLE001, S110
+                # Let the jsonschema validator decide
+                pass
+
+        self._fallback.validate(record)
+
+
+def _read_jsonl_batch_file(
+    file: t.IO,
+    compression: str | None,
+    chunk_size: int | None,
+) -> t.Generator[dict, None, None]:
+    """Read batch contexts from a JSONL file.
+
+    Args:
+        file: The batch file.
+        compression: The compression of the batch file.
+        chunk_size: The maximum number of records in each context, or None to read
+            the whole file into a single context.
+
+    Yields:
+        Batch contexts with a list of records.
+    """
+    lines: GzipFile | t.IO
+    with gzip_open(file) if compression == "gzip" else nullcontext(file) as lines:
+        if chunk_size is None:
+            yield {"records": [deserialize_json(line) for line in lines]}
+            return
+
+        while records := [deserialize_json(line) for line in islice(lines, chunk_size)]:
+            yield {"records": records}
+
+
+def _read_parquet_batch_file(
+    file: t.IO,
+    chunk_size: int | None,
+    *,
+    as_arrow: bool,
+) -> t.Generator[dict, None, None]:
+    """Read batch contexts from a Parquet file.
+
+    Args:
+        file: The batch file.
+        chunk_size: The maximum number of records in each context, or None to read
+            the whole file into a single context.
+        as_arrow: Yield ``pyarrow.Table`` objects instead of lists of records.
+
+    Yields:
+        Batch contexts with a list of records or a ``pyarrow.Table``.
+    """
+    import pyarrow as pa  # noqa: PLC0415
+    import pyarrow.parquet as pq  # noqa: PLC0415
+
+    tables: t.Iterable[pa.Table]
+    if chunk_size is None:
+        tables = [pq.read_table(file)]
+    else:
+        tables = (
+            pa.Table.from_batches([batch])
+            for batch in pq.ParquetFile(file).iter_batches(batch_size=chunk_size)
+        )
+
+    for table in tables:
+        if as_arrow:
+            yield {"arrow_table": table}
+        else:
+            yield {"records": table.to_pylist()}
+
+
+def _read_batch_file(
+    storage: StorageTarget,
+    filename: str,
+    encoding: BaseBatchFileEncoding,
+    chunk_size: int | None,
+    *,
+    as_arrow: bool,
+) -> t.Generator[dict, None, None]:
+    """Read batch contexts from a batch file.
+
+    Args:
+        storage: The storage target of the batch file.
+        filename: The name of the batch file in the storage target.
+        encoding: The batch file encoding.
+        chunk_size: The maximum number of records in each context, or None to read
+            the whole file into a single context.
+        as_arrow: Yield ``pyarrow.Table`` objects for Parquet files.
+
+    Yields:
+        Batch contexts.
+    """
+    with storage.open(filename, mode="rb") as file:
+        if encoding.format == BatchFileFormat.JSONL:
+            yield from _read_jsonl_batch_file(file, encoding.compression, chunk_size)
+        else:
+            yield from _read_parquet_batch_file(file, chunk_size, as_arrow=as_arrow)
+
+
+def _load_batch_file(
+    storage: StorageTarget,
+    filename: str,
+    encoding: BaseBatchFileEncoding,
+    chunk_size: int | None,
+    *,
+    as_arrow: bool,
+) -> list[dict]:
+    """Read all batch contexts from a batch file, in a worker.
+
+    Args:
+        storage: The storage target of the batch file.
+        filename: The name of the batch file in the storage target.
+        encoding: The batch file encoding.
+        chunk_size: The maximum number of records in each context, or None to read
+            the whole file into a single context.
+        as_arrow: Return ``pyarrow.Table`` objects for Parquet files.
+
+    Returns:
+        The batch contexts.
+    """
+    return list(
+        _read_batch_file(storage, filename, encoding, chunk_size, as_arrow=as_arrow)
+    )
+
+
 class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
     """Abstract base class for target sinks."""
 
@@ -140,6 +372,52 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
     fail_on_record_validation_exception: bool = True
     """Interrupt the target execution when a record fails schema validation."""
 
+    process_batch_files_in_chunks: bool = False
+    """Read BATCH files in chunks of at most `max_size` records.
+
+    Memory use then no longer depends on the size of the batch files, but
+    `process_batch` is called once per chunk instead of once per file.
+    """
+
+    accepts_arrow_batches: bool = False
+    """Receive Parquet BATCH files as a `pyarrow.Table` in `context["arrow_table"]`.
+
+    By default, the table is converted to a list of records in `context["records"]`.
+    """
+
+    max_parallel_batch_files: int = 1
+    """Number of BATCH files to read in parallel.
+
+    Files are read ahead while the current one is processed, and are always passed
+    to `process_batch` in manifest order. Each file that is read ahead is held in
+    memory in full.
+    """
+
+    batch_file_parallel_backend: str = "threading"
+    """The joblib backend used to read BATCH files in parallel.
+
+    Use `loky` to parse files in worker processes instead of threads.
+    """
+
+    _context_depends_on_record: t.ClassVar[bool] = False
+    """Whether `_get_context` may return different contexts for records of a batch.
+
+    This is set automatically for sinks that override `_get_context`, so that
+    targets dispatching records in blocks look the context up for each record.
+    """
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        """Flag sinks whose context may depend on the record.
+
+        Args:
+            kwargs: Keyword arguments passed to the parent class.
+        """
+        super().__init_subclass__(**kwargs)
+        if "_get_context" in vars(cls) and "_context_depends_on_record" not in vars(
+            cls
+        ):
+            cls._context_depends_on_record = True
+
     def __init__(
         self,
         target: Target,
@@ -191,6 +469,7 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
 
         # Track fields we've already warned about missing from schema
         self._warned_missing_fields: set[str] = set()
+        self._timestamp_parsing_plan: tuple[dict, _TimestampParsingPlan] | None = None
 
         self._validator: BaseJSONSchemaValidator | None = self.get_validator()
         self._record_counter: metrics.Counter = metrics.record_counter(self.stream_name)
@@ -261,9 +540,18 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
                        raise InvalidRecord(error_message, record) from e
 
         .. _fastjsonschema: https://pypi.org/project/fastjsonschema/
+
+        .. versionchanged:: 0.50.0
+           The ``validation_backend`` target setting selects between
+           :class:`JSONSchemaValidator` and :class:`CompiledJSONSchemaValidator`.
         """
         if self.validate_schema:
-            return JSONSchemaValidator(
+            validator_class: type[JSONSchemaValidator | CompiledJSONSchemaValidator]
+            if self.config.get("validation_backend") == "compiled":
+                validator_class = CompiledJSONSchemaValidator
+            else:
+                validator_class = JSONSchemaValidator
+            return validator_class(
                 self.schema,
                 validate_formats=self.validate_field_string_format,
             )
@@ -459,6 +747,39 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
         record["_sdc_table_version"] = message.get("version")
         record["_sdc_sync_started_at"] = self.sync_started_at
 
+    def _add_sdc_metadata_to_records(
+        self,
+        records: list[dict],
+        messages: list[dict],
+        context: dict,
+    ) -> None:
+        """Populate metadata _sdc columns for a block of records.
+
+        The receive and batch timestamps are computed once for the whole block.
+
+        Args:
+            records: Records in the stream.
+            messages: The record message of each record.
+            context: Stream partition or context dictionary.
+        """
+        cls = type(self)
+        if cls._add_sdc_metadata_to_record is not Sink._add_sdc_metadata_to_record:
+            for record, message in zip(records, messages, strict=True):
+                self._add_sdc_metadata_to_record(record, message, context)
+            return
+
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        received_at = now.isoformat()
+        batched_at = (context.get("batch_start_time") or now).isoformat()
+        for record, message in zip(records, messages, strict=True):
+            record["_sdc_extracted_at"] = message.get("time_extracted")
+            record["_sdc_received_at"] = received_at
+            record["_sdc_batched_at"] = batched_at
+            record["_sdc_deleted_at"] = record.get("_sdc_deleted_at")
+            record["_sdc_sequence"] = round(time.time() * 1000)
+            record["_sdc_table_version"] = message.get("version")
+            record["_sdc_sync_started_at"] = self.sync_started_at
+
     def _add_sdc_metadata_to_schema(self) -> None:
         """Add _sdc metadata columns.
 
@@ -514,6 +835,24 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
         record.pop("_sdc_table_version", None)
         record.pop("_sdc_sync_started_at", None)
 
+    def _remove_sdc_metadata_from_records(self, records: list[dict]) -> None:
+        """Remove metadata _sdc columns from a block of records.
+
+        Records without any metadata columns are left untouched, unless the sink
+        overrides :meth:`_remove_sdc_metadata_from_record`.
+
+        Args:
+            records: Records in the stream.
+        """
+        cls = type(self)
+        overridden = (
+            cls._remove_sdc_metadata_from_record
+            is not Sink._remove_sdc_metadata_from_record
+        )
+        for record in records:
+            if overridden or not _SDC_METADATA_PROPERTIES.isdisjoint(record):
+                self._remove_sdc_metadata_from_record(record)
+
     # Record validation
 
     def _validate_and_parse(self, record: dict) -> dict:
@@ -545,6 +884,46 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
         )
         return record
 
+    def _validate_and_parse_records(self, records: list[dict]) -> list[dict]:
+        """Validate or repair a block of records, parsing to python-native types.
+
+        The timestamp parsing plan is looked up once for the whole block. Sinks that
+        override :meth:`_validate_and_parse` or :meth:`_parse_timestamps_in_record`
+        get their override called for each record instead.
+
+        Args:
+            records: Records in the stream.
+
+        Returns:
+            The validated and parsed records.
+
+        Raises:
+            InvalidRecord: If a record is invalid.
+        """
+        cls = type(self)
+        if (
+            cls._validate_and_parse is not Sink._validate_and_parse
+            or cls._parse_timestamps_in_record is not Sink._parse_timestamps_in_record
+        ):
+            return [self._validate_and_parse(record) for record in records]
+
+        if self._validator is not None:
+            validate = self._validator.validate
+            for record in records:
+                try:
+                    validate(record)
+                except InvalidRecord:  # noqa: PERF203
+                    self.logger.exception("Record validation failed")
+                    if self.fail_on_record_validation_exception:
+                        raise
+
+        self._parse_timestamps_in_records(
+            records=records,
+            schema=self.schema,
+            treatment=self.datetime_error_treatment,
+        )
+        return records
+
     def _singer_validate_message(self, record: dict) -> None:
         """Ensure record conforms to Singer Spec.
 
@@ -564,6 +943,37 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
                 msg,
             )
 
+    def _get_timestamp_parsing_plan(self, schema: dict) -> _TimestampParsingPlan:
+        """Return the timestamp parsing plan for a schema, compiling it if needed.
+
+        The plan is cached for the last schema it was compiled for.
+
+        Args:
+            schema: The stream schema.
+
+        Returns:
+            The parsing plan.
+        """
+        if self._timestamp_parsing_plan is not None:
+            cached_schema, plan = self._timestamp_parsing_plan
+            if cached_schema is schema:
+                return plan
+
+        properties: dict[str, dict] = schema["properties"]
+        fields = []
+        for key, property_schema in properties.items():
+            if datelike_type := get_datelike_property_type(property_schema):
+                parser = _DATELIKE_PARSERS.get(datelike_type, datetime_fromisoformat)
+                fields.append((key, parser, datelike_type))
+
+        plan = _TimestampParsingPlan(
+            fields=tuple(fields),
+            known_fields={*properties, *self._warned_missing_fields},
+            additional_properties=bool(schema.get("additionalProperties")),
+        )
+        self._timestamp_parsing_plan = (schema, plan)
+        return plan
+
     def _parse_timestamps_in_record(
         self,
         record: dict,
@@ -576,44 +986,59 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
         is out of range, repair logic will be driven by the `treatment` input arg:
         MAX, NULL, or ERROR.
 
+        Only the date-like fields listed in the schema's parsing plan are visited,
+        so the cost per record does not grow with the number of other fields.
+
         Args:
             record: Individual record in the stream.
             schema: TODO
             treatment: TODO
         """
-        for key, value in record.items():
-            additional_properties = schema.get("additionalProperties", False)
-            if key not in schema["properties"]:
-                if (
-                    value is not None
-                    and not additional_properties
-                    and key not in self._warned_missing_fields
-                ):
-                    self.logger.warning("No schema for record field '%s'", key)
-                    self._warned_missing_fields.add(key)
-                continue
-
-            if datelike_type := get_datelike_property_type(schema["properties"][key]):
-                date_val = value
+        self._parse_timestamps_in_records([record], schema, treatment)
+
+    def _parse_timestamps_in_records(
+        self,
+        records: list[dict],
+        schema: dict,
+        treatment: DatetimeErrorTreatmentEnum,
+    ) -> None:
+        """Parse date-like strings in a block of records.
+
+        See :meth:`_parse_timestamps_in_record`. The parsing plan is looked up once
+        for the whole block.
+
+        Args:
+            records: Records in the stream.
+            schema: The stream schema.
+            treatment: How to repair out-of-range values.
+        """
+        plan = self._get_timestamp_parsing_plan(schema)
+        for record in records:
+            if not plan.additional_properties and not plan.known_fields.issuperset(
+                record
+            ):
+                for key in [key for key in record if key not in plan.known_fields]:
+                    if record[key] is not None:
+                        self.logger.warning("No schema for record field '%s'", key)
+                        self._warned_missing_fields.add(key)
+                        plan.known_fields.add(key)
+
+            for key, parser, datelike_type in plan.fields:
+                value = record.get(key)
+                if value is None:
+                    continue
                 try:
-                    if value is not None:
-                        if datelike_type == "time":
-                            date_val = time_fromisoformat(date_val)
-                        elif datelike_type == "date":
-                            date_val = date_fromisoformat(date_val)
-                        else:
-                            date_val = datetime_fromisoformat(date_val)
+                    record[key] = parser(value)
                 except ValueError as ex:
-                    date_val = handle_invalid_timestamp_in_record(
+                    record[key] = handle_invalid_timestamp_in_record(
                         record,
                         [key],
-                        date_val,
+                        value,
                         datelike_type,
                         ex,
                         treatment,
                         self.logger,
                     )
-                record[key] = date_val
 
     def _after_process_record(self, context: dict) -> None:
         """Perform post-processing and record keeping. Internal hook.
@@ -623,6 +1048,24 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
         """
         self.logger.debug("Processed record: %s", context)
 
+    def _after_process_records(self, context: dict, count: int) -> None:
+        """Perform post-processing and record keeping for a block. Internal hook.
+
+        Sinks that override :meth:`_after_process_record` get their override called
+        for each record instead.
+
+        Args:
+            context: Stream partition or context dictionary.
+            count: Number of records in the block.
+        """
+        cls = type(self)
+        if cls._after_process_record is not Sink._after_process_record:
+            for _ in range(count):
+                self._after_process_record(context)
+            return
+
+        self.logger.debug("Processed %d records: %s", count, context)
+
     # SDK developer overrides:
 
     def preprocess_record(self, record: dict, context: dict) -> dict:  # noqa: PLR6301, ARG002
@@ -657,6 +1100,25 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
             context: Stream partition or context dictionary.
         """
 
+    def process_records(self, records: list[dict], context: dict) -> None:
+        """Load a block of records from the stream.
+
+        This method is called instead of :meth:`~singer_sdk.Sink.process_record()`
+        when the target dispatches RECORD messages in blocks (see
+        :attr:`~singer_sdk.Target.record_batch_size`). All records in the block
+        share the same ``context`` and fit in the current batch.
+
+        The default implementation calls :meth:`~singer_sdk.Sink.process_record()`
+        for each record. Developers may override this method to load the whole
+        block at once.
+
+        Args:
+            records: Records in the stream, in the order they were received.
+            context: Stream partition or context dictionary.
+        """
+        for record in records:
+            self.process_record(record, context)
+
     def start_drain(self) -> dict:
         """Set and return `self._context_draining`.
 
@@ -734,44 +1196,82 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
     ) -> None:
         """Process a batch file with the given batch context.
 
+        If :attr:`process_batch_files_in_chunks` is enabled, each file is read in
+        chunks of at most :attr:`max_size` records and
+        :meth:`~singer_sdk.BatchSink.process_batch` is called once per chunk.
+        Otherwise it is called once per file.
+
         Args:
             encoding: The batch file encoding.
             files: The batch files to process.
 
+        .. versionchanged:: 0.50.0
+           Added support for processing batch files in chunks.
+
         Raises:
             NotImplementedError: If the batch file encoding is not supported.
         """
-        file: GzipFile | t.IO
-        storage = self.batch_config.storage if self.batch_config else None
+        if not (
+            encoding.format == BatchFileFormat.JSONL
+            or (
+                encoding.format == BatchFileFormat.PARQUET
+                and importlib.util.find_spec("pyarrow")
+            )
+        ):
+            msg = f"Unsupported batch encoding format: {encoding.format}"
+            raise NotImplementedError(msg)
 
+        storage = self.batch_config.storage if self.batch_config else None
+        chunk_size = self.max_size if self.process_batch_files_in_chunks else None
+        sources = []
         for path in files:
             head, tail = StorageTarget.split_url(path)
-            file_storage = storage or StorageTarget.from_url(head)
-
-            if encoding.format == BatchFileFormat.JSONL:
-                with file_storage.open(tail, mode="rb") as file:
-                    if encoding.compression == "gzip":
-                        with gzip_open(file) as context_file:
-                            context = {
-                                "records": [
-                                    deserialize_json(line) for line in context_file
-                                ]
-                            }
-                    else:
-                        context = {"records": [deserialize_json(line) for line in file]}
-                    self.record_counter_metric.increment(len(context["records"]))
-                    self.process_batch(context)
-            elif (
-                importlib.util.find_spec("pyarrow")
-                and encoding.format == BatchFileFormat.PARQUET
-            ):
-                import pyarrow.parquet as pq  # noqa: PLC0415
+            sources.append((storage or StorageTarget.from_url(head), tail))
+
+        workers = self.max_parallel_batch_files
+        if workers > 1 and len(sources) > 1:
+            # Read the next files while the current one is being processed.
+            # Results are yielded in manifest order.
+            with Parallel(
+                n_jobs=workers,
+                backend=self.batch_file_parallel_backend,
+                return_as="generator",
+            ) as parallel:
+                self._process_batch_contexts(
+                    parallel(
+                        delayed(_load_batch_file)(
+                            file_storage,
+                            tail,
+                            encoding,
+                            chunk_size,
+                            as_arrow=self.accepts_arrow_batches,
+                        )
+                        for file_storage, tail in sources
+                    ),
+                )
+        else:
+            self._process_batch_contexts(
+                _read_batch_file(
+                    file_storage,
+                    tail,
+                    encoding,
+                    chunk_size,
+                    as_arrow=self.accepts_arrow_batches,
+                )
+                for file_storage, tail in sources
+            )
 
-                with file_storage.open(tail, mode="rb") as file:
-                    table = pq.read_table(file)
-                    context = {"records": table.to_pylist()}
-                    self.record_counter_metric.increment(len(context["records"]))
-                    self.process_batch(context)
-            else:
-                msg = f"Unsupported batch encoding format: {encoding.format}"
-                raise NotImplementedError(msg)
+    def _process_batch_contexts(self, files: t.Iterable[t.Iterable[dict]]) -> None:
+        """Process the batch contexts read from each batch file, in order.
+
+        Args:
+            files: The batch contexts of each file.
+        """
+        for contexts in files:
+            for context in contexts:
+                if "arrow_table" in context:
+                    count = context["arrow_table"].num_rows
+                else:
+                    count = len(context["records"])
+                self.record_counter_metric.increment(count)
+                self.process_batch(context)
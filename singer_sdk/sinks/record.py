@@ -23,6 +23,22 @@ class RecordSink(Sink):
         """
         self.tally_record_written()
 
+    def _after_process_records(self, context: dict, count: int) -> None:
+        """Perform post-processing and record keeping for a block. Internal hook.
+
+        The RecordSink class uses this method to tally the records written.
+
+        Args:
+            context: Stream partition or context dictionary.
+            count: Number of records in the block.
+        """
+        cls = type(self)
+        if cls._after_process_record is not RecordSink._after_process_record:
+            super()._after_process_records(context, count)
+            return
+
+        self.tally_record_written(count)
+
     @t.final
     def process_batch(self, context: dict) -> None:
         """Do nothing and return immediately.
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import copy
 import functools
 import logging
+import threading
 import typing as t
 import warnings
 from collections import UserString
@@ -13,6 +15,7 @@ from functools import lru_cache
 
 import sqlalchemy as sa
 import sqlalchemy.types
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.engine import reflection
 from sqlalchemy.sql import ddl
 
@@ -38,6 +41,19 @@ if t.TYPE_CHECKING:
         ReflectedIndex,
         ReflectedPrimaryKeyConstraint,
     )
+    from sqlalchemy.sql import Executable
+
+# Dialects that support MERGE statements, in addition to PostgreSQL 15+
+_MERGE_DIALECTS = frozenset(("bigquery", "duckdb", "oracle", "snowflake"))
+
+# Dialects that support INSERT ... ON CONFLICT statements
+_ON_CONFLICT_INSERTS: dict[
+    str,
+    t.Callable[[sa.TableClause], postgresql.Insert | sqlite.Insert],
+] = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
 
 
 class FullyQualifiedName(UserString):
@@ -579,6 +595,15 @@ class SQLConnector:  # noqa: PLR0904
     allow_temp_tables: bool = True  # Whether temp tables are supported.
     _cached_engine: sa.Engine | None = None
 
+    #: The statements used by :meth:`get_merge_upsert_statements` to merge a table
+    #: into another one: ``merge`` for a ``MERGE`` statement, ``on-conflict`` for an
+    #: ``INSERT ... ON CONFLICT`` statement, or ``delete-insert`` to delete the rows
+    #: to update and then insert all rows. If ``None``, the strategy is picked based
+    #: on the dialect.
+    merge_upsert_strategy: t.Literal["merge", "on-conflict", "delete-insert"] | None = (
+        None
+    )
+
     #: The absolute maximum length for VARCHAR columns that the database supports.
     max_varchar_length: int | None = None
 
@@ -606,6 +631,17 @@ class SQLConnector:  # noqa: PLR0904
         self._config: dict[str, t.Any] = config or {}
         self._sqlalchemy_url: str | None = sqlalchemy_url or None
 
+        # Reflected metadata of existing schemas and tables
+        self._schema_names: set[str] = set()
+        self._table_columns: dict[
+            tuple[str | None, str],
+            dict[str, ReflectedColumn],
+        ] = {}
+        self._table_primary_keys: dict[tuple[str | None, str], list[str]] = {}
+
+        # Connection used by every statement of a thread, see _single_connection()
+        self._local = threading.local()
+
     @property
     def config(self) -> dict:
         """If set, provides access to the tap or target config.
@@ -649,9 +685,35 @@ class SQLConnector:  # noqa: PLR0904
 
     @contextmanager
     def _connect(self) -> t.Iterator[sa.Connection]:
+        connection: sa.Connection | None = getattr(self._local, "connection", None)
+        if connection is not None:
+            yield connection
+            return
+
         with self._engine.connect().execution_options(stream_results=True) as conn:
             yield conn
 
+    @contextmanager
+    def _single_connection(self) -> t.Iterator[None]:
+        """Run the statements of the current thread on a single connection.
+
+        Temporary tables only exist on the connection that created them, so they
+        must be created, loaded and read on the same connection.
+
+        Yields:
+            None.
+        """
+        if getattr(self._local, "connection", None) is not None:
+            yield
+            return
+
+        with self._connect() as conn:
+            self._local.connection = conn
+            try:
+                yield
+            finally:
+                self._local.connection = None
+
     @deprecated(
         "`SQLConnector.create_sqlalchemy_connection` is deprecated. "
         "If you need to execute something that isn't available "
@@ -1192,6 +1254,8 @@ class SQLConnector:  # noqa: PLR0904
             True if table exists, False if not, None if unsure or undetectable.
         """
         _, schema_name, table_name = self.parse_full_table_name(full_table_name)
+        if (schema_name, table_name) in self._table_columns:
+            return True
 
         return sa.inspect(self._engine).has_table(table_name, schema_name)
 
@@ -1204,8 +1268,73 @@ class SQLConnector:  # noqa: PLR0904
         Returns:
             True if the database schema exists, False if not.
         """
-        schemas = set(sa.inspect(self._engine).get_schema_names())
-        return schema_name in schemas
+        if schema_name not in self._schema_names:
+            self._schema_names = set(sa.inspect(self._engine).get_schema_names())
+        return schema_name in self._schema_names
+
+    def clear_reflection_cache(
+        self,
+        full_table_name: str | FullyQualifiedName | None = None,
+    ) -> None:
+        """Forget the reflected metadata of a table, or of all schemas and tables.
+
+        Existing schemas, and the columns of existing tables, are reflected once and
+        then kept up to date when the connector alters them. Call this method after
+        altering or dropping them by other means, for example with custom DDL.
+
+        Args:
+            full_table_name: The table to forget, or None to forget everything.
+
+        .. versionadded:: 0.50.0
+        """
+        if full_table_name is None:
+            self._schema_names = set()
+            self._table_columns = {}
+            self._table_primary_keys = {}
+            return
+
+        _, schema_name, table_name = self.parse_full_table_name(full_table_name)
+        self._table_columns.pop((schema_name, table_name), None)
+        self._table_primary_keys.pop((schema_name, table_name), None)
+
+    def _get_reflected_columns(
+        self,
+        full_table_name: str | FullyQualifiedName,
+    ) -> dict[str, ReflectedColumn]:
+        """Get the reflected columns of a table, reflecting the table if needed.
+
+        Args:
+            full_table_name: Fully qualified table name.
+
+        Returns:
+            The reflected columns, by name.
+        """
+        _, schema_name, table_name = self.parse_full_table_name(full_table_name)
+        key = (schema_name, table_name)
+        if key not in self._table_columns:
+            inspector = sa.inspect(self._engine)
+            self._table_columns[key] = {
+                col_meta["name"]: col_meta
+                for col_meta in inspector.get_columns(table_name, schema_name)
+            }
+        return self._table_columns[key]
+
+    def _get_primary_keys(self, full_table_name: str | FullyQualifiedName) -> list[str]:
+        """Get the primary key columns of a table, reflecting the table if needed.
+
+        Args:
+            full_table_name: Fully qualified table name.
+
+        Returns:
+            The names of the primary key columns.
+        """
+        _, schema_name, table_name = self.parse_full_table_name(full_table_name)
+        key = (schema_name, table_name)
+        if key not in self._table_primary_keys:
+            inspector = sa.inspect(self._engine)
+            pk_constraint = inspector.get_pk_constraint(table_name, schema_name)
+            self._table_primary_keys[key] = pk_constraint["constrained_columns"]
+        return self._table_primary_keys[key]
 
     def get_table_columns(
         self,
@@ -1221,19 +1350,19 @@ class SQLConnector:  # noqa: PLR0904
         Returns:
             An ordered list of column objects.
         """
-        _, schema_name, table_name = self.parse_full_table_name(full_table_name)
-        inspector = sa.inspect(self._engine)
-        columns = inspector.get_columns(table_name, schema_name)
+        columns = self._get_reflected_columns(full_table_name).values()
+        if column_names:
+            names = {col.casefold() for col in column_names}
+            columns = [col for col in columns if col["name"].casefold() in names]  # type: ignore[assignment]
 
+        # Types are copied, since callers may modify them
         columns_dict: dict[str, sa.Column] = {
             col_meta["name"]: sa.Column(
                 col_meta["name"],
-                col_meta["type"],
+                copy.copy(col_meta["type"]),
                 nullable=col_meta.get("nullable", False),
             )
             for col_meta in columns
-            if not column_names
-            or col_meta["name"].casefold() in {col.casefold() for col in column_names}
         }
 
         return columns_dict
@@ -1277,7 +1406,7 @@ class SQLConnector:  # noqa: PLR0904
         Returns:
             True if table exists, False if not.
         """
-        return column_name in self.get_table_columns(full_table_name)
+        return column_name in self._get_reflected_columns(full_table_name)
 
     def create_schema(self, schema_name: str) -> None:
         """Create target schema.
@@ -1287,6 +1416,7 @@ class SQLConnector:  # noqa: PLR0904
         """
         with self._connect() as conn, conn.begin():
             conn.execute(ddl.CreateSchema(schema_name))
+        self._schema_names.add(schema_name)
 
     def create_empty_table(
         self,
@@ -1298,6 +1428,9 @@ class SQLConnector:  # noqa: PLR0904
     ) -> None:
         """Create an empty target table.
 
+        .. versionchanged:: 0.50.0
+           Temp tables are created if :attr:`allow_temp_tables` is enabled.
+
         Args:
             full_table_name: the target table name.
             schema: the JSON schema for the new table.
@@ -1309,7 +1442,7 @@ class SQLConnector:  # noqa: PLR0904
             NotImplementedError: if temp tables are unsupported and as_temp_table=True.
             RuntimeError: if a variant schema is passed with no properties defined.
         """
-        if as_temp_table:
+        if as_temp_table and not self.allow_temp_tables:
             msg = "Temporary tables are not supported."
             raise NotImplementedError(msg)
 
@@ -1339,8 +1472,32 @@ class SQLConnector:  # noqa: PLR0904
             if existing_pk_columns:
                 table_args.append(sa.PrimaryKeyConstraint(*existing_pk_columns))
 
-        _ = sa.Table(table_name, meta, *columns, *table_args)
-        meta.create_all(self._engine)
+        _ = sa.Table(
+            table_name,
+            meta,
+            *columns,
+            *table_args,
+            prefixes=["TEMPORARY"] if as_temp_table else None,
+        )
+        with self._connect() as conn, conn.begin():
+            meta.create_all(conn)
+
+        # Temp tables are only visible to the connection that created them
+        if as_temp_table:
+            return
+
+        self._table_primary_keys[schema_name, table_name] = [
+            col for col in primary_keys if col in properties
+        ]
+        self._table_columns[schema_name, table_name] = {
+            column.name: {
+                "name": column.name,
+                "type": column.type,
+                "nullable": bool(column.nullable),
+                "default": None,
+            }
+            for column in columns
+        }
 
     def _create_empty_column(
         self,
@@ -1407,6 +1564,7 @@ class SQLConnector:  # noqa: PLR0904
             return
         if self.config["load_method"] == TargetLoadMethods.OVERWRITE:
             self.get_table(full_table_name=full_table_name).drop(self._engine)
+            self.clear_reflection_cache(full_table_name)
             self.create_empty_table(
                 full_table_name=full_table_name,
                 schema=schema,
@@ -1464,6 +1622,7 @@ class SQLConnector:  # noqa: PLR0904
                 column_name=column_name,
                 sql_type=sql_type,
             )
+            self._set_reflected_column_type(full_table_name, column_name, sql_type)
             return
 
         self._adapt_column_type(
@@ -1497,6 +1656,11 @@ class SQLConnector:  # noqa: PLR0904
         with self._connect() as conn, conn.begin():
             conn.execute(column_rename_ddl)
 
+        _, schema_name, table_name = self.parse_full_table_name(full_table_name)
+        columns = self._table_columns.get((schema_name, table_name), {})
+        if old_name in columns:
+            columns[new_name] = {**columns.pop(old_name), "name": new_name}
+
     def merge_sql_types(
         self,
         sql_types: t.Sequence[sqlalchemy.types.TypeEngine],
@@ -1803,6 +1967,38 @@ class SQLConnector:  # noqa: PLR0904
         )
         with self._connect() as conn, conn.begin():
             conn.execute(alter_column_ddl)
+        self._set_reflected_column_type(
+            full_table_name,
+            column_name,
+            compatible_sql_type,
+        )
+
+    def _set_reflected_column_type(
+        self,
+        full_table_name: str | FullyQualifiedName,
+        column_name: str,
+        sql_type: sqlalchemy.types.TypeEngine,
+    ) -> None:
+        """Record the type of a column added or altered by the connector.
+
+        Args:
+            full_table_name: The target table name.
+            column_name: The target column name.
+            sql_type: The SQLAlchemy type of the column.
+        """
+        _, schema_name, table_name = self.parse_full_table_name(full_table_name)
+        columns = self._table_columns.get((schema_name, table_name))
+        if columns is None:
+            # The table will be reflected when it is needed
+            return
+
+        column = columns.get(column_name)
+        columns[column_name] = {
+            "name": column_name,
+            "type": sql_type,
+            "nullable": column["nullable"] if column else True,
+            "default": column["default"] if column else None,
+        }
 
     def serialize_json(self, obj: object) -> str:  # noqa: PLR6301
         """Serialize an object to a JSON string.
@@ -1860,3 +2056,168 @@ class SQLConnector:  # noqa: PLR0904
                     f"WHERE {version_column_name} < {current_version}",
                 ),
             )
+
+    def _drop_table(self, full_table_name: str | FullyQualifiedName) -> None:
+        """Drop a table.
+
+        Args:
+            full_table_name: The fully qualified table name.
+        """
+        _, schema_name, table_name = self.parse_full_table_name(full_table_name)
+        with self._connect() as conn, conn.begin():
+            sa.Table(table_name, sa.MetaData(), schema=schema_name).drop(conn)
+        self.clear_reflection_cache(full_table_name)
+
+    def get_merge_upsert_statements(
+        self,
+        full_table_name: str | FullyQualifiedName,
+        from_table_name: str | FullyQualifiedName,
+        join_keys: t.Sequence[str],
+        column_names: t.Sequence[str],
+    ) -> list[Executable]:
+        """Get the statements that merge the rows of a table into another table.
+
+        Rows of the source table replace the rows of the target table with the same
+        join key values, and the other rows are inserted. The statements are built
+        according to :attr:`merge_upsert_strategy`. By default, ``INSERT ... ON
+        CONFLICT`` is used for PostgreSQL and SQLite when the join keys are the
+        primary key of the target table, ``MERGE`` for dialects that support it, and
+        ``DELETE`` followed by ``INSERT`` otherwise.
+
+        .. versionadded:: 0.50.0
+
+        Args:
+            full_table_name: The target table name.
+            from_table_name: The source table name.
+            join_keys: The columns that identify a row.
+            column_names: The columns to copy from the source table.
+
+        Returns:
+            The statements to execute in a single transaction.
+
+        Raises:
+            NotImplementedError: If the strategy is not supported by the dialect.
+        """
+        strategy = self.merge_upsert_strategy or self._get_merge_upsert_strategy(
+            full_table_name,
+            join_keys,
+        )
+        target = self._get_table_clause(full_table_name, column_names)
+        source = self._get_table_clause(from_table_name, column_names)
+        update_columns = [col for col in column_names if col not in join_keys]
+
+        if strategy == "merge":
+            return [self._get_merge_statement(target, source, join_keys, column_names)]
+
+        if strategy == "on-conflict":
+            try:
+                dialect_insert = _ON_CONFLICT_INSERTS[self._dialect.name]
+            except KeyError:
+                msg = (
+                    f"INSERT ... ON CONFLICT is not supported by {self._dialect.name}."
+                )
+                raise NotImplementedError(msg) from None
+
+            # The WHERE clause avoids a parsing ambiguity in SQLite
+            insert = dialect_insert(target).from_select(
+                column_names,
+                sa.select(*source.columns).where(sa.true()),
+            )
+            if not update_columns:
+                return [insert.on_conflict_do_nothing(index_elements=join_keys)]
+            return [
+                insert.on_conflict_do_update(
+                    index_elements=join_keys,
+                    set_={col: insert.excluded[col] for col in update_columns},
+                ),
+            ]
+
+        matches = sa.and_(*(target.c[key] == source.c[key] for key in join_keys))
+        return [
+            sa.delete(target).where(sa.exists().where(matches)),
+            sa.insert(target).from_select(column_names, sa.select(*source.columns)),
+        ]
+
+    def _get_merge_upsert_strategy(
+        self,
+        full_table_name: str | FullyQualifiedName,
+        join_keys: t.Sequence[str],
+    ) -> t.Literal["merge", "on-conflict", "delete-insert"]:
+        """Pick the statements used to merge a table into another table.
+
+        Args:
+            full_table_name: The target table name.
+            join_keys: The columns that identify a row.
+
+        Returns:
+            The merge upsert strategy.
+        """
+        dialect = self._dialect
+        if dialect.name in _ON_CONFLICT_INSERTS and set(
+            self._get_primary_keys(full_table_name)
+        ) == set(join_keys):
+            return "on-conflict"
+
+        if dialect.name in _MERGE_DIALECTS or (
+            dialect.name == "postgresql"
+            and (dialect.server_version_info or (0,)) >= (15,)
+        ):
+            return "merge"
+
+        return "delete-insert"
+
+    def _get_table_clause(
+        self,
+        full_table_name: str | FullyQualifiedName,
+        column_names: t.Sequence[str],
+    ) -> sa.TableClause:
+        _, schema_name, table_name = self.parse_full_table_name(full_table_name)
+        return sa.table(
+            table_name,
+            *(sa.column(name) for name in column_names),
+            schema=schema_name,
+        )
+
+    def _get_merge_statement(
+        self,
+        target: sa.TableClause,
+        source: sa.TableClause,
+        join_keys: t.Sequence[str],
+        column_names: t.Sequence[str],
+    ) -> sa.TextClause:
+        """Get a MERGE statement.
+
+        Args:
+            target: The target table.
+            source: The source table.
+            join_keys: The columns that identify a row.
+            column_names: The columns to copy from the source table.
+
+        Returns:
+            The MERGE statement.
+        """
+        preparer = self._dialect.identifier_preparer
+        columns = {col: preparer.quote(col) for col in column_names}
+
+        on_clause = " AND ".join(
+            f"tgt.{columns[key]} = src.{columns[key]}" for key in join_keys
+        )
+        set_clause = ", ".join(
+            f"{quoted} = src.{quoted}"
+            for col, quoted in columns.items()
+            if col not in join_keys
+        )
+        insert_columns = ", ".join(columns.values())
+        insert_values = ", ".join(f"src.{quoted}" for quoted in columns.values())
+
+        statement = (
+            f"MERGE INTO {preparer.format_table(target)} tgt "
+            f"USING {preparer.format_table(source)} src "
+            f"ON ({on_clause})"
+        )
+        if set_clause:
+            statement += f" WHEN MATCHED THEN UPDATE SET {set_clause}"
+        statement += (
+            f" WHEN NOT MATCHED THEN INSERT ({insert_columns}) VALUES ({insert_values})"  # noqa: S608
+        )
+        return sa.text(statement)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import functools
 import re
 import typing as t
+import uuid
 import warnings
 from collections import defaultdict
 from copy import copy
@@ -16,10 +17,12 @@ from sqlalchemy.sql.expression import bindparam
 from singer_sdk.exceptions import ConformedNameClashException
 from singer_sdk.helpers._conformers import replace_leading_digit
 from singer_sdk.helpers._util import utc_now
+from singer_sdk.helpers.capabilities import TargetLoadMethods
 from singer_sdk.sinks.batch import BatchSink
 from singer_sdk.sql.connector import SQLConnector
 
 if t.TYPE_CHECKING:
+    import pyarrow as pa
     from sqlalchemy.sql import Executable
 
     from singer_sdk.sql.connector import FullyQualifiedName
@@ -30,7 +33,55 @@ __all__ = ["SQLSink"]
 _C = t.TypeVar("_C", bound=SQLConnector)
 
 
-class SQLSink(BatchSink, t.Generic[_C]):
+class _InsertPlan(t.NamedTuple):
+    """Insert statement of a table and how to build its parameters."""
+
+    statement: Executable
+    """The insert statement, reused for every batch."""
+
+    property_names: list[str]
+    """Conformed property names, in the order of the insert columns."""
+
+    property_keys: frozenset[str]
+    """Conformed property names, to check if a record can be inserted as-is."""
+
+
+ARROW_INSERT_CHUNK_SIZE = 10_000
+"""Number of rows of an Arrow table inserted with a single statement execution."""
+
+
+def _compile_positional_insert(
+    statement: Executable,
+    dialect: sa.Dialect,
+) -> tuple[str, list[str]] | None:
+    """Compile an insert statement for rows passed to the driver as tuples.
+
+    Args:
+        statement: The insert statement of a table.
+        dialect: The dialect of the database.
+
+    Returns:
+        The SQL of the statement and the names of its columns in parameter order, or
+        None if the statement is not a plain ``INSERT``, the driver expects named
+        parameters, or a column type converts its values before they are sent.
+    """
+    if not isinstance(statement, sa.Insert) or statement._values:  # noqa: SLF001
+        return None
+
+    compiled = statement.compile(dialect=dialect)
+    if not compiled.positional or compiled.positiontup is None:
+        return None
+
+    column_names = []
+    for bind_name in compiled.positiontup:
+        bind = compiled.binds[bind_name]
+        if bind.type.dialect_impl(dialect).bind_processor(dialect) is not None:
+            return None
+        column_names.append(bind.key)
+    return str(compiled), column_names
+
+
+class SQLSink(BatchSink, t.Generic[_C]):  # noqa: PLR0904
     """SQL-type sink type."""
 
     connector_class: type[_C]
@@ -56,6 +107,16 @@ class SQLSink(BatchSink, t.Generic[_C]):
         """
         self._connector: _C
         self._connector = connector or self.connector_class(dict(target.config))
+
+        # Conformed column names of the record keys seen so far
+        self._conformed_names: dict[str, str] = {}
+        self._conformed_name_sources: dict[str, str] = {}
+        self._conformed_names_unchanged = True
+        self._conformed_name_clashes = False
+
+        # Insert plan of each table, with the schema it was compiled for
+        self._insert_plans: dict[str, tuple[dict, _InsertPlan]] = {}
+
         super().__init__(target, stream_name, schema, key_properties)
 
     @property
@@ -232,9 +293,53 @@ class SQLSink(BatchSink, t.Generic[_C]):
         Returns:
             New record dictionary with conformed column names.
         """
-        conformed_property_names = {key: self.conform_name(key) for key in record}
-        self._check_conformed_names_not_duplicated(conformed_property_names)
-        return {conformed_property_names[key]: value for key, value in record.items()}
+        names = self._get_conformed_names(record)
+        return {names[key]: value for key, value in record.items()}
+
+    def _get_conformed_names(self, record: dict) -> dict[str, str]:
+        """Get the conformed column names of the keys of a record.
+
+        Names are conformed once per sink with :meth:`conform_name`, when a key is
+        first seen, and then looked up for every record.
+
+        Args:
+            record: Dictionary representing a single record.
+
+        Returns:
+            A mapping of record keys to conformed column names, including at least
+            the keys of the record.
+        """
+        names = self._conformed_names
+        if not names.keys() >= record.keys():
+            sources = self._conformed_name_sources
+            for key in record.keys() - names.keys():
+                names[key] = conformed_name = self.conform_name(key)
+                if conformed_name != key:
+                    self._conformed_names_unchanged = False
+                if sources.setdefault(conformed_name, key) != key:
+                    self._conformed_name_clashes = True
+
+        # Keys that conform to the same name only clash if they are in the same record
+        if self._conformed_name_clashes:
+            self._check_conformed_names_not_duplicated(
+                {key: names[key] for key in record},
+            )
+        return names
+
+    def _conform_record_keys(self, record: dict) -> dict:
+        """Return the record with property names conformed, without copying it.
+
+        Args:
+            record: Dictionary representing a single record.
+
+        Returns:
+            The record itself if none of its keys change when conformed, or a new
+            record dictionary with conformed column names.
+        """
+        names = self._get_conformed_names(record)
+        if self._conformed_names_unchanged:
+            return record
+        return {names[key]: value for key, value in record.items()}
 
     def setup(self) -> None:
         """Set up Sink.
@@ -268,15 +373,53 @@ class SQLSink(BatchSink, t.Generic[_C]):
 
         Args:
             context: Stream partition or context dictionary.
+
+        .. versionchanged:: 0.50.0
+           Insert Arrow tables from ``BATCH`` files when
+           :attr:`~singer_sdk.Sink.accepts_arrow_batches` is enabled, and upsert
+           records with :meth:`bulk_upsert_records` or :meth:`bulk_upsert_arrow_table`
+           when the ``load_method`` is ``upsert``, the stream has key properties and
+           the connector allows merge upserts.
         """
         # If duplicates are merged, these can be tracked via
         # :meth:`~singer_sdk.Sink.tally_duplicate_merged()`.
+        if self._upserts_records:
+            if "arrow_table" in context:
+                self.bulk_upsert_arrow_table(
+                    full_table_name=self.full_table_name,
+                    schema=self.schema,
+                    table=context["arrow_table"],
+                )
+            else:
+                self.bulk_upsert_records(
+                    full_table_name=self.full_table_name,
+                    schema=self.schema,
+                    records=context["records"],
+                )
+            return
+
+        if "arrow_table" in context:
+            self.bulk_insert_arrow_table(
+                full_table_name=self.full_table_name,
+                schema=self.schema,
+                table=context["arrow_table"],
+            )
+            return
+
         self.bulk_insert_records(
             full_table_name=self.full_table_name,
             schema=self.schema,
             records=context["records"],
         )
 
+    @functools.cached_property
+    def _upserts_records(self) -> bool:
+        return bool(
+            self.config.get("load_method") == TargetLoadMethods.UPSERT
+            and self.key_properties
+            and self.connector.allow_merge_upsert
+        )
+
     def generate_insert_statement(
         self,
         full_table_name: str | FullyQualifiedName,
@@ -333,57 +476,319 @@ class SQLSink(BatchSink, t.Generic[_C]):
         Returns:
             True if table exists, False if not, None if unsure or undetectable.
         """
-        insert_sql = self.generate_insert_statement(
-            full_table_name,
-            schema,
-        )
+        plan = self._get_insert_plan(full_table_name, schema)
+        property_names = plan.property_names
+        property_keys = plan.property_keys
+
+        # Create new record dicts with conformed keys, and missing properties filled
+        # in with None. Records are used as-is if they have exactly the properties
+        # of the schema once conformed, unless conform_record is overridden.
+        conform_record = self.conform_record
+        if type(self).conform_record is SQLSink.conform_record:
+            conform_record = self._conform_record_keys
+        new_records = [
+            record
+            if record.keys() == property_keys
+            else {name: record.get(name) for name in property_names}
+            for record in map(conform_record, records)
+        ]
+
+        with self.connector._connect() as conn, conn.begin():  # noqa: SLF001
+            result = conn.execute(plan.statement, new_records)
+
+        return result.rowcount
+
+    def bulk_insert_arrow_table(
+        self,
+        full_table_name: str | FullyQualifiedName,
+        schema: dict,
+        table: pa.Table,
+    ) -> int | None:
+        """Bulk insert an Arrow table to an existing destination table.
+
+        Column names are conformed once for the whole table, rather than once per
+        record, and properties missing from the table are inserted as nulls. The
+        table is inserted in chunks of rows. When the insert statement can be passed
+        to the database driver as-is, rows are built as tuples from the columns of
+        each chunk, without SQLAlchemy processing them one by one. This method may
+        optionally be overridden by developers in order to load the Arrow data
+        natively, e.g. with a database-specific bulk load API.
+
+        Args:
+            full_table_name: the target table name.
+            schema: the JSON schema for the new table, to be used when inferring column
+                names.
+            table: the input Arrow table.
+
+        Returns:
+            The number of inserted rows, if detectable.
+
+        .. versionadded:: 0.50.0
+        """
+        import pyarrow as pa  # noqa: PLC0415
+
+        plan = self._get_insert_plan(full_table_name, schema)
+
+        conformed_column_names = {
+            name: self.conform_name(name) for name in table.column_names
+        }
+        self._check_conformed_names_not_duplicated(conformed_column_names)
+        table = table.rename_columns(list(conformed_column_names.values()))
+
+        for name in plan.property_names:
+            if name not in table.column_names:
+                table = table.append_column(name, pa.nulls(table.num_rows))
+
+        rowcount: int | None = 0
+        with self.connector._connect() as conn, conn.begin():  # noqa: SLF001
+            driver_sql = _compile_positional_insert(plan.statement, conn.dialect)
+            if driver_sql is not None:
+                insert_sql, column_names = driver_sql
+                table = table.select(column_names)
+            else:
+                table = table.select(plan.property_names)
+
+            for batch in table.to_batches(max_chunksize=ARROW_INSERT_CHUNK_SIZE):
+                if driver_sql is not None:
+                    columns = [column.to_pylist() for column in batch.columns]
+                    result = conn.exec_driver_sql(
+                        insert_sql, list(zip(*columns, strict=True))
+                    )
+                else:
+                    result = conn.execute(plan.statement, batch.to_pylist())
+                if rowcount is not None and result.rowcount >= 0:
+                    rowcount += result.rowcount
+                else:
+                    rowcount = None
+
+        return rowcount
+
+    def _get_insert_plan(
+        self,
+        full_table_name: str | FullyQualifiedName,
+        schema: dict,
+    ) -> _InsertPlan:
+        """Return the insert plan for a table, compiling it if needed.
+
+        The plan is cached for the last schema it was compiled for, so that the same
+        insert statement is executed for every batch and SQLAlchemy only compiles it
+        once.
+
+        Args:
+            full_table_name: the target table name.
+            schema: the JSON schema of the table.
+
+        Returns:
+            The insert plan.
+        """
+        key = str(full_table_name)
+        if cached := self._insert_plans.get(key):
+            cached_schema, plan = cached
+            if cached_schema is schema:
+                return plan
+
+        insert_sql = self.generate_insert_statement(full_table_name, schema)
         if isinstance(insert_sql, str):  # pragma: no cover
             warnings.warn(
                 "Generating a SQL insert statement as a string is deprecated. "
                 "Please return an SQLAlchemy Executable object instead.",
                 DeprecationWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
             insert_sql = sa.text(insert_sql)
+        self.logger.debug("Inserting with SQL: %s", insert_sql)
 
-        conformed_records = [self.conform_record(record) for record in records]
-        property_names = list(self.conform_schema(schema)["properties"].keys())
+        property_names = list(self.conform_schema(schema)["properties"])
+        plan = _InsertPlan(
+            statement=insert_sql,
+            property_names=property_names,
+            property_keys=frozenset(property_names),
+        )
+        self._insert_plans[key] = (schema, plan)
+        return plan
 
-        # Create new record dicts with missing properties filled in with None
-        new_records = [
-            {name: record.get(name) for name in property_names}
-            for record in conformed_records
-        ]
+    def bulk_upsert_records(
+        self,
+        full_table_name: str | FullyQualifiedName,
+        schema: dict,
+        records: t.Iterable[dict[str, t.Any]],
+    ) -> int | None:
+        """Bulk upsert records to an existing destination table.
 
-        self.logger.info("Inserting with SQL: %s", insert_sql)
+        Records with the same key properties are deduplicated, keeping the last one.
+        The records are then loaded into a staging table with
+        :meth:`bulk_insert_records`, merged into the destination table with
+        :meth:`merge_upsert_from_table`, and the staging table is dropped. The
+        staging table is a temp table if the connector allows them.
 
-        with self.connector._connect() as conn, conn.begin():  # noqa: SLF001
-            result = conn.execute(insert_sql, new_records)
+        .. versionadded:: 0.50.0
 
-        return result.rowcount
+        Args:
+            full_table_name: the target table name.
+            schema: the JSON schema for the new table, to be used when inferring column
+                names.
+            records: the input records.
+
+        Returns:
+            The number of upserted rows, if detectable.
+        """
+        unique_records: dict[tuple, dict[str, t.Any]] = {}
+        count = 0
+        for record in records:
+            key = tuple(record.get(name) for name in self._key_properties)
+            unique_records[key] = record
+            count += 1
+        if duplicates := count - len(unique_records):
+            self.tally_duplicate_merged(duplicates)
+
+        return self._upsert_from_staging_table(
+            full_table_name,
+            schema,
+            lambda staging_table_name: self.bulk_insert_records(
+                full_table_name=staging_table_name,
+                schema=schema,
+                records=unique_records.values(),
+            ),
+        )
+
+    def bulk_upsert_arrow_table(
+        self,
+        full_table_name: str | FullyQualifiedName,
+        schema: dict,
+        table: pa.Table,
+    ) -> int | None:
+        """Bulk upsert an Arrow table to an existing destination table.
+
+        Like :meth:`bulk_upsert_records`, but rows are deduplicated with Arrow
+        compute functions and loaded into the staging table with
+        :meth:`bulk_insert_arrow_table`, without creating a dictionary per row.
+
+        .. versionadded:: 0.50.0
+
+        Args:
+            full_table_name: the target table name.
+            schema: the JSON schema for the new table, to be used when inferring column
+                names.
+            table: the input Arrow table.
+
+        Returns:
+            The number of upserted rows, if detectable.
+        """
+        import pyarrow as pa  # noqa: PLC0415
+        import pyarrow.compute as pc  # noqa: PLC0415
+
+        # Keep the last row of each key, in the original row order
+        row_index = "__sdc_row_index"
+        keys = pa.table(
+            {
+                name: (
+                    table.column(name)
+                    if name in table.column_names
+                    else pa.nulls(table.num_rows)
+                )
+                for name in self._key_properties
+            },
+        ).append_column(row_index, pa.array(range(table.num_rows), pa.int64()))
+        last_rows = (
+            keys.group_by(list(self._key_properties), use_threads=False)
+            .aggregate([(row_index, "max")])
+            .column(f"{row_index}_max")
+        )
+        if duplicates := table.num_rows - len(last_rows):
+            self.tally_duplicate_merged(duplicates)
+            table = table.take(last_rows.take(pc.sort_indices(last_rows)))
+
+        return self._upsert_from_staging_table(
+            full_table_name,
+            schema,
+            lambda staging_table_name: self.bulk_insert_arrow_table(
+                full_table_name=staging_table_name,
+                schema=schema,
+                table=table,
+            ),
+        )
+
+    def _upsert_from_staging_table(
+        self,
+        full_table_name: str | FullyQualifiedName,
+        schema: dict,
+        insert: t.Callable[[FullyQualifiedName], int | None],
+    ) -> int | None:
+        """Load rows into a staging table and merge them into the destination table.
+
+        Args:
+            full_table_name: the target table name.
+            schema: the JSON schema of the table.
+            insert: Inserts the rows into the staging table of the given name.
+
+        Returns:
+            The number of upserted rows, if detectable.
+        """
+        as_temp_table = self.connector.allow_temp_tables
+        db_name, schema_name, table_name = self.connector.parse_full_table_name(
+            full_table_name,
+        )
+        staging_table_name = self.connector.get_fully_qualified_name(
+            table_name=f"{table_name}_staging_{uuid.uuid4().hex[:12]}",
+            schema_name=None if as_temp_table else schema_name,
+            db_name=None if as_temp_table else db_name,
+        )
+
+        # Temp tables only exist on the connection that created them
+        with self.connector._single_connection():  # noqa: SLF001
+            self.connector.create_empty_table(
+                full_table_name=staging_table_name,
+                schema=self.conform_schema(schema),
+                as_temp_table=as_temp_table,
+            )
+            try:
+                insert(staging_table_name)
+                return self.merge_upsert_from_table(
+                    target_table_name=full_table_name,
+                    from_table_name=staging_table_name,
+                    join_keys=list(self.key_properties),
+                )
+            finally:
+                self.connector._drop_table(staging_table_name)  # noqa: SLF001
+                self._insert_plans.pop(str(staging_table_name), None)
 
     def merge_upsert_from_table(
         self,
-        target_table_name: str,
-        from_table_name: str,
+        target_table_name: str | FullyQualifiedName,
+        from_table_name: str | FullyQualifiedName,
         join_keys: list[str],
     ) -> int | None:
         """Merge upsert data from one table to another.
 
+        The statements are generated by
+        :meth:`~singer_sdk.SQLConnector.get_merge_upsert_statements`, for the
+        properties of the stream schema.
+
+        .. versionchanged:: 0.50.0
+           Implemented with a single set-based statement, or a ``DELETE`` and an
+           ``INSERT`` statement, depending on the dialect.
+
         Args:
             target_table_name: The destination table name.
             from_table_name: The source table name.
-            join_keys: The merge upsert keys, or `None` to append.
+            join_keys: The merge upsert keys.
 
-        Return:
+        Returns:
             The number of records copied, if detectable, or `None` if the API does not
             report number of records affected/inserted.
-
-        Raises:
-            NotImplementedError: if the merge upsert capability does not exist or is
-                undefined.
         """
-        raise NotImplementedError
+        statements = self.connector.get_merge_upsert_statements(
+            target_table_name,
+            from_table_name,
+            join_keys=join_keys,
+            column_names=list(self.conform_schema(self.schema)["properties"]),
+        )
+
+        rowcount: int | None = None
+        with self.connector._connect() as conn, conn.begin():  # noqa: SLF001
+            for statement in statements:
+                rowcount = conn.execute(statement).rowcount
+        return rowcount
 
     def activate_version(self, new_version: int) -> None:
         """Bump the active version of the target table.
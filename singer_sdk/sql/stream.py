@@ -24,6 +24,33 @@ if t.TYPE_CHECKING:
 __all__ = ["SQLStream"]
 
 
+def _after(
+    columns: t.Sequence[sa.ColumnElement],
+    values: t.Sequence[t.Any],
+) -> sa.ColumnElement[bool]:
+    """Build a condition for the rows that sort after a row, in keyset pagination.
+
+    The condition is expanded to ``a > x OR (a = x AND b > y)``, rather than a row
+    value comparison like ``(a, b) > (x, y)``, which not every database supports.
+
+    Args:
+        columns: The columns the rows are sorted by.
+        values: The values of the columns in the row.
+
+    Returns:
+        The condition.
+    """
+    return sa.or_(
+        *(
+            sa.and_(
+                *(columns[j] == values[j] for j in range(i)),
+                columns[i] > values[i],
+            )
+            for i in range(len(columns))
+        ),
+    )
+
+
 class SQLStream(Stream, metaclass=abc.ABCMeta):
     """Base class for SQLAlchemy-based streams."""
 
@@ -33,6 +60,26 @@ class SQLStream(Stream, metaclass=abc.ABCMeta):
     supports_nulls_first: bool = False
     """Whether the database supports the NULLS FIRST/LAST syntax."""
 
+    fetch_size: int | None = None
+    """Number of rows to fetch from the database at a time.
+
+    When set, query results are streamed with a server-side cursor, if the driver
+    supports it, instead of being loaded into memory all at once.
+
+    .. versionadded:: 0.50.0
+    """
+
+    keyset_chunk_size: int | None = None
+    """Maximum number of rows to read with a single query.
+
+    When set, the table is read with a sequence of queries that are ordered by the
+    replication key, if any, and the primary key, and that each start after the last
+    row of the previous query. A limit set by :meth:`build_query` applies to all the
+    queries together. Streams without a primary key are read with a single query.
+
+    .. versionadded:: 0.50.0
+    """
+
     def __init__(
         self,
         tap: Tap,
@@ -277,11 +324,98 @@ class SQLStream(Stream, metaclass=abc.ABCMeta):
             msg = f"Stream '{self.name}' does not support partitioning."
             raise NotImplementedError(msg)
 
+        query = self.build_query(context=context)
+        if self.fetch_size:
+            query = query.execution_options(yield_per=self.fetch_size)
+
         with self.connector._connect() as conn:  # noqa: SLF001
-            for row in conn.execute(self.build_query(context=context)).mappings():
+            if self.keyset_chunk_size and (keys := self._get_keyset_columns(query)):
+                rows = self._read_keyset_chunks(conn, query, keys)
+            else:
+                rows = conn.execute(query).mappings()
+            for row in rows:
                 # https://github.com/sqlalchemy/sqlalchemy/discussions/10053#discussioncomment-6344965
                 yield dict(row)
 
+    def _get_keyset_columns(
+        self,
+        query: selectable.Select,
+    ) -> list[sa.ColumnElement] | None:
+        """Get the columns to paginate a query on.
+
+        Args:
+            query: The query of the stream.
+
+        Returns:
+            The replication key, if any, followed by the other primary key columns, or
+            None if the stream has no primary key.
+        """
+        names = list(self.primary_keys)
+        if not names:
+            self.logger.warning(
+                "Stream '%s' has no primary key, reading it with a single query.",
+                self.name,
+            )
+            return None
+
+        if self.replication_key:
+            names = [
+                self.replication_key,
+                *(name for name in names if name != self.replication_key),
+            ]
+        columns = query.selected_columns
+        return [columns[name] for name in names]
+
+    def _read_keyset_chunks(
+        self,
+        conn: sa.Connection,
+        query: selectable.Select,
+        keys: list[sa.ColumnElement],
+    ) -> t.Iterator[sa.RowMapping]:
+        """Read the rows of a query in chunks, with keyset pagination.
+
+        Rows with a null replication key are read first, ordered by the primary key,
+        since null values can't be compared with the last row of a chunk.
+
+        Args:
+            conn: The database connection.
+            query: The query of the stream.
+            keys: The columns to order and paginate by, see
+                :meth:`_get_keyset_columns`.
+
+        Yields:
+            The rows of the query.
+        """
+        if self.replication_key and keys[0].key not in self.primary_keys:
+            replication_key, *primary_keys = keys
+            passes = [
+                (query.where(replication_key.is_(None)), primary_keys),
+                (query.where(replication_key.is_not(None)), keys),
+            ]
+        else:
+            passes = [(query, keys)]
+
+        chunk_size = t.cast("int", self.keyset_chunk_size)
+        # A limit set by build_query() applies to all chunks together
+        remaining: int | None = query._limit  # noqa: SLF001
+
+        for pass_query, pass_keys in passes:
+            ordered_query = pass_query.order_by(None).order_by(*pass_keys)
+            chunk_query = ordered_query
+            while remaining is None or remaining > 0:
+                limit = chunk_size if remaining is None else min(chunk_size, remaining)
+                row_count = 0
+                for row in conn.execute(chunk_query.limit(limit)).mappings():
+                    row_count += 1
+                    yield row
+                if remaining is not None:
+                    remaining -= row_count
+                if row_count < limit:
+                    break
+
+                last_values = [row[key] for key in pass_keys]
+                chunk_query = ordered_query.where(_after(pass_keys, last_values))
+
     @property
     def is_sorted(self) -> bool:
         """Expect stream to be sorted.
@@ -26,6 +26,9 @@ class SQLTarget(Target):
 
     _target_connector: SQLConnector | None = None
 
+    # get_sink() is overridden below, but picks sinks by stream name only
+    _sink_depends_on_record = False
+
     default_sink_class: type[SQLSink]
 
     #: A list of capabilities supported by this target.
@@ -0,0 +1,128 @@
+"""Policies that decide when streams write STATE messages."""
+
+from __future__ import annotations
+
+import time
+from abc import ABCMeta, abstractmethod
+
+__all__ = [
+    "AdaptiveStatePolicy",
+    "RecordCountStatePolicy",
+    "StateEmissionPolicy",
+]
+
+
+class StateEmissionPolicy(metaclass=ABCMeta):
+    """Decide when a stream writes a STATE message while it syncs records.
+
+    Streams call :meth:`should_write_state` after writing each record, and
+    :meth:`reset` after every STATE message they attempt to write. A STATE message is
+    only written if the state changed since the last one, so a policy does not need
+    to check whether the bookmark moved.
+
+    .. versionadded:: 0.50.0
+    """
+
+    def reset(self) -> None:  # noqa: B027
+        """Start a new interval after a STATE message."""
+
+    @abstractmethod
+    def should_write_state(self, record_count: int, bytes_written: int) -> bool:
+        """Check whether the stream should write a STATE message.
+
+        Args:
+            record_count: Number of records written since the last STATE message.
+            bytes_written: Approximate number of bytes of Singer messages written
+                since the last STATE message.
+
+        Returns:
+            True if a STATE message should be written.
+        """
+
+
+class RecordCountStatePolicy(StateEmissionPolicy):
+    """Write a STATE message every fixed number of records.
+
+    .. versionadded:: 0.50.0
+    """
+
+    def __init__(self, max_records: int) -> None:
+        """Create a new policy.
+
+        Args:
+            max_records: Number of records between STATE messages.
+        """
+        self.max_records = max_records
+
+    def should_write_state(self, record_count: int, bytes_written: int) -> bool:  # noqa: ARG002
+        """Check whether the stream should write a STATE message.
+
+        Args:
+            record_count: Number of records written since the last STATE message.
+            bytes_written: Approximate number of bytes of Singer messages written
+                since the last STATE message.
+
+        Returns:
+            True if ``max_records`` records were written since the last message.
+        """
+        return record_count >= self.max_records
+
+
+class AdaptiveStatePolicy(StateEmissionPolicy):
+    """Write STATE messages based on record count, output volume and elapsed time.
+
+    A STATE message is due once ``max_records`` records or ``max_bytes`` bytes were
+    written, or ``max_interval`` seconds have passed, since the last one. Due messages
+    are held back until at least ``min_interval`` seconds have passed, which caps the
+    rate of STATE messages for fast streams.
+
+    .. versionadded:: 0.50.0
+    """
+
+    def __init__(
+        self,
+        *,
+        max_records: int | None = 10000,
+        max_bytes: int | None = None,
+        max_interval: float | None = 60.0,
+        min_interval: float = 1.0,
+    ) -> None:
+        """Create a new policy.
+
+        Args:
+            max_records: Maximum number of records between STATE messages.
+            max_bytes: Maximum number of bytes written between STATE messages.
+            max_interval: Maximum number of seconds between STATE messages.
+            min_interval: Minimum number of seconds between STATE messages.
+        """
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self.max_interval = max_interval
+        self.min_interval = min_interval
+        self._last_state_time = time.monotonic()
+
+    def reset(self) -> None:
+        """Start a new interval after a STATE message."""
+        self._last_state_time = time.monotonic()
+
+    def should_write_state(self, record_count: int, bytes_written: int) -> bool:
+        """Check whether the stream should write a STATE message.
+
+        Args:
+            record_count: Number of records written since the last STATE message.
+            bytes_written: Approximate number of bytes of Singer messages written
+                since the last STATE message.
+
+        Returns:
+            True if a STATE message is due and ``min_interval`` has passed.
+        """
+        due = (self.max_records is not None and record_count >= self.max_records) or (
+            self.max_bytes is not None and bytes_written >= self.max_bytes
+        )
+        if not due and self.max_interval is None:
+            return False
+
+        elapsed = time.monotonic() - self._last_state_time
+        if not due:
+            return elapsed >= self.max_interval  # type: ignore[operator]
+        return elapsed >= self.min_interval
@@ -5,6 +5,7 @@ from __future__ import annotations
 import abc
 import copy
 import datetime
+import functools
 import json
 import logging
 import typing as t
@@ -16,6 +17,7 @@ from types import MappingProxyType
 import singer_sdk.singerlib as singer
 from singer_sdk import metrics
 from singer_sdk.batch import Batcher
+from singer_sdk.contrib.batch_encoder_parquet import ParquetBatcher
 from singer_sdk.exceptions import (
     AbortedSyncFailedException,
     AbortedSyncPausedException,
@@ -24,14 +26,21 @@ from singer_sdk.exceptions import (
     InvalidStreamSortException,
     MaxRecordsLimitException,
 )
+from singer_sdk.helpers._arrow import get_max_value, get_record_batch_columns
 from singer_sdk.helpers._batch import BatchConfig, SDKBatchMessage
 from singer_sdk.helpers._catalog import pop_deselected_record_properties
 from singer_sdk.helpers._compat import (
     SingerSDKDeprecationWarning,
     datetime_fromisoformat,
 )
+from singer_sdk.helpers._concurrency import (
+    EXHAUSTED,
+    interleave,
+    release_while_iterating,
+)
 from singer_sdk.helpers._flattening import get_flattening_options
 from singer_sdk.helpers._state import (
+    PartitionStateIndex,
     finalize_state_progress_markers,
     get_starting_replication_value,
     get_state_partitions_list,
@@ -45,18 +54,22 @@ from singer_sdk.helpers._state import (
 )
 from singer_sdk.helpers._typing import (
     TypeConformanceLevel,
-    conform_record_data_types,
+    TypeConformer,
     is_datetime_type,
 )
 from singer_sdk.helpers._util import utc_now
 from singer_sdk.mapper import RemoveRecordTransform, SameRecordTransform
+from singer_sdk.state import AdaptiveStatePolicy
 
 if t.TYPE_CHECKING:
+    import pyarrow as pa
+
     from singer_sdk.helpers import types
     from singer_sdk.helpers._batch import BaseBatchFileEncoding
     from singer_sdk.helpers._compat import Traversable
     from singer_sdk.mapper import StreamMap
     from singer_sdk.singerlib.catalog import StreamMetadata
+    from singer_sdk.state import StateEmissionPolicy
     from singer_sdk.tap_base import Tap
 
 # Replication methods
@@ -64,6 +77,8 @@ REPLICATION_FULL_TABLE = "FULL_TABLE"
 REPLICATION_INCREMENTAL = "INCREMENTAL"
 REPLICATION_LOG_BASED = "LOG_BASED"
 
+_T = t.TypeVar("_T")
+
 
 class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
     """Abstract base class for tap streams.
@@ -75,7 +90,12 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
     """
 
     STATE_MSG_FREQUENCY = 10000
-    """Number of records between state messages."""
+    """Maximum number of records between state messages.
+
+    .. versionchanged:: 0.50.0
+       Used as ``max_records`` of the default state emission policy. See
+       :meth:`~singer_sdk.Stream.get_state_emission_policy`.
+    """
 
     ABORT_AT_RECORD_COUNT: int | None = None
     """
@@ -114,6 +134,16 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
     selected_by_default: bool = True
     """Whether this stream is selected by default in the catalog."""
 
+    max_partition_parallelism: int = 1
+    """Maximum number of partitions to read records from concurrently.
+
+    When greater than 1, :meth:`get_records` is called for several partitions at once
+    in a pool of threads, and their records are interleaved. Records are processed,
+    and partition state is finalized, in the thread that syncs the stream.
+
+    .. versionadded:: 0.50.0
+    """
+
     def __init__(
         self,
         tap: Tap,
@@ -163,6 +193,10 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
         self._mask: singer.SelectionMask | None = None
         self._schema: dict | None = None
         self._is_state_flushed: bool = True
+        self._partition_state_index = PartitionStateIndex()
+        self._state_emission_policy: StateEmissionPolicy | None = None
+        self._records_since_state = self._bytes_at_state = 0
+        self._type_conformer: TypeConformer | None = None
         self._sync_costs: dict[str, int] = {}
         self.child_streams: list[Stream] = []
         if schema:
@@ -407,6 +441,27 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
         """
         return self._input_schema if self._input_schema is not None else self.schema
 
+    @property
+    def type_conformer(self) -> TypeConformer:
+        """The type conformer for records of this stream.
+
+        The conformer is rebuilt whenever the effective schema or the
+        `TYPE_CONFORMANCE_LEVEL` changes.
+
+        Returns:
+            A type conformer for the effective schema.
+        """
+        schema = self.effective_schema
+        conformer = self._type_conformer
+        if (
+            conformer is None
+            or conformer.schema is not schema
+            or conformer.level != self.TYPE_CONFORMANCE_LEVEL
+        ):
+            conformer = TypeConformer(schema, self.TYPE_CONFORMANCE_LEVEL)
+            self._type_conformer = conformer
+        return conformer
+
     def _write_replication_key_signpost(
         self,
         context: types.Context | None,
@@ -798,6 +853,7 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
                 self.tap_state,
                 self.name,
                 state_partition_context=state_partition_context,
+                partition_index=self._partition_state_index,
             )
         return self.stream_state
 
@@ -820,6 +876,37 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
         """
         return get_writeable_state_dict(self.tap_state, self.name)
 
+    def get_state_emission_policy(self) -> StateEmissionPolicy:
+        """Return the policy that decides when to write STATE messages.
+
+        The policy is asked after every record whether a STATE message should be
+        written. STATE messages are also always written at the end of the sync of
+        each stream or partition, regardless of the policy.
+
+        By default, a STATE message is written after
+        :attr:`~singer_sdk.Stream.STATE_MSG_FREQUENCY` records or 60 seconds,
+        whichever comes first, but no more than once per second. Developers may
+        override this method to return a
+        :class:`~singer_sdk.state.StateEmissionPolicy` that better suits the source.
+
+        .. versionadded:: 0.50.0
+
+        Returns:
+            A state emission policy.
+        """
+        return AdaptiveStatePolicy(max_records=self.STATE_MSG_FREQUENCY)
+
+    @property
+    def state_emission_policy(self) -> StateEmissionPolicy:
+        """Get the state emission policy of this stream.
+
+        Returns:
+            The policy returned by :meth:`get_state_emission_policy`.
+        """
+        if self._state_emission_policy is None:
+            self._state_emission_policy = self.get_state_emission_policy()
+        return self._state_emission_policy
+
     # Partitions
 
     @property
@@ -896,9 +983,22 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
             self._tap.state_writer.write_state(self.tap_state)
             self._is_state_flushed = True
 
+        self.state_emission_policy.reset()
+        self._records_since_state = 0
+        self._bytes_at_state = self._tap.message_writer.bytes_written
+
+    def _write_state_message_if_due(self) -> None:
+        """Count a written record and write a STATE message if the policy says so."""
+        self._records_since_state += 1
+        if self.state_emission_policy.should_write_state(
+            self._records_since_state,
+            self._tap.message_writer.bytes_written - self._bytes_at_state,
+        ):
+            self._write_state_message()
+
     def _write_activate_version_message(self, full_table_version: int) -> None:
         """Write out an ACTIVATE_VERSION message."""
-        singer.write_message(
+        self._tap.write_message(
             singer.ActivateVersionMessage(
                 stream=self.name,
                 version=full_table_version,
@@ -955,15 +1055,8 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
         Yields:
             Record message objects.
         """
-        schema = self.effective_schema
         pop_deselected_record_properties(record, self.schema, self.mask)
-        record = conform_record_data_types(
-            stream_name=self.name,
-            record=record,
-            schema=schema,
-            level=self.TYPE_CONFORMANCE_LEVEL,
-            logger=self.logger,
-        )
+        record = self.type_conformer.conform_record(self.name, record, self.logger)
         for stream_map in self.stream_maps:
             mapped_record = stream_map.transform(record)
             # Emit record if not filtered
@@ -1178,7 +1271,61 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
             if self.stream_maps[0].get_filter_result(record):
                 self._sync_children(copy.copy(context))
 
-    def _sync_records(  # noqa: C901
+    def _iter_source(self, iterable: t.Iterable[_T]) -> t.Iterable[_T]:
+        """Iterate over items from the source.
+
+        When the tap syncs streams concurrently, the tap's sync lock is released while
+        the source produces each item, so other streams can make progress.
+
+        Args:
+            iterable: Items from the source.
+
+        Returns:
+            The items from the source.
+        """
+        lock = self._tap._sync_lock  # noqa: SLF001
+        if lock is None:
+            return iterable
+        return release_while_iterating(iterable, lock)
+
+    def _get_partition_records(
+        self,
+        contexts: t.Sequence[types.Context],
+    ) -> t.Iterator[tuple[int, t.Any]]:
+        """Get the records of each partition.
+
+        Partitions are read concurrently if ``max_partition_parallelism`` is greater
+        than 1.
+
+        Args:
+            contexts: The partition contexts.
+
+        Yields:
+            Tuples of the partition index and a record, or ``EXHAUSTED`` after the
+            last record of the partition.
+        """
+        if self.max_partition_parallelism > 1 and len(contexts) > 1:
+            for context in contexts:
+                self._write_starting_replication_value(context or None)
+
+            yield from self._iter_source(
+                interleave(
+                    [
+                        functools.partial(self.get_records, context or None)
+                        for context in contexts
+                    ],
+                    self.max_partition_parallelism,
+                )
+            )
+            return
+
+        for index, context in enumerate(contexts):
+            self._write_starting_replication_value(context or None)
+            for record in self._iter_source(self.get_records(context or None)):
+                yield index, record
+            yield index, EXHAUSTED
+
+    def _sync_records(  # noqa: C901, PLR0912
         self,
         context: types.Context | None = None,
         *,
@@ -1198,7 +1345,6 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
             Each record from the source.
         """
         # Type definitions
-        context_element: types.Context | None
         record: types.Record | None
         context_list: list[types.Context] | list[dict] | None
 
@@ -1210,6 +1356,115 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
         context_list = [context] if context is not None else self.partitions
         selected = self.selected
 
+        contexts: t.Sequence[types.Context] = context_list or [{}]
+        partition_index = -1
+        partition_record_counts = [0] * len(contexts)
+        child_contexts: list[types.Context | None] = [
+            None if not context_element else copy.copy(context_element)
+            for context_element in contexts
+        ]
+
+        with record_counter, timer:
+            for index, record_result in self._get_partition_records(contexts):
+                if index != partition_index:
+                    partition_index = index
+                    record_counter.context = timer.context = contexts[index]
+                    current_context = contexts[index] or None
+                    state_partition_context = self._get_state_partition_context(
+                        current_context,
+                    )
+
+                if record_result is EXHAUSTED:
+                    if current_context == state_partition_context:
+                        # Finalize per-partition state only if 1:1 with context
+                        self._finalize_state(self.get_context_state(current_context))
+                    continue
+
+                self._check_max_record_limit(current_record_index=record_index)
+                partition_record_counts[index] += 1
+
+                if isinstance(record_result, tuple):  # pragma: no cover
+                    # Tuple items should be the record and the child context
+                    warnings.warn(
+                        "Yielding a tuple of (record, child_context) is "
+                        "deprecated and will be removed in version 0.49 "
+                        "at the earliest. "
+                        "Please yield a single item instead.",
+                        SingerSDKDeprecationWarning,
+                        stacklevel=2,
+                    )
+                    record, child_contexts[index] = record_result
+                else:
+                    record = record_result
+
+                record = self.post_process(record, current_context)
+                if record is None:
+                    continue
+
+                try:
+                    self._process_record(
+                        record,
+                        child_context=child_contexts[index],
+                        partition_context=state_partition_context,
+                    )
+                except InvalidStreamSortException as ex:  # pragma: no cover
+                    log_sort_error(
+                        log_fn=self.logger.error,
+                        ex=ex,
+                        record_count=record_index + 1,
+                        partition_record_count=partition_record_counts[index],
+                        current_context=current_context,
+                        state_partition_context=state_partition_context,
+                        stream_name=self.name,
+                    )
+                    raise
+
+                if selected:
+                    if write_messages:
+                        self._write_record_message(record)
+
+                    self._increment_stream_state(record, context=current_context)
+                    if write_messages:
+                        self._write_state_message_if_due()
+
+                    record_counter.increment()
+                    yield record
+
+                record_index += 1
+
+        if not context:
+            # Finalize total stream only if we have the full context.
+            # Otherwise will be finalized by tap at end of sync.
+            self._finalize_state(self.stream_state)
+
+        if write_messages:
+            # Write final state message if we haven't already
+            self._write_state_message()
+
+    def _sync_record_batches(
+        self,
+        context: types.Context | None = None,
+    ) -> t.Generator[pa.RecordBatch, t.Any, t.Any]:
+        """Sync Arrow record batches from :meth:`get_record_batches`.
+
+        Deselected columns, and columns missing from the schema when type conformance
+        is enabled, are dropped from each record batch. State is advanced with the
+        maximum replication key value of each record batch.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Yields:
+            Each record batch from the source, with only the selected columns.
+        """
+        record_counter = metrics.record_counter(self.name)
+        timer = metrics.sync_timer(self.name)
+
+        record_index = 0
+        context_list = [context] if context is not None else self.partitions
+        drop_unmapped = self.TYPE_CONFORMANCE_LEVEL != TypeConformanceLevel.NONE
+        columns: tuple[list[str], list[str]] | None = None
+
         with record_counter, timer:
             for context_element in context_list or [{}]:
                 record_counter.context = context_element
@@ -1221,63 +1476,39 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
                 )
                 self._write_starting_replication_value(current_context)
 
-                child_context: types.Context | None = (
-                    None if current_context is None else copy.copy(current_context)
-                )
-
-                for idx, record_result in enumerate(self.get_records(current_context)):
-                    self._check_max_record_limit(current_record_index=record_index)
-
-                    if isinstance(record_result, tuple):  # pragma: no cover
-                        # Tuple items should be the record and the child context
-                        warnings.warn(
-                            "Yielding a tuple of (record, child_context) is "
-                            "deprecated and will be removed in version 0.49 "
-                            "at the earliest. "
-                            "Please yield a single item instead.",
-                            SingerSDKDeprecationWarning,
-                            stacklevel=2,
-                        )
-                        record, child_context = record_result
-                    else:
-                        record = record_result
-
-                    record = self.post_process(record, current_context)
-                    if record is None:
+                for batch in self._iter_source(
+                    self.get_record_batches(current_context)
+                ):
+                    if not batch.num_rows:
                         continue
+                    self._check_max_record_limit(current_record_index=record_index)
 
-                    try:
-                        self._process_record(
-                            record,
-                            child_context=child_context,
-                            partition_context=state_partition_context,
-                        )
-                    except InvalidStreamSortException as ex:  # pragma: no cover
-                        log_sort_error(
-                            log_fn=self.logger.error,
-                            ex=ex,
-                            record_count=record_index + 1,
-                            partition_record_count=idx + 1,
-                            current_context=current_context,
-                            state_partition_context=state_partition_context,
-                            stream_name=self.name,
+                    if columns is None:
+                        columns = get_record_batch_columns(
+                            batch.schema.names,
+                            self.schema,
+                            self.mask,
+                            drop_unmapped=drop_unmapped,
                         )
-                        raise
-
-                    if selected:
-                        if write_messages:
-                            self._write_record_message(record)
-
-                        self._increment_stream_state(record, context=current_context)
-                        if (
-                            record_index + 1
-                        ) % self.STATE_MSG_FREQUENCY == 0 and write_messages:
-                            self._write_state_message()
-
-                        record_counter.increment()
-                        yield record
-
-                    record_index += 1
+                        if columns[1]:
+                            self.logger.debug(
+                                "Properties %s were present in the '%s' stream but "
+                                "not found in catalog schema. Ignoring.",
+                                columns[1],
+                                self.name,
+                            )
+
+                    if self.replication_key:
+                        value = get_max_value(batch, self.replication_key)
+                        if value is not None:
+                            self._increment_stream_state(
+                                {self.replication_key: value},
+                                context=current_context,
+                            )
+
+                    record_counter.increment(batch.num_rows)
+                    record_index += batch.num_rows
+                    yield batch.select(columns[0])
 
                 if current_context == state_partition_context:
                     # Finalize per-partition state only if 1:1 with context
@@ -1289,10 +1520,6 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
             # Otherwise will be finalized by tap at end of sync.
             self._finalize_state(self.stream_state)
 
-        if write_messages:
-            # Write final state message if we haven't already
-            self._write_state_message()
-
     def _sync_batches(
         self,
         batch_config: BatchConfig,
@@ -1527,6 +1754,44 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
             context: Stream partition or context dictionary.
         """
 
+    def get_record_batches(
+        self,
+        context: types.Context | None,
+    ) -> t.Iterable[pa.RecordBatch]:
+        """Generate Arrow record batches from the source.
+
+        Streams that can read columnar data, for example from a bulk export API or a
+        columnar database, may override this method in addition to
+        :meth:`get_records`. When the stream is synced in ``BATCH`` mode with the
+        ``parquet`` encoding, the record batches are written to Parquet files
+        directly, skipping the conversion of each row to a Python dictionary.
+
+        Deselected columns are dropped and the replication key bookmark is advanced
+        using column operations. :meth:`post_process` is not called, and streams with
+        child streams always use :meth:`get_records`.
+
+        .. versionadded:: 0.50.0
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Raises:
+            NotImplementedError: If the stream does not support Arrow record batches.
+        """
+        msg = f"Stream '{self.name}' does not support Arrow record batches."
+        raise NotImplementedError(msg)
+
+    @property
+    def supports_record_batches(self) -> bool:
+        """Whether the stream implements :meth:`get_record_batches`.
+
+        Returns:
+            True if :meth:`get_record_batches` is overridden.
+
+        .. versionadded:: 0.50.0
+        """
+        return type(self).get_record_batches is not Stream.get_record_batches
+
     def get_batch_config(self, config: t.Mapping) -> BatchConfig | None:  # noqa: PLR6301
         """Return the batch config for this stream.
 
@@ -1556,6 +1821,21 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
         Yields:
             A tuple of (encoding, manifest) for each batch.
         """
+        if (
+            batch_config.encoding.format == "parquet"
+            and self.supports_record_batches
+            and not self.child_streams
+        ):
+            parquet_batcher = ParquetBatcher(
+                tap_name=self.tap_name,
+                stream_name=self.name,
+                batch_config=batch_config,
+            )
+            record_batches = self._sync_record_batches(context)
+            for manifest in parquet_batcher.get_batches_from_arrow(record_batches):
+                yield batch_config.encoding, manifest
+            return
+
         batcher = Batcher(
             tap_name=self.tap_name,
             stream_name=self.name,
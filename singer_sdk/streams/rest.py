@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import abc
+import collections
 import copy
 import decimal
+import itertools
 import logging
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from http import HTTPStatus
 from urllib.parse import urlparse
@@ -15,12 +18,13 @@ from warnings import warn
 import backoff
 import requests
 import requests.exceptions
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
 from singer_sdk import metrics
 from singer_sdk.authenticators import SimpleAuthenticator
 from singer_sdk.exceptions import FatalAPIError, RetriableAPIError
 from singer_sdk.helpers._compat import SingerSDKDeprecationWarning
-from singer_sdk.helpers.jsonpath import extract_jsonpath
+from singer_sdk.helpers.jsonpath import extract_jsonpath, extract_jsonpath_from_chunks
 from singer_sdk.pagination import (
     JSONPathPaginator,
     LegacyStreamPaginator,
@@ -31,17 +35,20 @@ from singer_sdk.streams.core import Stream
 
 if t.TYPE_CHECKING:
     from collections.abc import Iterable, Mapping
+    from concurrent.futures import Future
     from datetime import datetime
 
     from backoff.types import Details
 
     from singer_sdk.helpers.types import Auth, Context, RequestFunc
     from singer_sdk.pagination import BaseAPIPaginator
+    from singer_sdk.rate_limiting import RateLimiter
     from singer_sdk.singerlib import Schema
     from singer_sdk.tap_base import Tap
 
 DEFAULT_PAGE_SIZE = 1000
 DEFAULT_REQUEST_TIMEOUT = 300  # 5 minutes
+RESPONSE_CHUNK_SIZE = 64 * 1024
 
 _TToken = t.TypeVar("_TToken")
 _TNum = t.TypeVar("_TNum", int, float)
@@ -62,6 +69,21 @@ class _HTTPStream(Stream, t.Generic[_TToken], metaclass=abc.ABCMeta):  # noqa: P
     #: Set this to True if the API expects a JSON payload in the request body.
     payload_as_json: bool = False
 
+    max_concurrent_requests: int = 1
+    """Maximum number of HTTP requests the stream has in flight at a time.
+
+    When greater than 1, the request for the next page is sent as soon as the
+    paginator has advanced, while the records of the current page are being
+    processed. Unless the paginator can predict the tokens of the next pages, only
+    that one request is in flight at a time, so any value greater than 1 has the same
+    effect. Paginators that implement
+    :meth:`~singer_sdk.pagination.BaseAPIPaginator.predict_next` have up to this many
+    pages requested ahead of time. The connection pool of the requests session is
+    sized to allow this many concurrent connections.
+
+    .. versionadded:: 0.50.0
+    """
+
     # Private constants. May not be supported in future releases:
     _LOG_REQUEST_METRICS: bool = True
     # Disabled by default for safety:
@@ -104,7 +126,7 @@ class _HTTPStream(Stream, t.Generic[_TToken], metaclass=abc.ABCMeta):  # noqa: P
             self.path = path
         self._http_headers: dict[str, str] = {}
         self._http_method = http_method
-        self._requests_session = requests.Session()
+        self._requests_session = self._new_requests_session()
         super().__init__(name=name, schema=schema, tap=tap)
 
     @staticmethod
@@ -189,9 +211,22 @@ class _HTTPStream(Stream, t.Generic[_TToken], metaclass=abc.ABCMeta):  # noqa: P
             The :class:`requests.Session` object for HTTP requests.
         """
         if not self._requests_session:
-            self._requests_session = requests.Session()
+            self._requests_session = self._new_requests_session()
         return self._requests_session
 
+    def _new_requests_session(self) -> requests.Session:
+        """Create a requests session for this stream.
+
+        Returns:
+            A session with a connection pool for ``max_concurrent_requests``.
+        """
+        session = requests.Session()
+        if self.max_concurrent_requests > DEFAULT_POOLSIZE:
+            adapter = HTTPAdapter(pool_maxsize=self.max_concurrent_requests)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        return session
+
     @cached_property
     def user_agent(self) -> str:
         """Get the user agent string for the stream.
@@ -324,11 +359,21 @@ class _HTTPStream(Stream, t.Generic[_TToken], metaclass=abc.ABCMeta):  # noqa: P
         Returns:
             TODO
         """
-        response = self.requests_session.send(
-            prepared_request,
-            timeout=self.timeout,
-            allow_redirects=self.allow_redirects,
-        )
+        rate_limiter = self.rate_limiter
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+
+        response: requests.Response | None = None
+        try:
+            response = self.requests_session.send(
+                prepared_request,
+                timeout=self.timeout,
+                allow_redirects=self.allow_redirects,
+            )
+        finally:
+            if rate_limiter is not None:
+                rate_limiter.release(response)
+
         self._write_request_duration_log(
             endpoint=self.path,
             response=response,
@@ -453,6 +498,15 @@ class _HTTPStream(Stream, t.Generic[_TToken], metaclass=abc.ABCMeta):  # noqa: P
         with metrics.http_request_counter(self.name, self.path) as request_counter:
             request_counter.context = context
 
+            if self.max_concurrent_requests > 1:
+                yield from self._request_records_pipelined(
+                    context,
+                    paginator,
+                    decorated_request,
+                    request_counter,
+                )
+                return
+
             while not paginator.finished:
                 prepared_request = self.prepare_request(
                     context,
@@ -481,6 +535,85 @@ class _HTTPStream(Stream, t.Generic[_TToken], metaclass=abc.ABCMeta):  # noqa: P
 
                 paginator.advance(resp)
 
+    def _request_records_pipelined(  # noqa: C901
+        self,
+        context: Context | None,
+        paginator: BaseAPIPaginator,
+        decorated_request: RequestFunc,
+        request_counter: metrics.Counter,
+    ) -> t.Iterator[dict]:
+        """Request records, with requests for the next pages in flight.
+
+        Unlike :meth:`request_records`, the paginator advances as soon as the first
+        record of a page is parsed, so the next page can be requested in the
+        background while the records of the current page are processed. Pages whose
+        tokens the paginator can predict are requested ahead of time, up to
+        ``max_concurrent_requests`` pages in flight. Records are yielded in page
+        order.
+
+        Args:
+            context: Stream partition or context dictionary.
+            paginator: The paginator for this endpoint.
+            decorated_request: The request function, with backoff.
+            request_counter: The HTTP request counter.
+
+        Yields:
+            An item for every record in the response.
+        """
+        pending: collections.deque[
+            tuple[t.Any, requests.PreparedRequest, Future[requests.Response]]
+        ] = collections.deque()
+
+        def submit(token: t.Any) -> None:  # noqa: ANN401
+            prepared_request = self.prepare_request(context, next_page_token=token)
+            future = executor.submit(decorated_request, prepared_request, context)
+            pending.append((token, prepared_request, future))
+
+        def cancel_pending() -> None:
+            for _, _, future in pending:
+                future.cancel()
+            pending.clear()
+
+        pages = 0
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+            submit(paginator.current_value)
+            try:
+                while pending:
+                    while len(pending) < self.max_concurrent_requests:
+                        token = paginator.predict_next(pending[-1][0])
+                        if token is None:
+                            break
+                        submit(token)
+
+                    _, prepared_request, future = pending.popleft()
+                    resp = future.result()
+                    request_counter.increment()
+                    self.update_sync_costs(prepared_request, resp, context)
+                    records = iter(self.parse_response(resp))
+                    first_records = list(itertools.islice(records, 1))
+                    if not first_records and not paginator.continue_if_empty(resp):
+                        self.log(
+                            "Pagination stopped after %d pages because no records "
+                            "were found in the last response",
+                            pages,
+                        )
+                        break
+
+                    paginator.advance(resp)
+                    if paginator.finished:
+                        cancel_pending()
+                    elif not pending or pending[0][0] != paginator.current_value:
+                        # The next page was not predicted correctly
+                        cancel_pending()
+                        submit(paginator.current_value)
+
+                    if first_records:
+                        yield from first_records
+                        yield from records
+                        pages += 1
+            finally:
+                cancel_pending()
+
     def _write_request_duration_log(
         self,
         endpoint: str,
@@ -663,6 +796,30 @@ class _HTTPStream(Stream, t.Generic[_TToken], metaclass=abc.ABCMeta):  # noqa: P
         """
         return SimpleAuthenticator()
 
+    def get_rate_limiter(self) -> RateLimiter | None:  # noqa: PLR6301
+        """Return the rate limiter for requests of this stream.
+
+        By default, requests are not rate limited. Developers may override this
+        method to return a :class:`~singer_sdk.rate_limiting.RateLimiter`. Return the
+        same instance from several streams, for example one stored on the tap or the
+        authenticator, to share a rate limit between them.
+
+        .. versionadded:: 0.50.0
+
+        Returns:
+            A rate limiter, or None to not limit requests.
+        """
+        return None
+
+    @cached_property
+    def rate_limiter(self) -> RateLimiter | None:
+        """Get the rate limiter of this stream.
+
+        Returns:
+            The rate limiter returned by :meth:`get_rate_limiter`.
+        """
+        return self.get_rate_limiter()
+
     def backoff_wait_generator(self) -> t.Generator[float, None, None]:  # noqa: PLR6301
         """The wait generator used by the backoff decorator on request failure.
 
@@ -765,6 +922,18 @@ class RESTStream(_HTTPStream, t.Generic[_TToken], metaclass=abc.ABCMeta):
     .. versionadded:: 0.43.0
     """
 
+    parse_incrementally: bool = False
+    """Decode the records of a response one at a time.
+
+    By default, the whole response body is decoded before records are extracted with
+    :attr:`records_jsonpath`. If this is set to True and the expression is a chain
+    of object keys ending with ``[*]``, such as ``$[*]`` or ``$.data.items[*]``,
+    records are decoded one at a time instead. This keeps the memory use of large
+    responses close to the size of the response body.
+
+    .. versionadded:: 0.50.0
+    """
+
     def __init__(
         self,
         tap: Tap,
@@ -801,6 +970,18 @@ class RESTStream(_HTTPStream, t.Generic[_TToken], metaclass=abc.ABCMeta):
         Yields:
             One item for every item found in the response.
         """
+        if self.parse_incrementally:
+            content = response.content
+            yield from extract_jsonpath_from_chunks(
+                self.records_jsonpath,
+                (
+                    content[start : start + RESPONSE_CHUNK_SIZE]
+                    for start in range(0, len(content), RESPONSE_CHUNK_SIZE)
+                ),
+                parse_float=decimal.Decimal,
+            )
+            return
+
         yield from extract_jsonpath(
             self.records_jsonpath,
             input=response.json(parse_float=decimal.Decimal),
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import abc
 import contextlib
+import threading
 import typing as t
 import warnings
 from enum import Enum
 
 import click
+from joblib import Parallel, delayed, parallel_config
 
 from singer_sdk.configuration._dict_config import merge_missing_config_jsonschema
 from singer_sdk.exceptions import (
@@ -64,6 +66,17 @@ class Tap(BaseSingerWriter, metaclass=abc.ABCMeta):  # noqa: PLR0904
     message_writer_class: type[GenericSingerWriter] = SingerWriter
     """The message writer class to use for writing messages."""
 
+    max_concurrent_streams: int = 1
+    """Maximum number of top-level streams to sync concurrently.
+
+    When greater than 1, top-level streams and their child streams are synced in a
+    pool of threads. Only one stream at a time processes records, updates state and
+    writes messages, while other streams wait on their source for the next record.
+    This speeds up taps bound by network I/O, such as REST APIs with many endpoints.
+
+    .. versionadded:: 0.50.0
+    """
+
     #: A list of capabilities supported by this tap.
     capabilities: t.ClassVar[list[CapabilitiesEnum]] = [
         TapCapabilities.CATALOG,
@@ -116,6 +129,7 @@ class Tap(BaseSingerWriter, metaclass=abc.ABCMeta):  # noqa: PLR0904
         self._state: types.TapState = {}
         self._catalog: Catalog | None = None  # Tap's working catalog
         self._state_writer: StateWriter = StateWriter(self.message_writer)
+        self._sync_lock: threading.Lock | None = None
 
         # Process input catalog
         if isinstance(catalog, Catalog):
@@ -475,7 +489,7 @@ class Tap(BaseSingerWriter, metaclass=abc.ABCMeta):  # noqa: PLR0904
         if self.state:
             self._state_writer.write_state(self.state)
 
-        stream: Stream
+        streams: list[Stream] = []
         for stream in self.streams.values():
             if not stream.selected and not stream.has_selected_descendents:
                 self.logger.info("Skipping deselected stream '%s'.", stream.name)
@@ -491,14 +505,66 @@ class Tap(BaseSingerWriter, metaclass=abc.ABCMeta):  # noqa: PLR0904
                 )
                 continue
 
-            stream.sync()
-            stream.finalize_state_progress_markers()
+            streams.append(stream)
+
+        try:
+            if self.max_concurrent_streams > 1 and len(streams) > 1:
+                self._sync_concurrently(streams)
+            else:
+                for stream in streams:
+                    self._sync_stream(stream)
+        finally:
+            self.message_writer.flush()
 
         # this second loop is needed for all streams to print out their costs
         # including child streams which are otherwise skipped in the loop above
         for stream in self.streams.values():
             stream.log_sync_costs()
 
+    @staticmethod
+    def _sync_stream(stream: Stream) -> None:
+        """Sync a top-level stream and its child streams.
+
+        Args:
+            stream: The stream to sync.
+        """
+        stream.sync()
+        stream.finalize_state_progress_markers()
+
+    def _sync_stream_locked(self, stream: Stream) -> None:
+        """Sync a stream in a worker thread, holding the sync lock.
+
+        Args:
+            stream: The stream to sync.
+        """
+        with self._sync_lock:  # type: ignore[union-attr]
+            self._sync_stream(stream)
+
+    def _sync_concurrently(self, streams: list[Stream]) -> None:
+        """Sync top-level streams in a pool of threads.
+
+        The sync lock is held by a worker thread while it processes records, and only
+        released while its stream fetches records from the source. Messages and the
+        tap state are therefore never written by two threads at once.
+
+        Args:
+            streams: The top-level streams to sync.
+        """
+        # Create the state entries of all streams up front, so that streams reading
+        # their state without holding the lock don't add keys to shared dicts.
+        for stream in self.streams.values():
+            if stream.selected or stream.has_selected_descendents:
+                _ = stream.stream_state
+
+        n_jobs = min(self.max_concurrent_streams, len(streams))
+        self.logger.info("Syncing %d streams concurrently.", n_jobs)
+        self._sync_lock = threading.Lock()
+        try:
+            with parallel_config(backend="threading", n_jobs=n_jobs):
+                Parallel()(delayed(self._sync_stream_locked)(s) for s in streams)
+        finally:
+            self._sync_lock = None
+
     # Command Line Execution
 
     def _handle_termination(  # pragma: no cover
@@ -515,7 +581,8 @@ class Tap(BaseSingerWriter, metaclass=abc.ABCMeta):  # noqa: PLR0904
         # Emit a final state message to ensure the state is written to the output
         # even if the process is terminated by a signal.
         try:
-            self._state_writer.write_state(self.state)
+            with self._sync_lock or contextlib.nullcontext():
+                self._state_writer.write_state(self.state)
         finally:
             super()._handle_termination(signum, frame)
 
@@ -35,7 +35,7 @@ if t.TYPE_CHECKING:
     from types import FrameType
 
     from singer_sdk.helpers.capabilities import CapabilitiesEnum
-    from singer_sdk.mapper import PluginMapper
+    from singer_sdk.mapper import PluginMapper, StreamMap
     from singer_sdk.singerlib.encoding.base import GenericSingerReader
     from singer_sdk.sinks import Sink
 
@@ -69,6 +69,23 @@ class Target(BaseSingerReader, metaclass=abc.ABCMeta):
         TargetCapabilities.VALIDATE_RECORDS,
     ]
 
+    _sink_depends_on_record: t.ClassVar[bool] = False
+    """Whether `get_sink` may return different sinks for records of a stream.
+
+    This is set automatically for targets that override `get_sink`, so that blocks
+    of RECORD messages are routed to a sink one record at a time.
+    """
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        """Flag targets whose sink selection may depend on the record.
+
+        Args:
+            kwargs: Keyword arguments passed to the parent class.
+        """
+        super().__init_subclass__(**kwargs)
+        if "get_sink" in vars(cls) and "_sink_depends_on_record" not in vars(cls):
+            cls._sink_depends_on_record = True
+
     def __init__(
         self,
         *,
@@ -319,18 +336,12 @@ class Target(BaseSingerReader, metaclass=abc.ABCMeta):
             self._assert_sink_exists(stream_map.stream_alias)
             sink = self.get_sink(stream_map.stream_alias, record=transformed_record)
             context = sink._get_context(transformed_record)  # noqa: SLF001
-            if sink.include_sdc_metadata_properties:
-                sink._add_sdc_metadata_to_record(  # noqa: SLF001
-                    transformed_record,
-                    message_dict,
-                    context,
-                )
-            else:
-                sink._remove_sdc_metadata_from_record(transformed_record)  # noqa: SLF001
-
-            sink._validate_and_parse(transformed_record)  # noqa: SLF001
-            transformed_record = sink.preprocess_record(transformed_record, context)
-            sink._singer_validate_message(transformed_record)  # noqa: SLF001
+            transformed_record = self._prepare_record(
+                sink,
+                transformed_record,
+                message_dict,
+                context,
+            )
 
             sink.tally_record_read()
             sink.process_record(transformed_record, context)
@@ -347,6 +358,212 @@ class Target(BaseSingerReader, metaclass=abc.ABCMeta):
 
         self._handle_max_record_age()
 
+    def _process_record_messages(self, message_dicts: list[dict]) -> None:
+        """Process a block of consecutive RECORD messages for the same stream.
+
+        Records are mapped, validated and preprocessed a block at a time, and are
+        handed to :meth:`~singer_sdk.Sink.process_records` in chunks that never
+        overflow the sink's :attr:`~singer_sdk.Sink.max_size`. The max record age is
+        checked once per block instead of once per record.
+
+        Args:
+            message_dicts: The RECORD messages, in the order they were received.
+        """
+        for message_dict in message_dicts:
+            self._assert_line_requires(message_dict, requires={"stream", "record"})
+
+        stream_name = message_dicts[0]["stream"]
+        if stream_name not in self.mapper.stream_maps:
+            self._assert_sink_exists(stream_name)
+
+        for stream_map in self.mapper.stream_maps[stream_name]:
+            self._process_mapped_records(stream_map, message_dicts)
+
+        self._handle_max_record_age()
+
+    def _process_mapped_records(
+        self,
+        stream_map: StreamMap,
+        message_dicts: list[dict],
+    ) -> None:
+        """Map a block of RECORD messages and load them in sink-sized chunks.
+
+        The sink and its context are looked up once per chunk, unless the target's
+        `get_sink` or the sink's `_get_context` may depend on the record.
+
+        Args:
+            stream_map: The stream map to apply to the records.
+            message_dicts: The RECORD messages, in the order they were received.
+        """
+        transformed_records = stream_map.transform_batch(
+            [copy.copy(message_dict["record"]) for message_dict in message_dicts],
+        )
+        records: list[dict] = []
+        messages: list[dict] = []
+        for message_dict, transformed_record in zip(
+            message_dicts,
+            transformed_records,
+            strict=True,
+        ):
+            # Records filtered out by the map transform are None
+            if transformed_record is not None:
+                records.append(transformed_record)
+                messages.append(message_dict)
+
+        if not records:
+            return
+
+        self._assert_sink_exists(stream_map.stream_alias)
+        sink = self.get_sink(stream_map.stream_alias, record=records[0])
+        if self._sink_depends_on_record or sink._context_depends_on_record:  # noqa: SLF001
+            self._load_records_by_sink(stream_map.stream_alias, records, messages)
+            return
+
+        start = 0
+        while start < len(records):
+            # Draining the sink starts a new batch, so the context is looked up
+            # again for each chunk.
+            end = start + max(sink.max_size - sink.current_size, 1)
+            context = sink._get_context(records[start])  # noqa: SLF001
+            self._load_records(sink, records[start:end], messages[start:end], context)
+            start = end
+
+    def _load_records_by_sink(
+        self,
+        stream_alias: str,
+        records: list[dict],
+        messages: list[dict],
+    ) -> None:
+        """Load records in chunks of consecutive records that share a sink and context.
+
+        Args:
+            stream_alias: The name of the mapped stream.
+            records: The mapped records.
+            messages: The RECORD message of each record.
+        """
+        sink: Sink | None = None
+        context: dict = {}
+        start = 0
+        capacity = 0
+
+        for index, record in enumerate(records):
+            record_sink = self.get_sink(stream_alias, record=record)
+            record_context = record_sink._get_context(record)  # noqa: SLF001
+            if sink is not None and (
+                record_sink is not sink
+                or (record_context is not context and record_context != context)
+            ):
+                self._load_records(
+                    sink, records[start:index], messages[start:index], context
+                )
+                sink = None
+
+            if sink is None:
+                start = index
+                capacity = max(record_sink.max_size - record_sink.current_size, 1)
+
+            sink, context = record_sink, record_context
+            if index + 1 - start >= capacity:
+                self._load_records(
+                    sink,
+                    records[start : index + 1],
+                    messages[start : index + 1],
+                    context,
+                )
+                sink = None
+
+        if sink is not None:
+            self._load_records(sink, records[start:], messages[start:], context)
+
+    @staticmethod
+    def _prepare_record(
+        sink: Sink,
+        record: dict,
+        message_dict: dict,
+        context: dict,
+    ) -> dict:
+        """Add metadata to, validate and preprocess a record before it is loaded.
+
+        Args:
+            sink: The sink the record is destined for.
+            record: The (mapped) record.
+            message_dict: The RECORD message the record comes from.
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The record, ready to be passed to the sink.
+        """
+        if sink.include_sdc_metadata_properties:
+            sink._add_sdc_metadata_to_record(record, message_dict, context)  # noqa: SLF001
+        else:
+            sink._remove_sdc_metadata_from_record(record)  # noqa: SLF001
+
+        sink._validate_and_parse(record)  # noqa: SLF001
+        record = sink.preprocess_record(record, context)
+        sink._singer_validate_message(record)  # noqa: SLF001
+        return record
+
+    @staticmethod
+    def _prepare_records(
+        sink: Sink,
+        records: list[dict],
+        message_dicts: list[dict],
+        context: dict,
+    ) -> list[dict]:
+        """Add metadata to, validate and preprocess a block of records.
+
+        Args:
+            sink: The sink the records are destined for.
+            records: The (mapped) records.
+            message_dicts: The RECORD message each record comes from.
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The records, ready to be passed to the sink.
+        """
+        if sink.include_sdc_metadata_properties:
+            sink._add_sdc_metadata_to_records(records, message_dicts, context)  # noqa: SLF001
+        else:
+            sink._remove_sdc_metadata_from_records(records)  # noqa: SLF001
+
+        records = sink._validate_and_parse_records(records)  # noqa: SLF001
+        prepared = []
+        for record in records:
+            prepared_record = sink.preprocess_record(record, context)
+            sink._singer_validate_message(prepared_record)  # noqa: SLF001
+            prepared.append(prepared_record)
+        return prepared
+
+    def _load_records(
+        self,
+        sink: Sink,
+        records: list[dict],
+        message_dicts: list[dict],
+        context: dict,
+    ) -> None:
+        """Prepare a chunk of records and hand it to a sink, draining it if full.
+
+        Args:
+            sink: The sink to load the records into.
+            records: Records that share the same sink and context.
+            message_dicts: The RECORD message each record comes from.
+            context: Stream partition or context dictionary.
+        """
+        records = self._prepare_records(sink, records, message_dicts, context)
+        count = len(records)
+        sink.tally_record_read(count)
+        sink.process_records(records, context)
+        sink.record_counter_metric.increment(count)
+        sink._after_process_records(context, count)  # noqa: SLF001
+
+        if sink.is_full:
+            self.logger.info(
+                "Target sink for '%s' is full. Current size is '%s'. Draining...",
+                sink.stream_name,
+                sink.current_size,
+            )
+            self.drain_one(sink)
+
     def _process_schema_message(self, message_dict: dict) -> None:
         """Process a SCHEMA messages.
 
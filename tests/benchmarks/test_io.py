@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import itertools
 import json
+import os
+from contextlib import redirect_stdout
 
 import pytest
 
@@ -67,3 +69,29 @@ def test_bench_deserialize_json(benchmark, bench_encoded_record: str):
             reader.deserialize_json(record)
 
     benchmark(run_deserialize_json)
+
+
+@pytest.mark.parametrize("buffer_size", [0, 1 << 16], ids=["unbuffered", "buffered"])
+def test_bench_write_message(
+    benchmark,
+    bench_record_message: RecordMessage,
+    buffer_size: int,
+):
+    """Run benchmark for writing messages to stdout."""
+    from singer_sdk.singerlib.encoding import SimpleSingerWriter  # noqa: PLC0415
+
+    number_of_runs = 1000
+
+    class Writer(SimpleSingerWriter):
+        pass
+
+    Writer.buffer_size = buffer_size
+    writer = Writer()
+
+    def run_write_message():
+        for record in itertools.repeat(bench_record_message, number_of_runs):
+            writer.write_message(record)
+        writer.flush()
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):  # noqa: PLW1514, PTH123
+        benchmark(run_write_message)
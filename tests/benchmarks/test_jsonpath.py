@@ -0,0 +1,43 @@
+"""Test JSONPath record extraction throughput."""
+
+from __future__ import annotations
+
+import pytest
+
+from singer_sdk.helpers.jsonpath import extract_jsonpath
+
+NUMBER_OF_RECORDS = 10_000
+
+
+@pytest.fixture
+def bench_page() -> dict:
+    return {
+        "data": {
+            "results": [
+                {
+                    "Id": i,
+                    "created_at": "2021-01-01T00:08:00-07:00",
+                    "value": 1.23,
+                    "tags": ["a", "b"],
+                }
+                for i in range(NUMBER_OF_RECORDS)
+            ],
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        pytest.param("$.data.results[*]", id="simple"),
+        pytest.param("$.data.results[?(@.Id >= 0)]", id="filter"),
+    ],
+)
+def test_bench_extract_jsonpath(benchmark, bench_page: dict, expression: str):
+    """Run benchmark for extract_jsonpath on a page of records."""
+
+    def run_extract_jsonpath():
+        records = list(extract_jsonpath(expression, input=bench_page))
+        assert len(records) == NUMBER_OF_RECORDS
+
+    benchmark(run_extract_jsonpath)
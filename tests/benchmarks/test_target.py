@@ -0,0 +1,113 @@
+"""Test target record processing throughput."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+
+import pytest
+
+from tests.conftest import TargetMock
+
+NUMBER_OF_RECORDS = 10_000
+
+
+@pytest.fixture
+def bench_input_lines() -> str:
+    schema_message = {
+        "type": "SCHEMA",
+        "stream": "users",
+        "schema": {
+            "properties": {
+                "Id": {"type": "integer"},
+                "created_at": {"type": "string", "format": "date-time"},
+                "updated_at": {"type": "string", "format": "date-time"},
+                "value": {"type": "number"},
+                "TypeId": {"type": "integer"},
+            },
+        },
+        "key_properties": ["Id"],
+    }
+    lines = [json.dumps(schema_message)]
+    lines.extend(
+        json.dumps(
+            {
+                "type": "RECORD",
+                "stream": "users",
+                "record": {
+                    "Id": i,
+                    "created_at": "2021-01-01T00:08:00-07:00",
+                    "updated_at": "2022-01-02T00:09:00-07:00",
+                    "value": 1.23,
+                    "TypeId": 1,
+                },
+            }
+        )
+        for i in range(NUMBER_OF_RECORDS)
+    )
+    return "\n".join(lines) + "\n"
+
+
+@pytest.fixture
+def bench_messages(bench_input_lines: str) -> list[dict]:
+    return [json.loads(line) for line in bench_input_lines.splitlines()]
+
+
+@pytest.mark.parametrize(
+    "record_batch_size",
+    [
+        pytest.param(None, id="per-record"),
+        pytest.param(1000, id="batched"),
+    ],
+)
+def test_bench_target_process_lines(
+    benchmark,
+    bench_input_lines: str,
+    record_batch_size: int | None,
+):
+    """Run benchmark for Target.process_lines with and without record batching."""
+
+    class BenchTarget(TargetMock):
+        pass
+
+    BenchTarget.record_batch_size = record_batch_size
+
+    def run_process_lines():
+        target = BenchTarget(config={"validate_records": False})
+        with contextlib.redirect_stdout(io.StringIO()):
+            target.process_lines(io.StringIO(bench_input_lines))
+        assert target.num_records_processed == NUMBER_OF_RECORDS
+
+    benchmark(run_process_lines)
+
+
+@pytest.mark.parametrize(
+    "record_batch_size",
+    [
+        pytest.param(None, id="per-record"),
+        pytest.param(1000, id="batched"),
+    ],
+)
+def test_bench_target_record_dispatch(
+    benchmark,
+    bench_messages: list[dict],
+    record_batch_size: int | None,
+):
+    """Run benchmark for dispatching parsed RECORD messages to a sink."""
+    schema_message, *record_messages = bench_messages
+
+    def run_dispatch():
+        target = TargetMock(config={"validate_records": False})
+        target._process_schema_message(schema_message)
+        if record_batch_size is None:
+            for message in record_messages:
+                target._process_record_message(message)
+        else:
+            for start in range(0, len(record_messages), record_batch_size):
+                target._process_record_messages(
+                    record_messages[start : start + record_batch_size],
+                )
+        assert target.num_records_processed == NUMBER_OF_RECORDS
+
+    benchmark(run_dispatch)
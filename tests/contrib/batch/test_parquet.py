@@ -123,3 +123,35 @@ def test_batcher_with_parquet_encoding():
         for batch in batches
         for filepath in batch
     )
+
+
+@skip_if_no_pyarrow
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_batcher_from_arrow(tmp_path: Path, compression: str | None) -> None:
+    import pyarrow as pa  # noqa: PLC0415
+    import pyarrow.parquet as pq  # noqa: PLC0415
+
+    config = BatchConfig(
+        encoding=BaseBatchFileEncoding(format="parquet", compression=compression),
+        storage=StorageTarget(root=str(tmp_path)),
+        batch_size=4,
+    )
+    batcher = ParquetBatcher("tap", "stream", config)
+    record_batches = [
+        pa.RecordBatch.from_pylist([{"id": i} for i in range(start, stop)])
+        for start, stop in ((0, 3), (3, 3), (3, 10))
+    ]
+
+    batches = list(batcher.get_batches_from_arrow(record_batches))
+    assert all(len(batch) == 1 for batch in batches)
+    assert all(
+        batch[0].endswith(".parquet.gz" if compression else ".parquet")
+        for batch in batches
+    )
+
+    tables = [pq.read_table(path) for path in sorted(tmp_path.iterdir())]
+    assert len(tables) == len(batches)
+    assert [table.num_rows for table in tables] == [4, 4, 2]
+    assert [row["id"] for table in tables for row in table.to_pylist()] == list(
+        range(10)
+    )
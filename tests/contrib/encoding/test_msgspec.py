@@ -121,3 +121,22 @@ def test_write_message():
     assert out.read() == (
         '{"type":"RECORD","stream":"test","record":{"id":1,"name":"test"}}\n'
     )
+
+
+def test_write_message_buffered():
+    class BufferedWriter(MsgSpecWriter):
+        buffer_size = 150
+        flush_interval = 3600
+
+    writer = BufferedWriter()
+    line = '{"type":"RECORD","stream":"test","record":{"id":1}}\n'
+    with redirect_stdout(io.TextIOWrapper(io.BytesIO())) as out:  # noqa: PLW1514
+        writer.write_message(RecordMessage(stream="test", record={"id": 1}))
+        writer.write_message(RecordMessage(stream="test", record={"id": 1}))
+        out.seek(0)
+        assert not out.read()
+
+        # The buffer is written once it reaches the buffer size
+        writer.write_message(RecordMessage(stream="test", record={"id": 1}))
+        out.seek(0)
+        assert out.read() == line * 3
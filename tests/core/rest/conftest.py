@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import json
+import threading
 import typing as t
 from functools import cached_property
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 from requests.auth import HTTPProxyAuth
 
 from singer_sdk.authenticators import APIAuthenticatorBase, SingletonMeta
+from singer_sdk.pagination import BasePageNumberPaginator
 from singer_sdk.streams import RESTStream
 from singer_sdk.tap_base import Tap
 
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 class SingletonAuthenticator(APIAuthenticatorBase, metaclass=SingletonMeta):
     """A singleton authenticator."""
@@ -86,3 +94,97 @@ class SimpleTap(Tap):
 def rest_tap():
     """Create a RESTful tap instance."""
     return SimpleTap()
+
+
+PAGES = 3
+PAGE_SIZE = 2
+
+
+class PageServer(ThreadingHTTPServer):
+    """A local API server with a fixed number of pages."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), PageHandler)
+        self.requested_pages: list[int] = []
+        self.page_requested = threading.Condition()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def wait_for_page(self, page: int) -> bool:
+        with self.page_requested:
+            return self.page_requested.wait_for(
+                lambda: page in self.requested_pages,
+                timeout=5,
+            )
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    server: PageServer
+
+    def do_GET(self) -> None:
+        query = parse_qs(urlparse(self.path).query)
+        page = int(query["page"][0])
+        with self.server.page_requested:
+            self.server.requested_pages.append(page)
+            self.server.page_requested.notify_all()
+
+        start = (page - 1) * PAGE_SIZE
+        data = (
+            [{"id": i} for i in range(start, start + PAGE_SIZE)]
+            if page <= PAGES
+            else []
+        )
+        body = json.dumps({"data": data, "has_more": page < PAGES}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: t.Any) -> None:
+        pass
+
+
+class HasMorePaginator(BasePageNumberPaginator):
+    def has_more(self, response) -> bool:
+        return response.json()["has_more"]
+
+
+class PageStream(RESTStream[int]):
+    name = "pages"
+    path = "/items"
+    records_jsonpath = "$.data[*]"
+    schema: t.ClassVar[dict] = {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}},
+    }
+
+    def __init__(self, tap: Tap, url_base: str) -> None:
+        self._url_base = url_base
+        super().__init__(tap)
+
+    @property
+    def url_base(self) -> str:
+        return self._url_base
+
+    def get_new_paginator(self) -> BasePageNumberPaginator:
+        return HasMorePaginator(1)
+
+    def get_url_params(self, context, next_page_token):  # noqa: ARG002
+        return {"page": next_page_token}
+
+
+@pytest.fixture
+def server() -> Iterator[PageServer]:
+    with PageServer() as server:
+        thread = threading.Thread(
+            target=server.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            daemon=True,
+        )
+        thread.start()
+        yield server
+        server.shutdown()
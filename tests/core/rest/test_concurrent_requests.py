@@ -0,0 +1,112 @@
+"""Test REST streams with several requests in flight."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from tests.core.rest.conftest import (
+    PAGE_SIZE,
+    PAGES,
+    HasMorePaginator,
+    PageStream,
+)
+
+if t.TYPE_CHECKING:
+    from singer_sdk.pagination import BasePageNumberPaginator
+    from singer_sdk.tap_base import Tap
+    from tests.core.rest.conftest import PageServer
+
+
+class UnpredictablePaginator(HasMorePaginator):
+    def predict_next(self, value: int) -> None:  # noqa: ARG002
+        return None
+
+
+class PipelinedPageStream(PageStream):
+    max_concurrent_requests = 2
+
+    def get_new_paginator(self) -> BasePageNumberPaginator:
+        return UnpredictablePaginator(1)
+
+
+class PrefetchPageStream(PageStream):
+    max_concurrent_requests = 3
+
+
+@pytest.mark.parametrize(
+    "stream_class",
+    [PageStream, PipelinedPageStream, PrefetchPageStream],
+)
+def test_request_records(
+    tap: Tap,
+    server: PageServer,
+    stream_class: type[PageStream],
+):
+    stream = stream_class(tap, server.url)
+    records = list(stream.request_records(None))
+    assert records == [{"id": i} for i in range(PAGES * PAGE_SIZE)]
+
+    # Pages after the last one may have been requested ahead of time
+    max_page = PAGES + stream.max_concurrent_requests - 1
+    assert {1, 2, 3} <= set(server.requested_pages) <= set(range(1, max_page + 1))
+    if stream_class is not PrefetchPageStream:
+        assert server.requested_pages == [1, 2, 3]
+
+
+def test_request_records_pipelined(tap: Tap, server: PageServer):
+    stream = PipelinedPageStream(tap, server.url)
+    records = stream.request_records(None)
+
+    assert next(records) == {"id": 0}
+    # The second page is requested while the first one is processed
+    assert server.wait_for_page(2)
+    assert server.requested_pages == [1, 2]
+
+    assert list(records) == [{"id": i} for i in range(1, PAGES * PAGE_SIZE)]
+    assert server.requested_pages == [1, 2, 3]
+
+
+def test_request_records_pipelined_empty_page(tap: Tap, server: PageServer):
+    class EndlessPaginator(UnpredictablePaginator):
+        def has_more(self, response) -> bool:  # noqa: ARG002
+            return True
+
+    class EndlessStream(PipelinedPageStream):
+        def get_new_paginator(self) -> BasePageNumberPaginator:
+            return EndlessPaginator(1)
+
+    stream = EndlessStream(tap, server.url)
+    records = list(stream.request_records(None))
+    assert records == [{"id": i} for i in range(PAGES * PAGE_SIZE)]
+    # Pagination stops at the first empty page, without requesting another one
+    assert server.requested_pages == [1, 2, 3, 4]
+
+
+def test_request_records_prefetch(tap: Tap, server: PageServer):
+    stream = PrefetchPageStream(tap, server.url)
+    records = stream.request_records(None)
+
+    assert next(records) == {"id": 0}
+    # All pages are requested before the first one is processed
+    assert server.wait_for_page(3)
+
+    assert list(records) == [{"id": i} for i in range(1, PAGES * PAGE_SIZE)]
+
+
+def test_request_records_prefetch_wrong_prediction(tap: Tap, server: PageServer):
+    class SkippingPaginator(HasMorePaginator):
+        def get_next(self, response) -> int:  # noqa: ARG002
+            return self.current_value + 2
+
+    class SkippingStream(PrefetchPageStream):
+        def get_new_paginator(self) -> BasePageNumberPaginator:
+            return SkippingPaginator(1)
+
+    stream = SkippingStream(tap, server.url)
+    records = list(stream.request_records(None))
+
+    # Pages 1 and 3, but not the predicted page 2
+    assert records == [{"id": i} for i in (0, 1, 4, 5)]
+    assert {1, 3} <= set(server.requested_pages)
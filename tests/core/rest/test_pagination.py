@@ -521,3 +521,9 @@ def test_no_paginator(tap: Tap):
 
     with pytest.raises(StopIteration):
         next(records_iter)
+
+
+def test_paginator_predict_next():
+    assert BasePageNumberPaginator(1).predict_next(3) == 4
+    assert BaseOffsetPaginator(0, page_size=100).predict_next(200) == 300
+    assert JSONPathPaginator("$.next").predict_next("abc") is None
@@ -0,0 +1,189 @@
+"""Test client-side rate limiting."""
+
+from __future__ import annotations
+
+import email.utils
+import threading
+import time
+import typing as t
+
+import pytest
+from requests import Response
+
+from singer_sdk import rate_limiting
+from singer_sdk.rate_limiting import RateLimiter, _parse_retry_after
+from tests.core.rest.conftest import PAGE_SIZE, PAGES, PageStream
+
+if t.TYPE_CHECKING:
+    from singer_sdk.tap_base import Tap
+    from tests.core.rest.conftest import PageServer
+
+
+class FakeClock:
+    """Replace the clock of the rate limiter with one that only moves on waits."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return 1_700_000_000 + self.now
+
+    def wait(self, timeout: float | None = None) -> bool:
+        assert timeout is not None, "Waiting for a request in flight"
+        self.now += timeout
+        return False
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiting, "time", clock)
+    return clock
+
+
+def _response(status_code: int = 200, **headers: str) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response.headers.update({k.replace("_", "-"): v for k, v in headers.items()})
+    return response
+
+
+def _timed_acquire(limiter: RateLimiter, clock: FakeClock) -> float:
+    limiter._condition.wait = clock.wait  # type: ignore[method-assign]
+    start = clock.now
+    limiter.acquire()
+    return clock.now - start
+
+
+def test_request_rate(clock: FakeClock):
+    limiter = RateLimiter(requests_per_second=4, burst=2)
+
+    # The burst is available right away
+    assert _timed_acquire(limiter, clock) == 0
+    assert _timed_acquire(limiter, clock) == 0
+    limiter.release(_response())
+    limiter.release(_response())
+
+    assert _timed_acquire(limiter, clock) == 0.25
+
+
+def test_concurrency_limit():
+    limiter = RateLimiter(max_concurrency=1)
+    limiter.acquire()
+    acquired = threading.Event()
+
+    def acquire():
+        limiter.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=acquire)
+    thread.start()
+    assert not acquired.wait(0.05)
+
+    limiter.release(_response())
+    assert acquired.wait(1)
+    thread.join()
+
+
+def test_aimd():
+    limiter = RateLimiter(max_concurrency=8, min_concurrency=2)
+    assert limiter.concurrency_limit == 8
+
+    for expected in (4, 2, 2):
+        limiter.acquire()
+        limiter.release(_response(429))
+        assert limiter.concurrency_limit == expected
+
+    for _ in range(10):
+        limiter.acquire()
+        limiter.release(_response())
+    assert 2 < limiter.concurrency_limit < 8
+
+    for _ in range(100):
+        limiter.acquire()
+        limiter.release(_response())
+    assert limiter.concurrency_limit == 8
+
+
+def test_no_concurrency_limit_until_throttled():
+    limiter = RateLimiter()
+    for _ in range(3):
+        limiter.acquire()
+    assert limiter.concurrency_limit is None
+
+    limiter.release(_response(429))
+    assert limiter.concurrency_limit == 1
+
+
+def test_aimd_concurrent_throttles():
+    """Throttled requests sent before the limit was halved don't halve it again."""
+    limiter = RateLimiter(max_concurrency=16)
+    for _ in range(8):
+        limiter.acquire()
+
+    for _ in range(8):
+        limiter.release(_response(429))
+    assert limiter.concurrency_limit == 8
+
+    # Requests sent after the cut can halve the limit again
+    limiter.acquire()
+    limiter.release(_response(429))
+    assert limiter.concurrency_limit == 4
+
+
+@pytest.mark.parametrize(
+    "get_headers",
+    [
+        pytest.param(lambda _clock: {"Retry-After": "0.1"}, id="retry-after-seconds"),
+        pytest.param(
+            lambda _clock: {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0.1"},
+            id="x-ratelimit-reset-seconds",
+        ),
+        pytest.param(
+            lambda clock: {
+                "RateLimit-Remaining": "0",
+                "RateLimit-Reset": str(clock.time() + 0.1),
+            },
+            id="ratelimit-reset-epoch",
+        ),
+    ],
+)
+def test_pause(
+    clock: FakeClock,
+    get_headers: t.Callable[[FakeClock], dict[str, str]],
+):
+    limiter = RateLimiter()
+    limiter.acquire()
+    limiter.release(_response(**get_headers(clock)))
+    assert _timed_acquire(limiter, clock) == pytest.approx(0.1)
+
+
+def test_parse_retry_after_date():
+    retry_after = email.utils.formatdate(time.time() + 10, usegmt=True)
+    assert 9 <= _parse_retry_after(retry_after) <= 10
+    assert _parse_retry_after("invalid") is None
+
+
+def test_no_pause(clock: FakeClock):
+    limiter = RateLimiter()
+    limiter.acquire()
+    limiter.release(_response(X_RateLimit_Remaining="10", X_RateLimit_Reset="60"))
+    assert _timed_acquire(limiter, clock) == 0
+
+
+def test_stream_rate_limiter(tap: Tap, server: PageServer):
+    rate_limiter = RateLimiter(requests_per_second=100)
+
+    class RateLimitedStream(PageStream):
+        def get_rate_limiter(self) -> RateLimiter:
+            return rate_limiter
+
+    stream = RateLimitedStream(tap, server.url)
+    assert stream.rate_limiter is rate_limiter
+
+    records = list(stream.request_records(None))
+    assert records == [{"id": i} for i in range(PAGES * PAGE_SIZE)]
+    assert rate_limiter._in_flight == 0
@@ -0,0 +1,166 @@
+"""Test reading BATCH files in sinks."""
+
+from __future__ import annotations
+
+import gzip
+import importlib.util
+import json
+import typing as t
+
+import pytest
+
+from singer_sdk.helpers._batch import BaseBatchFileEncoding
+from tests.conftest import BatchSinkMock, TargetMock
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+}
+RECORDS = [{"id": i, "name": f"name-{i}"} for i in range(10)]
+
+skip_if_no_pyarrow = pytest.mark.skipif(
+    not importlib.util.find_spec("pyarrow"),
+    reason="requires pyarrow",
+)
+
+
+class ChunkedSink(BatchSinkMock):
+    process_batch_files_in_chunks = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.contexts: list[dict] = []
+
+    def process_batch(self, context: dict) -> None:
+        self.contexts.append(context)
+        if "records" in context:
+            super().process_batch(context)
+
+
+class ArrowSink(ChunkedSink):
+    accepts_arrow_batches = True
+
+
+def _write_jsonl(path: Path, *, compression: str | None) -> str:
+    lines = "".join(json.dumps(record) + "\n" for record in RECORDS).encode()
+    path.write_bytes(gzip.compress(lines) if compression == "gzip" else lines)
+    return path.as_uri()
+
+
+def _write_parquet(path: Path) -> str:
+    import pyarrow as pa  # noqa: PLC0415
+    import pyarrow.parquet as pq  # noqa: PLC0415
+
+    pq.write_table(pa.Table.from_pylist(RECORDS), path)
+    return path.as_uri()
+
+
+def _make_sink(sink_class: type[BatchSinkMock], batch_size_rows: int | None):
+    config = {} if batch_size_rows is None else {"batch_size_rows": batch_size_rows}
+    target = TargetMock(config=config)
+    return sink_class(target, "users", SCHEMA, ["id"])
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+@pytest.mark.parametrize(
+    "sink_class,batch_size_rows,chunk_sizes",
+    [
+        pytest.param(BatchSinkMock, 4, [10, 10], id="whole-files"),
+        pytest.param(ChunkedSink, 4, [4, 4, 2, 4, 4, 2], id="chunked"),
+        pytest.param(ChunkedSink, 5, [5, 5, 5, 5], id="chunked-exact"),
+        pytest.param(ChunkedSink, None, [10, 10], id="chunked-default-size"),
+    ],
+)
+def test_process_jsonl_batch_files(
+    tmp_path: Path,
+    compression: str | None,
+    sink_class: type[BatchSinkMock],
+    batch_size_rows: int | None,
+    chunk_sizes: list[int],
+):
+    sink = _make_sink(sink_class, batch_size_rows)
+    files = [
+        _write_jsonl(tmp_path / f"{i}.jsonl", compression=compression) for i in range(2)
+    ]
+    encoding = BaseBatchFileEncoding(format="jsonl", compression=compression)
+    sink.process_batch_files(encoding, files)
+
+    assert sink.target.records_written == RECORDS * 2
+    assert sink.target.num_batches_processed == len(chunk_sizes)
+    if isinstance(sink, ChunkedSink):
+        assert [len(c["records"]) for c in sink.contexts] == chunk_sizes
+
+
+@skip_if_no_pyarrow
+@pytest.mark.parametrize(
+    "sink_class,batch_size_rows,chunk_sizes",
+    [
+        pytest.param(BatchSinkMock, 4, [10], id="whole-file"),
+        pytest.param(ChunkedSink, 4, [4, 4, 2], id="chunked"),
+    ],
+)
+def test_process_parquet_batch_files(
+    tmp_path: Path,
+    sink_class: type[BatchSinkMock],
+    batch_size_rows: int | None,
+    chunk_sizes: list[int],
+):
+    sink = _make_sink(sink_class, batch_size_rows)
+    encoding = BaseBatchFileEncoding(format="parquet")
+    sink.process_batch_files(encoding, [_write_parquet(tmp_path / "0.parquet")])
+
+    assert sink.target.records_written == RECORDS
+    assert sink.target.num_batches_processed == len(chunk_sizes)
+    if isinstance(sink, ChunkedSink):
+        assert [len(c["records"]) for c in sink.contexts] == chunk_sizes
+
+
+@skip_if_no_pyarrow
+def test_process_parquet_batch_files_as_arrow(tmp_path: Path):
+    sink = _make_sink(ArrowSink, 4)
+    encoding = BaseBatchFileEncoding(format="parquet")
+    sink.process_batch_files(encoding, [_write_parquet(tmp_path / "0.parquet")])
+
+    assert [c["arrow_table"].num_rows for c in sink.contexts] == [4, 4, 2]
+    assert [
+        row for c in sink.contexts for row in c["arrow_table"].to_pylist()
+    ] == RECORDS
+    assert sink.target.records_written == []
+
+
+def test_process_batch_files_unsupported_format(tmp_path: Path):
+    sink = _make_sink(ChunkedSink, 4)
+    encoding = BaseBatchFileEncoding(format="csv")
+    with pytest.raises(NotImplementedError, match="Unsupported batch encoding"):
+        sink.process_batch_files(encoding, [(tmp_path / "0.csv").as_uri()])
+
+
+class ParallelSink(ChunkedSink):
+    max_parallel_batch_files = 3
+
+
+class ProcessPoolSink(ParallelSink):
+    batch_file_parallel_backend = "loky"
+
+
+@pytest.mark.parametrize("sink_class", [ParallelSink, ProcessPoolSink])
+def test_process_batch_files_in_parallel(
+    tmp_path: Path,
+    sink_class: type[BatchSinkMock],
+):
+    sink = _make_sink(sink_class, 4)
+    files = []
+    for i in range(5):
+        path = tmp_path / f"{i}.jsonl"
+        path.write_text(json.dumps({"id": i, "name": f"file-{i}"}) + "\n")
+        files.append(path.as_uri())
+
+    encoding = BaseBatchFileEncoding(format="jsonl")
+    sink.process_batch_files(encoding, files)
+
+    # Files are processed in manifest order
+    assert [record["id"] for record in sink.target.records_written] == list(range(5))
+    assert sink.target.num_batches_processed == 5
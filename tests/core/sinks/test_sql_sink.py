@@ -8,9 +8,14 @@ import sqlalchemy
 import sqlalchemy.types
 
 from singer_sdk.connectors import SQLConnector
+from singer_sdk.exceptions import ConformedNameClashException
 from singer_sdk.sinks.sql import SQLSink
+from singer_sdk.sql import sink as sql_sink
 from singer_sdk.target_base import SQLTarget
 
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
 if sys.version_info >= (3, 12):
     from typing import override  # noqa: ICN003
 else:
@@ -165,3 +170,323 @@ class TestSQLSink:
 
         assert sink.table_name == expected_table_name
         assert sink.schema_name == expected_schema_name
+
+    @pytest.mark.parametrize("chunk_size", [1, 10_000])
+    @pytest.mark.parametrize("positional", [True, False], ids=["driver", "sqlalchemy"])
+    def test_bulk_insert_arrow_table(
+        self,
+        tmp_path: Path,
+        schema: dict,
+        monkeypatch: pytest.MonkeyPatch,
+        chunk_size: int,
+        positional: bool,
+    ):
+        """Arrow tables are inserted with conformed column names."""
+        pa = pytest.importorskip("pyarrow")
+        monkeypatch.setattr(sql_sink, "ARROW_INSERT_CHUNK_SIZE", chunk_size)
+        if not positional:
+            monkeypatch.setattr(
+                sql_sink,
+                "_compile_positional_insert",
+                lambda *args: None,  # noqa: ARG005
+            )
+
+        target = DummySQLTarget(
+            config={"sqlalchemy_url": f"sqlite:///{tmp_path / 'db.sqlite'}"},
+        )
+        sink = DummySQLSink(
+            target,
+            stream_name="foo",
+            schema=schema,
+            key_properties=["id"],
+        )
+        sink.setup()
+
+        table = pa.table(
+            {
+                "ID": ["1", "2"],
+                "col_ts": ["2021-01-01T00:00:00Z", None],
+                "not_in_schema": [1, 2],
+            },
+        )
+        sink.process_batch({"arrow_table": table})
+
+        with sink.connector._connect() as conn:
+            rows = conn.execute(sqlalchemy.text("SELECT * FROM foo")).all()
+        assert [tuple(row) for row in rows] == [
+            ("1", "2021-01-01T00:00:00Z", None),
+            ("2", None, None),
+        ]
+
+    def test_compile_positional_insert(self, sink: DummySQLSink, schema: dict):
+        dialect = sink.connector._engine.dialect
+        statement = sink.generate_insert_statement("foo", schema)
+        assert sql_sink._compile_positional_insert(statement, dialect) == (
+            'INSERT INTO foo (id, col_ts, "table") VALUES (?, ?, ?)',
+            ["id", "col_ts", "table"],
+        )
+
+        # Statements with values of their own are executed by SQLAlchemy
+        statement = statement.values(id="1")
+        assert sql_sink._compile_positional_insert(statement, dialect) is None
+
+        # Column types that convert their values are executed by SQLAlchemy
+        table = sqlalchemy.Table(
+            "foo",
+            sqlalchemy.MetaData(),
+            sqlalchemy.Column("id", sqlalchemy.String),
+            sqlalchemy.Column("col_ts", sqlalchemy.DateTime),
+        )
+        statement = sqlalchemy.insert(table)
+        assert sql_sink._compile_positional_insert(statement, dialect) is None
+
+    def test_conform_record(self, sink: DummySQLSink, monkeypatch: pytest.MonkeyPatch):
+        """Column names are conformed once per key."""
+        conformed_keys: list[str] = []
+        conform_name = sink.conform_name
+
+        def tracked_conform_name(name: str, object_type: str | None = None) -> str:
+            conformed_keys.append(name)
+            return conform_name(name, object_type)
+
+        monkeypatch.setattr(sink, "conform_name", tracked_conform_name)
+
+        assert sink.conform_record({"Id": 1, "1st": "a"}) == {"id": 1, "bst": "a"}
+        assert sink.conform_record({"Id": 2, "col-ts": "b"}) == {
+            "id": 2,
+            "col_ts": "b",
+        }
+        assert sorted(conformed_keys) == ["1st", "Id", "col-ts"]
+
+    def test_conform_record_clash(self, sink: DummySQLSink):
+        """Keys clash only if they conform to the same name in the same record."""
+        assert sink.conform_record({"ID": 1}) == {"id": 1}
+        assert sink.conform_record({"Id": 2}) == {"id": 2}
+
+        with pytest.raises(ConformedNameClashException, match="Duplicate"):
+            sink.conform_record({"ID": 3, "Id": 3})
+
+    @pytest.mark.parametrize(
+        "records",
+        [
+            pytest.param(
+                [{"id": "1", "col_ts": "2021-01-01T00:00:00Z"}, {"id": "2"}],
+                id="conformant",
+            ),
+            pytest.param(
+                [{"ID": "1", "Col.TS": "2021-01-01T00:00:00Z"}, {"Id": "2"}],
+                id="non-conformant",
+            ),
+        ],
+    )
+    def test_bulk_insert_records(
+        self,
+        tmp_path: Path,
+        schema: dict,
+        records: list[dict],
+    ):
+        target = DummySQLTarget(
+            config={"sqlalchemy_url": f"sqlite:///{tmp_path / 'db.sqlite'}"},
+        )
+        sink = DummySQLSink(
+            target,
+            stream_name="foo",
+            schema=schema,
+            key_properties=["id"],
+        )
+        sink.setup()
+        sink.process_batch({"records": records})
+
+        with sink.connector._connect() as conn:
+            rows = conn.execute(sqlalchemy.text("SELECT * FROM foo")).all()
+        assert [tuple(row) for row in rows] == [
+            ("1", "2021-01-01T00:00:00Z", None),
+            ("2", None, None),
+        ]
+        # Input records are left untouched
+        assert "table" not in records[0]
+
+    def test_bulk_insert_records_reuses_plan(
+        self,
+        tmp_path: Path,
+        schema: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """The insert statement is generated once for all batches."""
+        target = DummySQLTarget(
+            config={"sqlalchemy_url": f"sqlite:///{tmp_path / 'db.sqlite'}"},
+        )
+        sink = DummySQLSink(
+            target,
+            stream_name="foo",
+            schema=schema,
+            key_properties=["id"],
+        )
+        sink.setup()
+
+        statements = []
+        generate_insert_statement = sink.generate_insert_statement
+
+        def tracked_generate_insert_statement(*args, **kwargs):
+            statements.append(generate_insert_statement(*args, **kwargs))
+            return statements[-1]
+
+        monkeypatch.setattr(
+            sink,
+            "generate_insert_statement",
+            tracked_generate_insert_statement,
+        )
+
+        sink.process_batch({"records": [{"id": "1", "col_ts": None, "table": "a"}]})
+        sink.process_batch({"records": [{"id": "2", "extra": True}, {"id": "3"}]})
+        assert len(statements) == 1
+
+        with sink.connector._connect() as conn:
+            rows = conn.execute(sqlalchemy.text("SELECT * FROM foo")).all()
+        assert [tuple(row) for row in rows] == [
+            ("1", None, "a"),
+            ("2", None, None),
+            ("3", None, None),
+        ]
+
+
+class UpsertSQLConnector(DummySQLConnector):
+    allow_merge_upsert = True
+
+
+class UpsertSQLSink(SQLSink):
+    connector_class = UpsertSQLConnector
+
+
+class TestSQLSinkUpsert:
+    @pytest.fixture
+    def schema(self) -> dict:
+        return {
+            "properties": {
+                "ID": {"type": ["string"]},
+                "value": {"type": ["string", "null"]},
+                "table": {"type": ["string", "null"]},
+            },
+        }
+
+    @pytest.fixture(
+        params=[
+            pytest.param((None, True), id="on-conflict"),
+            pytest.param(("delete-insert", True), id="delete-insert"),
+            pytest.param(("delete-insert", False), id="delete-insert-no-temp-tables"),
+        ],
+    )
+    def sink(
+        self,
+        request: pytest.FixtureRequest,
+        tmp_path: Path,
+        schema: dict,
+    ) -> UpsertSQLSink:
+        strategy, allow_temp_tables = request.param
+        target = DummySQLTarget(
+            config={
+                "sqlalchemy_url": f"sqlite:///{tmp_path / 'db.sqlite'}",
+                "load_method": "upsert",
+            },
+        )
+        sink = UpsertSQLSink(
+            target,
+            stream_name="foo",
+            schema=schema,
+            key_properties=["ID"],
+        )
+        sink.connector.merge_upsert_strategy = strategy
+        sink.connector.allow_temp_tables = allow_temp_tables
+        sink.setup()
+        return sink
+
+    def _select(self, sink: UpsertSQLSink, query: str) -> list[tuple]:
+        with sink.connector._connect() as conn:
+            return [tuple(row) for row in conn.execute(sqlalchemy.text(query))]
+
+    @pytest.mark.parametrize("as_arrow", [False, True], ids=["records", "arrow"])
+    def test_upsert(self, sink: UpsertSQLSink, schema: dict, as_arrow: bool):
+        batches = [
+            [
+                {"ID": "1", "value": "a", "table": "x"},
+                {"ID": "2", "value": "b"},
+            ],
+            [
+                {"ID": "1", "value": "c"},
+                {"ID": "3", "value": "d"},
+                {"ID": "1", "value": "e", "table": "y"},
+            ],
+        ]
+        for records in batches:
+            if as_arrow:
+                pa = pytest.importorskip("pyarrow")
+                columns = {
+                    name: [record.get(name) for record in records]
+                    for name in schema["properties"]
+                }
+                sink.process_batch({"arrow_table": pa.table(columns)})
+            else:
+                sink.process_batch({"records": records})
+
+        # Records with the same key are deduplicated within a batch, last one wins
+        assert self._select(sink, "SELECT * FROM foo ORDER BY id") == [
+            ("1", "e", "y"),
+            ("2", "b", None),
+            ("3", "d", None),
+        ]
+        assert sink._total_dupe_records_merged == 1
+
+        # Staging tables are dropped
+        assert self._select(
+            sink,
+            "SELECT name FROM sqlite_master WHERE type = 'table' "
+            "UNION ALL SELECT name FROM sqlite_temp_master WHERE type = 'table'",
+        ) == [("foo",)]
+
+    def test_upsert_key_columns_only(self, tmp_path: Path):
+        target = DummySQLTarget(
+            config={
+                "sqlalchemy_url": f"sqlite:///{tmp_path / 'db.sqlite'}",
+                "load_method": "upsert",
+            },
+        )
+        sink = UpsertSQLSink(
+            target,
+            stream_name="foo",
+            schema={"properties": {"id": {"type": ["string"]}}},
+            key_properties=["id"],
+        )
+        sink.setup()
+        sink.process_batch({"records": [{"id": "1"}, {"id": "2"}]})
+        sink.process_batch({"records": [{"id": "2"}, {"id": "3"}]})
+
+        assert self._select(sink, "SELECT * FROM foo ORDER BY id") == [
+            ("1",),
+            ("2",),
+            ("3",),
+        ]
+
+    def test_merge_statement(self, sink: UpsertSQLSink):
+        """MERGE statements are valid for a database that supports them."""
+        duckdb = pytest.importorskip("duckdb")
+
+        sink.connector.merge_upsert_strategy = "merge"
+        (statement,) = sink.connector.get_merge_upsert_statements(
+            "foo",
+            "staging",
+            join_keys=["id"],
+            column_names=["id", "value", "table"],
+        )
+
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE foo (id VARCHAR, value VARCHAR, "table" VARCHAR)')
+        conn.execute("CREATE TABLE staging AS SELECT * FROM foo")
+        conn.execute("INSERT INTO foo VALUES ('1', 'a', 'x'), ('2', 'b', NULL)")
+        conn.execute("INSERT INTO staging VALUES ('1', 'c', NULL), ('3', 'd', 'y')")
+        conn.execute(str(statement))
+
+        assert conn.execute("SELECT * FROM foo ORDER BY id").fetchall() == [
+            ("1", "c", None),
+            ("2", "b", None),
+            ("3", "d", "y"),
+        ]
@@ -3,14 +3,17 @@ from __future__ import annotations
 import datetime
 import itertools
 import typing as t
+from collections import OrderedDict
 
 import fastjsonschema
 import jsonschema
 import pytest
 
 from singer_sdk.exceptions import InvalidRecord
+from singer_sdk.helpers._validation import schema_hash
 from singer_sdk.sinks.core import (
     BaseJSONSchemaValidator,
+    CompiledJSONSchemaValidator,
     InvalidJSONSchema,
     JSONSchemaValidator,
 )
@@ -84,6 +87,166 @@ def test_jsonschema_validator():
         validator.validate({"id": 1, "created_at": "not-a-date"})
 
 
+COMPILED_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer", "minimum": 1},
+        "name": {"type": ["string", "null"], "minLength": 1, "pattern": "^[a-z]"},
+        "price": {"type": "number", "exclusiveMaximum": 100},
+        "status": {"enum": ["active", "inactive", None]},
+        "kind": {"const": 1},
+        "created_at": {"type": "string", "format": "date-time"},
+        "tags": {"type": "array", "items": {"type": "string"}, "maxItems": 2},
+        "nested": {
+            "type": "object",
+            "properties": {"flag": {"type": "boolean"}},
+            "required": ["flag"],
+            "additionalProperties": False,
+        },
+        "choice": {"anyOf": [{"type": "integer"}, {"type": "string"}]},
+        "exclusive": {"oneOf": [{"type": "integer"}, {"type": "number"}]},
+        "extra": {"type": "object", "additionalProperties": {"type": "integer"}},
+    },
+    "required": ["id"],
+}
+
+
+@pytest.mark.parametrize("validate_formats", [False, True])
+@pytest.mark.parametrize(
+    "record",
+    [
+        pytest.param({"id": 1}, id="minimal"),
+        pytest.param({"id": 1.0}, id="integral-float"),
+        pytest.param({"id": 0}, id="below-minimum"),
+        pytest.param({"id": True}, id="bool-is-not-integer"),
+        pytest.param({}, id="missing-required"),
+        pytest.param({"id": 1, "name": None}, id="nullable"),
+        pytest.param({"id": 1, "name": ""}, id="too-short"),
+        pytest.param({"id": 1, "name": "Abc"}, id="pattern-mismatch"),
+        pytest.param({"id": 1, "price": 99.9}, id="number"),
+        pytest.param({"id": 1, "price": 100}, id="exclusive-maximum"),
+        pytest.param({"id": 1, "price": "1"}, id="number-as-string"),
+        pytest.param({"id": 1, "status": None}, id="enum-null"),
+        pytest.param({"id": 1, "status": "deleted"}, id="enum-mismatch"),
+        pytest.param({"id": 1, "kind": 1.0}, id="const"),
+        pytest.param({"id": 1, "kind": True}, id="const-bool"),
+        pytest.param({"id": 1, "created_at": "not-a-date"}, id="format"),
+        pytest.param({"id": 1, "tags": ["a", "b"]}, id="array"),
+        pytest.param({"id": 1, "tags": ["a", 1]}, id="array-item"),
+        pytest.param({"id": 1, "tags": ["a", "b", "c"]}, id="max-items"),
+        pytest.param({"id": 1, "nested": {"flag": False}}, id="nested"),
+        pytest.param({"id": 1, "nested": {}}, id="nested-required"),
+        pytest.param({"id": 1, "nested": {"flag": True, "x": 1}}, id="nested-extra"),
+        pytest.param({"id": 1, "choice": "a"}, id="any-of"),
+        pytest.param({"id": 1, "choice": 1.5}, id="any-of-mismatch"),
+        pytest.param({"id": 1, "exclusive": 1.5}, id="one-of"),
+        pytest.param({"id": 1, "exclusive": 1}, id="one-of-mismatch"),
+        pytest.param({"id": 1, "extra": {"a": 1}}, id="additional"),
+        pytest.param({"id": 1, "extra": {"a": "1"}}, id="additional-mismatch"),
+    ],
+)
+def test_compiled_validator_matches_jsonschema(record: dict, validate_formats: bool):
+    expected = JSONSchemaValidator(COMPILED_SCHEMA, validate_formats=validate_formats)
+    validator = CompiledJSONSchemaValidator(
+        COMPILED_SCHEMA,
+        validate_formats=validate_formats,
+    )
+    assert validator._check is not None
+
+    try:
+        expected.validate(record)
+    except InvalidRecord as e:
+        expected_message = e.error_message
+    else:
+        expected_message = None
+
+    if expected_message is None:
+        validator.validate(record)
+    else:
+        with pytest.raises(InvalidRecord) as exc_info:
+            validator.validate(record)
+        assert exc_info.value.error_message == expected_message
+
+
+def test_compiled_validator_cache():
+    schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+    first = CompiledJSONSchemaValidator(schema)
+    second = CompiledJSONSchemaValidator(
+        {"properties": {"id": {"type": "integer"}}, "type": "object"}
+    )
+    assert first._check is second._check
+    assert first._fallback is second._fallback
+
+    with_formats = CompiledJSONSchemaValidator(schema, validate_formats=True)
+    assert with_formats._check is not first._check
+
+
+def test_compiled_validator_cache_size(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(CompiledJSONSchemaValidator, "_cache", OrderedDict())
+    monkeypatch.setattr(CompiledJSONSchemaValidator, "cache_size", 2)
+
+    def schema(name: str) -> dict:
+        return {"type": "object", "properties": {name: {"type": "integer"}}}
+
+    first = CompiledJSONSchemaValidator(schema("a"))
+    CompiledJSONSchemaValidator(schema("b"))
+    # Using the first validator again keeps it in the cache
+    assert CompiledJSONSchemaValidator(schema("a"))._check is first._check
+
+    CompiledJSONSchemaValidator(schema("c"))
+    assert len(CompiledJSONSchemaValidator._cache) == 2
+    assert CompiledJSONSchemaValidator(schema("a"))._check is first._check
+    assert [hash_ for hash_, _ in CompiledJSONSchemaValidator._cache] == [
+        schema_hash(schema("c")),
+        schema_hash(schema("a")),
+    ]
+
+
+def test_compiled_validator_unsupported_keyword():
+    schema = {
+        "type": "object",
+        "properties": {"id": {"$ref": "#/$defs/id"}},
+        "$defs": {"id": {"type": "integer"}},
+    }
+    validator = CompiledJSONSchemaValidator(schema)
+    assert validator._check is None
+
+    validator.validate({"id": 1})
+    with pytest.raises(InvalidRecord, match="'a' is not of type 'integer'"):
+        validator.validate({"id": "a"})
+
+
+def test_compiled_validator_invalid_schema():
+    with pytest.raises(InvalidJSONSchema):
+        CompiledJSONSchemaValidator({"type": "not-a-type"})
+
+
+@pytest.mark.parametrize(
+    "config,validator_class",
+    [
+        pytest.param({}, JSONSchemaValidator, id="default"),
+        pytest.param(
+            {"validation_backend": "jsonschema"},
+            JSONSchemaValidator,
+            id="jsonschema",
+        ),
+        pytest.param(
+            {"validation_backend": "compiled"},
+            CompiledJSONSchemaValidator,
+            id="compiled",
+        ),
+    ],
+)
+def test_validation_backend_setting(config: dict, validator_class: type):
+    sink = BatchSinkMock(
+        TargetMock(config=config),
+        "users",
+        {"type": "object", "properties": {"id": {"type": "integer"}}},
+        ["id"],
+    )
+    assert type(sink._validator) is validator_class
+
+
 def test_validate_record():
     target = TargetMock()
     sink = BatchSinkMock(
@@ -287,6 +450,50 @@ def test_validate_record_jsonschema_format_checking_enabled_continue_on_error(
     assert "No schema for record field 'missing_datetime'" in caplog.text
 
 
+def test_timestamp_parsing_plan(caplog: pytest.LogCaptureFixture):
+    schema = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "name": {"type": "string"},
+            "created_at": {"type": ["string", "null"], "format": "date-time"},
+            "updated_on": {"anyOf": [{"type": "string", "format": "date"}]},
+        },
+    }
+    sink = BatchSinkMock(TargetMock(), "users", schema, ["id"])
+
+    plan = sink._get_timestamp_parsing_plan(sink.schema)
+    assert [(key, type_) for key, _, type_ in plan.fields] == [
+        ("created_at", "date-time"),
+        ("updated_on", "date"),
+    ]
+    assert sink._get_timestamp_parsing_plan(sink.schema) is plan
+
+    with caplog.at_level("WARNING"):
+        for _ in range(2):
+            record = {
+                "id": 1,
+                "name": "2021-01-01",
+                "created_at": None,
+                "updated_on": "2021-01-02",
+                "unknown": "value",
+            }
+            sink._parse_timestamps_in_record(
+                record,
+                sink.schema,
+                sink.datetime_error_treatment,
+            )
+
+    assert record == {
+        "id": 1,
+        "name": "2021-01-01",
+        "created_at": None,
+        "updated_on": datetime.date(2021, 1, 2),
+        "unknown": "value",
+    }
+    assert caplog.text.count("No schema for record field 'unknown'") == 1
+
+
 @pytest.fixture
 def bench_sink() -> BatchSinkMock:
     target = TargetMock()
@@ -355,3 +562,18 @@ def test_bench_validate_record_with_schema(benchmark, bench_sink, bench_record):
             sink._validator.validate(record)
 
     benchmark(run_validate_record_with_schema)
+
+
+def test_bench_validate_record_with_compiled_schema(
+    benchmark, bench_sink, bench_record
+):
+    """Run benchmark for CompiledJSONSchemaValidator method validate."""
+    number_of_runs = 1000
+
+    validator = CompiledJSONSchemaValidator(bench_sink.schema)
+
+    def run_validate_record_with_schema():
+        for record in itertools.repeat(bench_record, number_of_runs):
+            validator.validate(record)
+
+    benchmark(run_validate_record_with_schema)
@@ -0,0 +1,198 @@
+"""Test syncing streams concurrently."""
+
+from __future__ import annotations
+
+import io
+import json
+import threading
+import typing as t
+from contextlib import redirect_stdout
+
+import pytest
+
+from singer_sdk import Stream, Tap
+from singer_sdk.helpers._concurrency import EXHAUSTED, interleave
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "updated_at": {"type": "integer"},
+    },
+}
+
+
+class BarrierStream(Stream):
+    """A stream that waits for all other streams before its last record."""
+
+    schema: t.ClassVar[dict] = SCHEMA
+    replication_key = "updated_at"
+    is_sorted = True
+
+    def get_records(self, context: dict | None):  # noqa: ARG002
+        yield {"id": 1, "updated_at": 1}
+        # Deadlocks unless the other streams are syncing at the same time
+        self._tap.barrier.wait()
+        yield {"id": 2, "updated_at": 2}
+
+
+class ChildStream(Stream):
+    """A child stream of the first barrier stream."""
+
+    name = "child"
+    schema: t.ClassVar[dict] = SCHEMA
+
+    def get_records(self, context: dict | None):
+        yield {"id": context["pid"], "updated_at": 0}
+
+
+class ConcurrentTap(Tap):
+    name = "concurrent-tap"
+    max_concurrent_streams = 3
+
+    def __init__(self, *args, n_streams: int = 3, **kwargs):
+        self.n_streams = n_streams
+        self.barrier = threading.Barrier(n_streams, timeout=5)
+        super().__init__(*args, **kwargs)
+
+    def discover_streams(self):
+        streams = [
+            type(f"Stream{i}", (BarrierStream,), {"name": f"stream_{i}"})(self)
+            for i in range(self.n_streams)
+        ]
+
+        streams[0].get_child_context = lambda record, context: {"pid": record["id"]}  # noqa: ARG005
+        child_class = type(
+            "Child", (ChildStream,), {"parent_stream_type": type(streams[0])}
+        )
+        return [*streams, child_class(self)]
+
+
+def _sync(tap: Tap) -> list[dict]:
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        tap.sync_all()
+    return [json.loads(line) for line in buf.getvalue().splitlines()]
+
+
+def test_sync_streams_concurrently():
+    tap = ConcurrentTap()
+    messages = _sync(tap)
+
+    records: dict[str, list[int]] = {}
+    for message in messages:
+        if message["type"] == "RECORD":
+            records.setdefault(message["stream"], []).append(message["record"]["id"])
+
+    assert records == {
+        "stream_0": [1, 2],
+        "stream_1": [1, 2],
+        "stream_2": [1, 2],
+        "child": [1, 2],
+    }
+
+    # All streams emitted their first record before any of them emitted the last one
+    record_ids = [m["record"]["id"] for m in messages if m["type"] == "RECORD"]
+    assert record_ids[:3] == [1, 1, 1]
+
+    last_state = next(m for m in reversed(messages) if m["type"] == "STATE")
+    bookmarks = last_state["value"]["bookmarks"]
+    for i in range(3):
+        assert bookmarks[f"stream_{i}"] == {
+            "replication_key": "updated_at",
+            "replication_key_value": 2,
+        }
+    assert tap._sync_lock is None
+
+
+def test_sync_streams_concurrently_error():
+    class FailingTap(ConcurrentTap):
+        def discover_streams(self):
+            self.barrier = threading.Barrier(1)
+            streams = super().discover_streams()
+
+            def get_records(context):  # noqa: ARG001
+                msg = "Source error"
+                raise RuntimeError(msg)
+
+            streams[1].get_records = get_records
+            return streams
+
+    tap = FailingTap(n_streams=2)
+    with pytest.raises(RuntimeError, match="Source error"):
+        _sync(tap)
+    assert tap._sync_lock is None
+
+
+class PartitionedStream(Stream):
+    """A stream that reads its partitions concurrently."""
+
+    name = "partitioned"
+    schema: t.ClassVar[dict] = SCHEMA
+    replication_key = "updated_at"
+    is_sorted = True
+    max_partition_parallelism = 3
+    partitions: t.ClassVar[list[dict]] = [{"part": i} for i in range(3)]
+
+    def get_records(self, context: dict | None):
+        part = context["part"]
+        yield {"id": part, "updated_at": part}
+        # Deadlocks unless the other partitions are read at the same time
+        self._tap.barrier.wait()
+        yield {"id": part, "updated_at": part + 10}
+
+
+class PartitionedTap(ConcurrentTap):
+    max_concurrent_streams = 1
+
+    def discover_streams(self):
+        return [PartitionedStream(self)]
+
+
+def test_sync_partitions_concurrently():
+    tap = PartitionedTap()
+    messages = _sync(tap)
+
+    records = [m["record"] for m in messages if m["type"] == "RECORD"]
+    assert sorted(r["updated_at"] for r in records[:3]) == [0, 1, 2]
+    assert sorted(r["updated_at"] for r in records[3:]) == [10, 11, 12]
+
+    last_state = next(m for m in reversed(messages) if m["type"] == "STATE")
+    assert last_state["value"]["bookmarks"]["partitioned"] == {
+        "partitions": [
+            {
+                "context": {"part": i},
+                "replication_key": "updated_at",
+                "replication_key_value": i + 10,
+            }
+            for i in range(3)
+        ],
+    }
+
+
+def test_interleave_error():
+    def failing():
+        yield 1
+        msg = "Source error"
+        raise RuntimeError(msg)
+
+    items = interleave([lambda: range(3), failing], max_workers=2)
+    with pytest.raises(RuntimeError, match="Source error"):
+        list(items)
+
+
+@pytest.mark.parametrize("exception", [KeyboardInterrupt, SystemExit])
+def test_interleave_base_exception(exception: type[BaseException]):
+    def failing():
+        yield 1
+        raise exception
+
+    items = interleave([lambda: range(3), failing], max_workers=2)
+    with pytest.raises(exception):
+        list(items)
+
+
+def test_interleave():
+    items = list(interleave([lambda: range(3), lambda: range(2)], max_workers=2))
+    assert [item for index, item in items if index == 0] == [0, 1, 2, EXHAUSTED]
+    assert [item for index, item in items if index == 1] == [0, 1, EXHAUSTED]
@@ -545,6 +545,7 @@ class TestDummySQLConnector:
             sqlalchemy.Column("old_name", sqlalchemy.String),
         )
         meta.create_all(engine)
+        assert connector.column_exists("test_table", "old_name")
 
         connector.rename_column("test_table", "old_name", "new_name")
 
@@ -552,6 +553,8 @@ class TestDummySQLConnector:
             result = conn.execute(sqlalchemy.text("SELECT * FROM test_table"))
             assert result.keys() == ["id", "new_name"]
 
+        assert connector.get_table_columns("test_table").keys() == {"id", "new_name"}
+
     def test_adapt_column_type(self, connector: DummySQLConnector):
         engine = connector._engine
         meta = sqlalchemy.MetaData()
@@ -581,6 +584,56 @@ class TestDummySQLConnector:
                 == "ALTER TABLE test_table ALTER COLUMN name TYPE VARCHAR"
             )
 
+    def test_prepare_table_reflects_once(self, connector: DummySQLConnector):
+        """Existing tables are reflected once, and kept up to date by the connector."""
+        connector.config["load_method"] = "append-only"
+        columns = [f"col_{i}" for i in range(50)]
+        with connector._engine.connect() as conn, conn.begin():
+            conn.execute(
+                sqlalchemy.text(
+                    f"CREATE TABLE test_table ({' VARCHAR, '.join(columns)} VARCHAR)",
+                )
+            )
+
+        schema = {
+            "properties": {
+                name: {"type": ["string", "null"]} for name in [*columns, "new_col"]
+            },
+        }
+        with mock.patch.object(
+            sqlalchemy.engine.reflection.Inspector,
+            "get_columns",
+            autospec=True,
+            side_effect=sqlalchemy.engine.reflection.Inspector.get_columns,
+        ) as mock_get_columns:
+            connector.prepare_table("test_table", schema, primary_keys=[])
+            assert connector.table_exists("test_table")
+            assert connector.column_exists("test_table", "new_col")
+            connector.get_table("test_table")
+            table = connector.get_table("test_table", column_names=["NEW_COL"])
+
+        mock_get_columns.assert_called_once()
+        assert table.columns.keys() == ["new_col"]
+
+    def test_clear_reflection_cache(self, connector: DummySQLConnector):
+        connector.create_empty_table("test_table", {"properties": {"id": {}}})
+        assert connector.table_exists("test_table")
+        assert connector.get_table_columns("test_table").keys() == {"id"}
+
+        with connector._engine.connect() as conn, conn.begin():
+            conn.execute(sqlalchemy.text("ALTER TABLE test_table ADD COLUMN name"))
+        assert not connector.column_exists("test_table", "name")
+
+        connector.clear_reflection_cache("test_table")
+        assert connector.column_exists("test_table", "name")
+
+        with connector._engine.connect() as conn, conn.begin():
+            conn.execute(sqlalchemy.text("DROP TABLE test_table"))
+        assert connector.table_exists("test_table")
+
+        connector.clear_reflection_cache()
+        assert not connector.table_exists("test_table")
+
     @pytest.mark.parametrize(
         "exclude_schemas,expected_streams",
         [
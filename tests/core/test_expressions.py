@@ -0,0 +1,171 @@
+"""Test compiled stream map expressions."""
+
+from __future__ import annotations
+
+import ast
+import datetime
+import hashlib
+import json
+
+import pytest
+import simpleeval
+
+from singer_sdk.helpers._expressions import compile_expression
+
+RECORD = {
+    "id": 3,
+    "name": "tap-something",
+    "email": "dev@example.com",
+    "created_at": "2021-01-01",
+    "tags": ["a", "b", "c"],
+    "owner": {"login": "someone", "id": 7},
+    "score": 2.5,
+    "missing": None,
+    "config": "shadowed",
+    "str": "shadowed",
+    "self": "record self",
+}
+NAMES = {"config": {"seed": "abc"}, "__stream_name__": "repositories"}
+
+
+@pytest.fixture
+def evaluator() -> simpleeval.EvalWithCompoundTypes:
+    functions = simpleeval.DEFAULT_FUNCTIONS.copy()
+    functions.update(
+        md5=lambda s: hashlib.md5(s.encode()).hexdigest(),  # noqa: S324
+        datetime=datetime,
+        bool=bool,
+        json=json,
+    )
+    return simpleeval.EvalWithCompoundTypes(functions=functions)
+
+
+def _simpleeval(
+    evaluator: simpleeval.EvalWithCompoundTypes,
+    expr: str,
+    property_name: str | None,
+):
+    names = RECORD.copy()
+    names["_"] = RECORD
+    names["record"] = RECORD
+    names.update(NAMES)
+    if property_name and property_name in RECORD:
+        names["self"] = RECORD[property_name]
+    evaluator.names = names
+    return evaluator.eval(expr, previously_parsed=ast.parse(expr).body[0])
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "id",
+        "id + 1",
+        "-id * 2 // 4 % 3",
+        "id ** 2",
+        "score / 2",
+        "not missing",
+        "id > 1 and id < 10",
+        "1 < id < 10 > 2",
+        "id in [1, 2, 3]",
+        "'b' not in tags",
+        "missing is None",
+        "missing or 'default'",
+        "name if id else None",
+        "_['name']",
+        "record['owner']['login']",
+        "owner.login",
+        "owner.get('id')",
+        "email.split('@')[1]",
+        "tags[1:]",
+        "tags[::-1]",
+        "name.upper()",
+        "str(id)",
+        "int('0')",
+        "md5(config['seed'] + email)",
+        "config",
+        "__stream_name__",
+        "datetime.date.fromisoformat(created_at).year",
+        "json.dumps(owner, sort_keys=True)",
+        "{'a': id, 'b': [*tags, name]}",
+        "(id, name)",
+        "{1, 2, id}",
+        "f'{name}-{id:03d}'",
+        "f'{id!r}'",
+        "self",
+        "str",
+        "undefined_name",
+        "name.not_an_attribute",
+        "owner.missing_key",
+        "unknown_function(id)",
+        "type(id)",
+        "name.__class__",
+        "name.format(id)",
+        "'a' * 1000000",
+        "10 ** 10000000",
+        "[x for x in tags]",
+        "tags[10]",
+        "owner['missing']",
+    ],
+)
+@pytest.mark.parametrize("property_name", [None, "name", "not_in_record"])
+def test_compiled_expression_parity(
+    evaluator: simpleeval.EvalWithCompoundTypes,
+    expr: str,
+    property_name: str | None,
+):
+    """Compiled expressions should behave exactly like simpleeval."""
+    compiled = compile_expression(
+        expr,
+        ast.parse(expr).body[0],
+        evaluator,
+        names=NAMES,
+        self_property=property_name,
+    )
+    if compiled is None:
+        return
+
+    try:
+        expected = _simpleeval(evaluator, expr, property_name)
+    except Exception as e:  # noqa: BLE001
+        with pytest.raises(type(e)):
+            compiled(RECORD)
+    else:
+        assert compiled(RECORD) == expected
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "[x for x in tags]",
+        "{k: v for k, v in owner.items()}",
+        "name.__class__",
+        "name.format(id)",
+        "type(id)",
+        "unknown_function(id)",
+        "(lambda: 1)()",
+        "(x := 1)",
+        "id = 1",
+    ],
+)
+def test_uncompiled_expressions(
+    evaluator: simpleeval.EvalWithCompoundTypes,
+    expr: str,
+):
+    """Expressions that can't be reproduced exactly are not compiled."""
+    assert (
+        compile_expression(expr, ast.parse(expr).body[0], evaluator, names={}) is None
+    )
+
+
+def test_compiled_expression_safety(evaluator: simpleeval.EvalWithCompoundTypes):
+    """Names in expressions can only resolve to the record, names or functions."""
+    expr = "_c1(id)"
+    compiled = compile_expression(expr, ast.parse(expr).body[0], evaluator, names={})
+    assert compiled is None
+
+    expr = "_c1"
+    compiled = compile_expression(expr, ast.parse(expr).body[0], evaluator, names={})
+    assert compiled is not None
+    with pytest.raises(simpleeval.NameNotDefined):
+        compiled({})
+    assert compiled({"_c1": 1}) == 1
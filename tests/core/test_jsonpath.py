@@ -0,0 +1,156 @@
+"""Test JSONPath record extraction."""
+
+from __future__ import annotations
+
+import decimal
+import json
+import typing as t
+
+import pytest
+
+from singer_sdk.helpers.jsonpath import (
+    _compile_jsonpath,
+    _get_simple_path,
+    extract_jsonpath,
+    extract_jsonpath_from_chunks,
+)
+
+DOCUMENT = {
+    "meta": {"count": 3, "tags": ["a", "b"], "next": None},
+    "data": {
+        "empty": [],
+        "object": {"a": 1, "b": 2},
+        "scalar": "abc",
+        "null": None,
+        "records": [
+            {"id": 1, "name": "Zoë", "amount": 12.5, "nested": {"values": [1, 2]}},
+            {"id": 22, "name": "日本", "amount": -0.001, "nested": {"values": []}},
+            {"id": 333, "name": 'quote " and \\ slash', "amount": 1e-10},
+        ],
+    },
+    "last": True,
+}
+
+
+def _chunks(data: bytes, size: int) -> t.Iterator[bytes]:
+    return (data[i : i + size] for i in range(0, len(data), size))
+
+
+@pytest.mark.parametrize(
+    "expression,expected",
+    [
+        ("$[*]", ()),
+        ("$.data[*]", ("data",)),
+        ("$.data.records[*]", ("data", "records")),
+        ("$['data'][\"my key\"][*]", ("data", "my key")),
+        ("$", None),
+        ("$.data.*", None),
+        ("$.data[*].id", None),
+        ("$..records[*]", None),
+        ("$.data[0]", None),
+    ],
+)
+def test_get_simple_path(expression: str, expected: tuple[str, ...] | None):
+    assert _get_simple_path(expression) == expected
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "$[*]",
+        "$.data[*]",
+        "$.data.records[*]",
+        "$.data.empty[*]",
+        "$.data.object[*]",
+        "$.data.scalar[*]",
+        "$.data.null[*]",
+        "$.data.missing[*]",
+        "$.data.records.id[*]",
+        "$.meta['tags'][*]",
+        "$.meta.count[*]",
+        "$.last[*]",
+    ],
+)
+@pytest.mark.parametrize(
+    "document",
+    [
+        pytest.param(DOCUMENT, id="object"),
+        pytest.param(DOCUMENT["data"]["records"], id="array"),
+        pytest.param(None, id="null"),
+    ],
+)
+def test_extract_simple_jsonpath(expression: str, document: t.Any):
+    """Simple expressions match the same records as with jsonpath_ng."""
+    assert _get_simple_path(expression) is not None
+    expected = [match.value for match in _compile_jsonpath(expression).find(document)]
+    assert list(extract_jsonpath(expression, input=document)) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "$.data.records[*]",
+        "$.data.empty[*]",
+        "$.data.object[*]",
+        "$.data.scalar[*]",
+        "$.data.null[*]",
+        "$.data.missing[*]",
+        "$.meta.tags[*]",
+        "$.last[*]",
+        "$.meta.count.value[*]",
+        "$.data.records[*].nested",
+        "$.data.*",
+    ],
+)
+def test_extract_jsonpath_from_chunks(
+    expression: str,
+    chunk_size: int,
+    indent: int | None,
+):
+    """Records are the same as when decoding the whole document."""
+    data = json.dumps(DOCUMENT, indent=indent, ensure_ascii=False).encode()
+    document = json.loads(data, parse_float=decimal.Decimal)
+
+    records = extract_jsonpath_from_chunks(
+        expression,
+        _chunks(data, chunk_size),
+        parse_float=decimal.Decimal,
+    )
+    assert list(records) == list(extract_jsonpath(expression, input=document))
+
+
+def test_extract_jsonpath_from_chunks_top_level_array():
+    data = b'\xef\xbb\xbf [1, 22, 333.5, "x", null, true] '
+    records = extract_jsonpath_from_chunks("$[*]", _chunks(data, 1))
+    assert list(records) == [1, 22, 333.5, "x", None, True]
+
+
+def test_extract_jsonpath_from_chunks_is_incremental():
+    """Records are yielded before the rest of the document is read."""
+    read: list[bytes] = []
+
+    def chunks() -> t.Iterator[bytes]:
+        for chunk in (b'{"data": [{"id": 1},', b' {"id": 2}', b"]}"):
+            read.append(chunk)
+            yield chunk
+
+    records = extract_jsonpath_from_chunks("$.data[*]", chunks())
+    assert next(records) == {"id": 1}
+    assert len(read) < 3
+    assert list(records) == [{"id": 2}]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b'{"data": [{"id": 1}, {"id": 2]}',
+        b'{"data": [{"id": 1} {"id": 2}]}',
+        b'{"data": [{"id": 1},',
+        b"",
+    ],
+)
+def test_extract_jsonpath_from_chunks_invalid(data: bytes):
+    with pytest.raises(json.JSONDecodeError):
+        list(extract_jsonpath_from_chunks("$.data[*]", _chunks(data, 3)))
@@ -15,7 +15,14 @@ import pytest
 import time_machine
 
 from singer_sdk.exceptions import MapExpressionError
-from singer_sdk.mapper import PluginMapper, RemoveRecordTransform, md5
+from singer_sdk.helpers._flattening import FlatteningOptions
+from singer_sdk.mapper import (
+    CustomStreamMap,
+    PluginMapper,
+    RemoveRecordTransform,
+    SameRecordTransform,
+    md5,
+)
 from singer_sdk.singerlib import Catalog
 from singer_sdk.streams.core import Stream
 from singer_sdk.tap_base import Tap
@@ -37,6 +44,8 @@ if t.TYPE_CHECKING:
 
     from pytest_snapshot.plugin import Snapshot
 
+    from singer_sdk.mapper import StreamMap
+
 
 @pytest.fixture
 def stream_map_config() -> dict:
@@ -531,6 +540,7 @@ def _run_transform(
     stream_map_config,
     sample_stream,
     sample_catalog_obj,
+    batch: bool = False,
 ):
     output: dict[str, list[dict]] = {}
     output_schemas = {}
@@ -550,8 +560,11 @@ def _run_transform(
                 continue
             output_schemas[stream_map.stream_alias] = stream_map.transformed_schema
             output[stream_map.stream_alias] = []
-            for record in stream:
-                result = stream_map.transform(record)
+            if batch:
+                results = stream_map.transform_batch(stream)
+            else:
+                results = [stream_map.transform(record) for record in stream]
+            for result in results:
                 if result is None:
                     """Filter out record"""
                     continue
@@ -571,7 +584,7 @@ def _test_transform(
     sample_catalog_obj,
 ):
     output, output_schemas = _run_transform(
-        stream_maps=stream_maps,
+        stream_maps=copy.deepcopy(stream_maps),
         stream_map_config=stream_map_config,
         sample_stream=sample_stream,
         sample_catalog_obj=sample_catalog_obj,
@@ -596,6 +609,21 @@ def _test_transform(
         f"Generated output was {json.dumps(output, indent=2)}"
     )
 
+    batch_output, _ = _run_transform(
+        stream_maps=stream_maps,
+        stream_map_config=stream_map_config,
+        sample_stream=sample_stream,
+        sample_catalog_obj=sample_catalog_obj,
+        batch=True,
+    )
+    assert {
+        name: [list(record.items()) for record in records]
+        for name, records in batch_output.items()
+    } == {
+        name: [list(record.items()) for record in records]
+        for name, records in output.items()
+    }, f"Failed '{test_name}' batch transform test."
+
 
 class CustomObj:
     def __init__(self, value: str):
@@ -1040,3 +1068,180 @@ def test_bench_simple_map_transforms(
         sample_stream=repositories_sample_stream,
         sample_catalog_obj=repositories_sample_catalog_obj,
     )
+
+
+WIDE_SCHEMA = PropertiesList(
+    *(Property(f"col_{i}", StringType) for i in range(50)),
+    Property("id", IntegerType),
+    Property("nested", ObjectType(Property("value", StringType))),
+).to_dict()
+
+
+@pytest.mark.parametrize(
+    "map_transform",
+    [
+        pytest.param(
+            {"name": "col_1", "col_1": None, "col_2": "__NULL__"},
+            id="rename_and_remove",
+        ),
+        pytest.param(
+            {
+                "id": "id",
+                "name": "_['col_1']",
+                "copy": "record['id']",
+                "__else__": None,
+            },
+            id="projection",
+        ),
+        pytest.param(
+            {"col_0": "col_0.upper()", "hash": "md5(col_3)", "missing": "_['x']"},
+            id="expressions",
+        ),
+        pytest.param(
+            {"__filter__": "id % 2 == 0", "nested": None},
+            id="filter",
+        ),
+    ],
+)
+@pytest.mark.parametrize("flattening", [False, True])
+def test_transform_batch(map_transform: dict, flattening: bool):
+    stream_map = CustomStreamMap(
+        stream_alias="wide",
+        map_config={},
+        faker_config={},
+        raw_schema=WIDE_SCHEMA,
+        key_properties=["id"],
+        map_transform=map_transform,
+        flattening_options=FlatteningOptions(max_level=1) if flattening else None,
+    )
+    records = [
+        {
+            **{f"col_{i}": f"value_{i}_{n}" for i in range(50)},
+            "id": n,
+            "nested": {"value": str(n)},
+        }
+        for n in range(4)
+    ]
+
+    error = _assert_transform_batch_parity(stream_map, records)
+    if "missing" in map_transform:
+        assert isinstance(error, KeyError)
+    else:
+        assert error is None
+
+
+def _assert_transform_batch_parity(
+    stream_map: StreamMap,
+    records: list[dict],
+) -> Exception | None:
+    """Check that a batch is transformed like each of its records.
+
+    Returns:
+        The exception raised by both the batch and per-record transforms, if any.
+    """
+    expected = []
+    for record in records:
+        try:
+            expected.append(stream_map.transform(record.copy()))
+        except Exception as e:  # noqa: BLE001, PERF203
+            with pytest.raises(type(e)):
+                stream_map.transform_batch([record.copy() for record in records])
+            return e
+
+    actual = stream_map.transform_batch([record.copy() for record in records])
+    # Key order matters too, so compare items rather than dicts
+    assert [None if r is None else list(r.items()) for r in actual] == [
+        None if r is None else list(r.items()) for r in expected
+    ]
+    return None
+
+
+@pytest.mark.parametrize(
+    "map_transform",
+    [
+        pytest.param({"name": "col_1", "col_1": None}, id="rename_and_remove"),
+        pytest.param(
+            {"id": "record.get('id')", "name": "record.get('col_1')", "__else__": None},
+            id="projection",
+        ),
+        pytest.param(
+            {"__filter__": "record.get('id', 0) % 2 == 0", "nested": None},
+            id="filter_missing_key_property",
+        ),
+        pytest.param(
+            {"__filter__": "'col_1' in record and col_1 != 'a'"},
+            id="filter_missing_property",
+        ),
+        pytest.param({"__filter__": "col_1 != 'a'"}, id="filter_undefined_property"),
+        pytest.param({"upper": "col_1.upper()"}, id="expression_missing_property"),
+    ],
+)
+@pytest.mark.parametrize("flattening", [False, True])
+def test_transform_batch_partial_records(map_transform: dict, flattening: bool):
+    """Records missing key properties or filtered fields match per-record output."""
+    stream_map = CustomStreamMap(
+        stream_alias="wide",
+        map_config={},
+        faker_config={},
+        raw_schema=WIDE_SCHEMA,
+        key_properties=["id"],
+        map_transform=map_transform,
+        flattening_options=FlatteningOptions(max_level=1) if flattening else None,
+    )
+    records = [
+        {"col_1": "a", "col_2": "b"},
+        {"id": 1, "col_1": "c"},
+        {"id": 2, "nested": {"value": "x"}},
+        {"id": 4},
+        {"col_1": "d", "nested": {"value": "y"}},
+    ]
+    _assert_transform_batch_parity(stream_map, records)
+
+
+def test_default_transform_batch():
+    same = SameRecordTransform(
+        stream_alias="wide",
+        raw_schema=WIDE_SCHEMA,
+        key_properties=["id"],
+        flattening_options=None,
+    )
+    remove = RemoveRecordTransform(
+        stream_alias="wide",
+        raw_schema=WIDE_SCHEMA,
+        key_properties=["id"],
+        flattening_options=None,
+    )
+    records = [{"id": 1}, {"id": 2}]
+    assert same.transform_batch(records) == records
+    assert remove.transform_batch(records) == [None, None]
+
+
+@pytest.mark.parametrize("batch", [False, True], ids=["per_record", "batch"])
+def test_bench_projection_map_transforms(benchmark, batch: bool):
+    """Run benchmark for a rename and remove map over a wide stream."""
+    stream_map = CustomStreamMap(
+        stream_alias="wide",
+        map_config={},
+        faker_config={},
+        raw_schema=WIDE_SCHEMA,
+        key_properties=["id"],
+        map_transform={
+            "name": "col_1",
+            "col_1": None,
+            "col_2": None,
+            "email_hash": "md5(col_3)",
+        },
+        flattening_options=None,
+    )
+    records = [
+        {**{f"col_{i}": f"value_{i}" for i in range(50)}, "id": n} for n in range(1000)
+    ]
+
+    def run_per_record():
+        for record in records:
+            stream_map.transform(record)
+
+    def run_batch():
+        stream_map.transform_batch(records)
+
+    benchmark(run_batch if batch else run_per_record)
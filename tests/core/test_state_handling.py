@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import datetime
+import json
 import logging
 import uuid
 
 import pytest
 
 from singer_sdk.helpers import _state
+from singer_sdk.state import AdaptiveStatePolicy, RecordCountStatePolicy
 
 
 @pytest.fixture
@@ -200,3 +202,219 @@ def test_datetime_with_microseconds():
         is_sorted=True,
         check_sorted=True,
     )
+
+
+def test_partition_state_index():
+    """Partition states are found through the index."""
+    index = _state.PartitionStateIndex()
+    tap_state: dict = {
+        "bookmarks": {
+            "stream": {
+                "partitions": [
+                    {"context": {"id": 1}, "replication_key_value": "a"},
+                    {"context": {"id": 2, "tags": ["x"]}},
+                ],
+            },
+        },
+    }
+    partitions = tap_state["bookmarks"]["stream"]["partitions"]
+
+    def get_state(context: dict) -> dict:
+        return _state.get_writeable_state_dict(
+            tap_state,
+            "stream",
+            state_partition_context=context,
+            partition_index=index,
+        )
+
+    assert get_state({"id": 1}) is partitions[0]
+    assert get_state({"tags": ["x"], "id": 2}) is partitions[1]
+
+    # New partitions are appended to the Singer partitions list
+    new_state = get_state({"id": 3})
+    assert partitions[2] is new_state
+    assert partitions[2] == {"context": {"id": 3}}
+    assert get_state({"id": 3}) is new_state
+
+    # Partitions added to the list directly are found as well
+    partitions.append({"context": {"id": 4}})
+    assert get_state({"id": 4}) is partitions[3]
+    assert len(partitions) == 4
+
+    # Replacing the list rebuilds the index
+    tap_state["bookmarks"]["stream"]["partitions"] = [{"context": {"id": 1}}]
+    assert get_state({"id": 1}) is tap_state["bookmarks"]["stream"]["partitions"][0]
+    assert (
+        _state.get_state_if_exists(
+            tap_state,
+            "stream",
+            {"id": 2},
+            partition_index=index,
+        )
+        is None
+    )
+
+
+def test_partition_state_index_duplicates():
+    """Duplicate partitions are reported when looked up."""
+    index = _state.PartitionStateIndex()
+    partitions = [
+        {"context": {"id": 1}},
+        {"context": {"id": 2}},
+        {"context": {"id": 2}},
+    ]
+    assert index.find(partitions, {"id": 1}) is partitions[0]
+    with pytest.raises(ValueError, match="duplicate entries for partition"):
+        index.find(partitions, {"id": 2})
+
+
+def test_bench_partition_state_lookup(benchmark):
+    """Run benchmark for looking up the state of many partitions."""
+    tap_state: dict = {}
+    index = _state.PartitionStateIndex()
+    contexts = [{"parent_id": i} for i in range(10_000)]
+    for context in contexts:
+        _state.get_writeable_state_dict(
+            tap_state,
+            "stream",
+            state_partition_context=context,
+            partition_index=index,
+        )
+
+    def run_lookups():
+        for context in contexts:
+            _state.get_writeable_state_dict(
+                tap_state,
+                "stream",
+                state_partition_context=context,
+                partition_index=index,
+            )
+
+    benchmark(run_lookups)
+
+
+def test_state_writer_deduplicates_state():
+    """STATE messages are only written when the state changes."""
+
+    class ListWriter:
+        def __init__(self):
+            self.values: list[str] = []
+
+        def write_message(self, message):
+            self.values.append(json.dumps(message.value))
+
+    message_writer = ListWriter()
+    writer = _state.StateWriter(message_writer)  # type: ignore[arg-type]
+    state: dict = {"bookmarks": {"a": {"partitions": [{"context": {"id": 1}}]}}}
+
+    writer.write_state(state)
+    writer.write_state(state)
+    state["bookmarks"]["a"]["partitions"][0]["replication_key_value"] = 1
+    writer.write_state(state)
+    writer.write_state(state)
+    state["bookmarks"]["b"] = {}
+    writer.write_state(state)
+    state["bookmarks"]["a"]["partitions"][0]["replication_key_value"] = 1.0
+    writer.write_state(state)
+    state["bookmarks"]["a"]["partitions"].pop()
+    writer.write_state(state)
+
+    assert message_writer.values == [
+        '{"bookmarks": {"a": {"partitions": [{"context": {"id": 1}}]}}}',
+        '{"bookmarks": {"a": {"partitions": [{"context": {"id": 1}, '
+        '"replication_key_value": 1}]}}}',
+        '{"bookmarks": {"a": {"partitions": [{"context": {"id": 1}, '
+        '"replication_key_value": 1}]}, "b": {}}}',
+        '{"bookmarks": {"a": {"partitions": []}, "b": {}}}',
+    ]
+
+
+def test_state_snapshot_shares_unchanged_partitions():
+    """Only changed partitions are copied when taking a new snapshot."""
+    state = {
+        "bookmarks": {
+            "a": {"partitions": [{"context": {"id": i}} for i in range(3)]},
+            "b": {"replication_key_value": "x"},
+        },
+    }
+    snapshot = _state._snapshot_state(state)
+    assert snapshot == state
+    assert snapshot["bookmarks"]["a"] is not state["bookmarks"]["a"]
+
+    state["bookmarks"]["a"]["partitions"][1]["replication_key_value"] = 1
+    new_snapshot = _state._snapshot_state(state, snapshot)
+    assert new_snapshot == state
+    assert snapshot != state
+
+    new_partitions = new_snapshot["bookmarks"]["a"]["partitions"]
+    old_partitions = snapshot["bookmarks"]["a"]["partitions"]
+    assert new_partitions[0] is old_partitions[0]
+    assert new_partitions[1] is not old_partitions[1]
+    assert new_partitions[2] is old_partitions[2]
+    assert new_snapshot["bookmarks"]["b"] is snapshot["bookmarks"]["b"]
+
+
+def test_bench_state_writer(benchmark):
+    """Run benchmark for writing the state of a stream with many partitions."""
+    state: dict = {
+        "bookmarks": {
+            "stream": {
+                "partitions": [
+                    {"context": {"parent_id": i}, "replication_key_value": i}
+                    for i in range(10_000)
+                ],
+            },
+        },
+    }
+    partitions = state["bookmarks"]["stream"]["partitions"]
+
+    class NullWriter:
+        def write_message(self, message):
+            pass
+
+    writer = _state.StateWriter(NullWriter())  # type: ignore[arg-type]
+
+    def run_write_state():
+        for i in range(100):
+            partitions[i]["replication_key_value"] += 1
+            writer.write_state(state)
+
+    benchmark(run_write_state)
+
+
+def test_record_count_state_policy():
+    policy = RecordCountStatePolicy(max_records=3)
+    assert [policy.should_write_state(n, 0) for n in range(1, 5)] == [
+        False,
+        False,
+        True,
+        True,
+    ]
+
+
+def test_adaptive_state_policy(monkeypatch: pytest.MonkeyPatch):
+    now = 1000.0
+    monkeypatch.setattr("singer_sdk.state.time.monotonic", lambda: now)
+    policy = AdaptiveStatePolicy(
+        max_records=10,
+        max_bytes=1000,
+        max_interval=60,
+        min_interval=1,
+    )
+
+    # Nothing is due yet
+    assert not policy.should_write_state(9, 999)
+
+    # Due by record count or bytes, but capped by the minimum interval
+    assert not policy.should_write_state(10, 0)
+    assert not policy.should_write_state(1, 1000)
+    now += 1
+    assert policy.should_write_state(10, 0)
+    assert policy.should_write_state(1, 1000)
+
+    # Due by elapsed time
+    policy.reset()
+    now += 59
+    assert not policy.should_write_state(1, 0)
+    now += 1
+    assert policy.should_write_state(1, 0)
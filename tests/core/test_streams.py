@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 import datetime
 import decimal
 import logging
@@ -17,10 +18,12 @@ from singer_sdk.exceptions import (
     FatalAPIError,
     InvalidReplicationKeyException,
 )
+from singer_sdk.helpers._batch import BaseBatchFileEncoding, BatchConfig, StorageTarget
 from singer_sdk.helpers._compat import SingerSDKDeprecationWarning
 from singer_sdk.helpers._compat import datetime_fromisoformat as parse
 from singer_sdk.helpers.jsonpath import _compile_jsonpath
 from singer_sdk.singerlib import Catalog, MetadataMapping
+from singer_sdk.state import RecordCountStatePolicy
 from singer_sdk.streams.core import REPLICATION_FULL_TABLE, REPLICATION_INCREMENTAL
 from singer_sdk.streams.graphql import GraphQLStream
 from singer_sdk.streams.rest import RESTStream
@@ -28,6 +31,8 @@ from singer_sdk.typing import IntegerType, PropertiesList, Property, StringType
 from tests.core.conftest import SimpleTestStream
 
 if t.TYPE_CHECKING:
+    from pathlib import Path
+
     import requests_mock
 
     from singer_sdk import Stream, Tap
@@ -115,6 +120,31 @@ def test_stream_apply_catalog(
     assert stream.forced_replication_method == REPLICATION_FULL_TABLE
 
 
+def test_stream_type_conformer_cache(stream: Stream):
+    """The type conformer is reused until the effective schema changes."""
+    conformer = stream.type_conformer
+    assert stream.type_conformer is conformer
+    assert conformer.schema is stream.schema
+
+    stream.apply_catalog(
+        catalog=Catalog.from_dict(
+            {
+                "streams": [
+                    {
+                        "tap_stream_id": stream.name,
+                        "metadata": MetadataMapping(),
+                        "stream": stream.name,
+                        "schema": stream.schema,
+                    },
+                ],
+            },
+        ),
+    )
+
+    assert stream.type_conformer is not conformer
+    assert stream.type_conformer.schema is stream.effective_schema
+
+
 def test_stream_apply_catalog__singer_standard(stream: Stream):
     """Applying a catalog to a stream should overwrite fields."""
     assert stream.primary_keys == []
@@ -345,13 +375,21 @@ def test_stream_invalid_replication_key(tap: SimpleTestTap):
         "nested_values",
     ],
 )
-def test_jsonpath_rest_stream(tap: Tap, path: str, content: str, result: list[dict]):
+@pytest.mark.parametrize("parse_incrementally", [False, True])
+def test_jsonpath_rest_stream(
+    tap: Tap,
+    path: str,
+    content: str,
+    result: list[dict],
+    parse_incrementally: bool,
+):
     """Validate records are extracted correctly from the API response."""
     fake_response = requests.Response()
     fake_response._content = str.encode(content)
 
     RestTestStream.records_jsonpath = path
     stream = RestTestStream(tap)
+    stream.parse_incrementally = parse_incrementally
 
     records = stream.parse_response(fake_response)
 
@@ -776,3 +814,77 @@ def test_post_process_transforms_record(tap: Tap):
     stream = TransformsRecord(tap)
     records = stream._sync_records(None, write_messages=False)
     assert all(record["extra"] == "transformed" for record in records)
+
+
+def test_sync_record_batches(tap: Tap, tmp_path: Path):
+    """Arrow record batches are written to Parquet files without conversion."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    class ArrowStream(SimpleTestStream):
+        def get_record_batches(self, context: Context | None):  # noqa: ARG002
+            yield pa.RecordBatch.from_pylist(
+                [
+                    {"id": 1, "value": "Egypt", "updatedAt": 10, "extra": "x"},
+                    {"id": 2, "value": "Germany", "updatedAt": 30, "extra": "y"},
+                ],
+            )
+            yield pa.RecordBatch.from_pylist(
+                [{"id": 3, "value": "India", "updatedAt": 20, "extra": "z"}],
+            )
+
+    stream = ArrowStream(tap)
+    assert stream.supports_record_batches
+    assert not SimpleTestStream(tap).supports_record_batches
+
+    stream.mask["properties", "value"] = False
+    batch_config = BatchConfig(
+        encoding=BaseBatchFileEncoding(format="parquet"),
+        storage=StorageTarget(root=str(tmp_path)),
+        batch_size=2,
+    )
+    manifests = [manifest for _, manifest in stream.get_batches(batch_config)]
+    assert len(manifests) == 2
+
+    rows = [
+        row
+        for path in sorted(tmp_path.iterdir())
+        for row in pq.read_table(path).to_pylist()
+    ]
+    assert rows == [
+        {"id": 1, "updatedAt": 10},
+        {"id": 2, "updatedAt": 30},
+        {"id": 3, "updatedAt": 20},
+    ]
+    assert stream.stream_state["replication_key_value"] == 30
+
+
+def test_stream_state_emission_policy(tap: SimpleTestTap):
+    """Streams write STATE messages when their policy says so."""
+
+    class EveryOtherRecord(RecordCountStatePolicy):
+        def __init__(self):
+            super().__init__(max_records=2)
+            self.resets = 0
+
+        def reset(self):
+            self.resets += 1
+
+    class PolicyStream(SimpleTestStream):
+        def get_state_emission_policy(self):
+            return EveryOtherRecord()
+
+    stream = PolicyStream(tap)
+    written: list[dict] = []
+    stream._tap.state_writer.write_state = lambda state: written.append(  # type: ignore[method-assign]
+        copy.deepcopy(state)
+    )
+    for _ in stream._sync_records(None):
+        pass
+
+    # One STATE message after the second record, and one at the end
+    assert len(written) == 2
+    assert written[0]["bookmarks"]["test"]["progress_markers"][
+        "replication_key_value"
+    ] == ("2021-01-01T00:00:01Z")
+    assert stream.state_emission_policy.resets == 2  # type: ignore[attr-defined]
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import contextlib
 import copy
+import datetime
+import io
+import json
 
 import pytest
 
@@ -9,6 +13,7 @@ from singer_sdk.exceptions import (
     RecordsWithoutSchemaException,
 )
 from singer_sdk.helpers.capabilities import PluginCapabilities, TargetCapabilities
+from singer_sdk.sinks import RecordSink
 from tests.conftest import BatchSinkMock, SQLSinkMock, SQLTargetMock, TargetMock
 
 
@@ -180,3 +185,154 @@ def test_batch_size_rows_and_max_size():
     assert sink_set._batch_size_rows == 100000
     assert sink_set.batch_size_rows == 100000
     assert sink_set.max_size == 100000
+
+
+@pytest.mark.parametrize("record_batch_size", [None, 1, 3, 1000])
+def test_record_batch_dispatch(record_batch_size: int | None):
+    schema_message = {
+        "type": "SCHEMA",
+        "stream": "users",
+        "schema": {
+            "properties": {
+                "id": {"type": ["integer"]},
+                "created_at": {"type": ["string", "null"], "format": "date-time"},
+            },
+        },
+        "key_properties": ["id"],
+    }
+    lines = [json.dumps(schema_message)]
+    for i in range(10):
+        record = {"id": i, "created_at": "2021-01-01T00:00:00+00:00"}
+        lines.append(
+            json.dumps({"type": "RECORD", "stream": "users", "record": record})
+        )
+        if i == 6:
+            lines.append(json.dumps({"type": "STATE", "value": {"id": i}}))
+
+    class BatchedTargetMock(TargetMock):
+        pass
+
+    BatchedTargetMock.record_batch_size = record_batch_size
+    target = BatchedTargetMock(config={"batch_size_rows": 4})
+    with contextlib.redirect_stdout(io.StringIO()):
+        target.listen(io.StringIO("\n".join(lines) + "\n"))
+
+    assert target.num_records_processed == 10
+    assert target.num_batches_processed == 3
+    assert [record["id"] for record in target.records_written] == list(range(10))
+    assert target.records_written[0]["created_at"] == datetime.datetime(
+        2021, 1, 1, tzinfo=datetime.timezone.utc
+    )
+    assert target.state_messages_written == [{"id": 6}]
+
+
+def _users_lines(count: int) -> str:
+    schema_message = {
+        "type": "SCHEMA",
+        "stream": "users",
+        "schema": {"properties": {"id": {"type": ["integer"]}}},
+        "key_properties": ["id"],
+    }
+    lines = [json.dumps(schema_message)]
+    lines.extend(
+        json.dumps({"type": "RECORD", "stream": "users", "record": {"id": i}})
+        for i in range(count)
+    )
+    return "\n".join(lines) + "\n"
+
+
+def test_record_batch_lookup_flags():
+    class RoutingTargetMock(TargetMock):
+        def get_sink(self, stream_name, **kwargs):
+            return super().get_sink(stream_name, **kwargs)
+
+    class PartitionedSinkMock(BatchSinkMock):
+        def _get_context(self, record: dict) -> dict:
+            return {"partition": record["id"]}
+
+    assert not TargetMock._sink_depends_on_record
+    assert not SQLTargetMock._sink_depends_on_record
+    assert RoutingTargetMock._sink_depends_on_record
+    assert not BatchSinkMock._context_depends_on_record
+    assert not SQLSinkMock._context_depends_on_record
+    assert PartitionedSinkMock._context_depends_on_record
+
+
+def test_record_batch_dispatch_per_record_context():
+    chunks: list[tuple[dict, list[int]]] = []
+
+    class PartitionedSinkMock(BatchSinkMock):
+        def _get_context(self, record: dict) -> dict:
+            return {"partition": record["id"] // 2}
+
+        def process_records(self, records: list[dict], context: dict) -> None:
+            chunks.append((context, [record["id"] for record in records]))
+
+    class PartitionedTargetMock(TargetMock):
+        default_sink_class = PartitionedSinkMock
+        record_batch_size = 1000
+
+    target = PartitionedTargetMock()
+    with contextlib.redirect_stdout(io.StringIO()):
+        target.process_lines(io.StringIO(_users_lines(5)))
+
+    assert chunks == [
+        ({"partition": 0}, [0, 1]),
+        ({"partition": 1}, [2, 3]),
+        ({"partition": 2}, [4]),
+    ]
+
+
+def test_record_batch_dispatch_record_sink():
+    class RecordSinkMock(RecordSink):
+        def process_record(self, record: dict, context: dict) -> None:  # noqa: ARG002
+            self._target.records_written.append(record)
+
+    class RecordTargetMock(TargetMock):
+        default_sink_class = RecordSinkMock
+        record_batch_size = 1000
+
+        def add_sink(self, *args, **kwargs):
+            sink = super().add_sink(*args, **kwargs)
+            sink._target = self
+            self.sink = sink
+            return sink
+
+    target = RecordTargetMock()
+    with contextlib.redirect_stdout(io.StringIO()):
+        target.process_lines(io.StringIO(_users_lines(5)))
+
+    assert [record["id"] for record in target.records_written] == list(range(5))
+    assert target.sink._total_records_written == 5
+
+
+def test_record_batch_dispatch_per_record_hooks():
+    class HookedSinkMock(BatchSinkMock):
+        def _validate_and_parse(self, record: dict) -> dict:
+            record["parsed"] = True
+            return super()._validate_and_parse(record)
+
+        def _add_sdc_metadata_to_record(
+            self,
+            record: dict,
+            message: dict,
+            context: dict,
+        ) -> None:
+            super()._add_sdc_metadata_to_record(record, message, context)
+            record["_sdc_custom"] = True
+
+    class HookedTargetMock(TargetMock):
+        default_sink_class = HookedSinkMock
+        record_batch_size = 1000
+
+    target = HookedTargetMock(config={"add_record_metadata": True})
+    with contextlib.redirect_stdout(io.StringIO()):
+        target.process_lines(io.StringIO(_users_lines(3)))
+        target.drain_all()
+
+    assert len(target.records_written) == 3
+    assert all(record["parsed"] for record in target.records_written)
+    assert all(record["_sdc_custom"] for record in target.records_written)
+    assert all(
+        record["_sdc_received_at"] is not None for record in target.records_written
+    )
@@ -13,6 +13,7 @@ import sqlalchemy as sa
 
 from singer_sdk.helpers._typing import (
     TypeConformanceLevel,
+    TypeConformer,
     _conform_primitive_property,
     conform_record_data_types,
 )
@@ -477,6 +478,50 @@ def test_iterate_properties_list():
     assert list_property in properties_list
 
 
+BENCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "created_at": {"type": "string", "format": "date-time"},
+        "count": {"type": "integer"},
+        "amount": {"type": "number"},
+        "is_active": {"type": "boolean"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "metadata": {
+            "type": "object",
+            "properties": {
+                "key": {"type": "string"},
+                "value": {"type": "string"},
+            },
+        },
+        "nested": {
+            "type": "object",
+            "properties": {},
+            "additionalProperties": True,
+        },
+        "is_nan": {"type": "number"},
+    },
+}
+
+
+def test_type_conformer_returns_unchanged_records():
+    conformer = TypeConformer(BENCH_SCHEMA, TypeConformanceLevel.RECURSIVE)
+    record = {
+        "id": 1,
+        "created_at": "2021-01-01T00:00:00+00:00",
+        "tags": ["tag1", "tag2"],
+        "metadata": {"key": "value"},
+        "nested": {"key": "value"},
+    }
+    assert conformer.conform_record("test_stream", record, logger) is record
+
+    changed = {**record, "created_at": datetime.datetime(2021, 1, 1)}  # noqa: DTZ001
+    output = conformer.conform_record("test_stream", changed, logger)
+    assert output is not changed
+    assert output["created_at"] == "2021-01-01T00:00:00.000000+00:00"
+    assert isinstance(changed["created_at"], datetime.datetime)
+
+
 def test_bench_conform_record_data_types(benchmark: BenchmarkFixture):
     """Run benchmark for conform_record_data_types method."""
     number_of_runs = 1_000
@@ -527,3 +572,26 @@ def test_bench_conform_record_data_types(benchmark: BenchmarkFixture):
             )
 
     benchmark(run_conform_record_data_types)
+
+
+def test_bench_type_conformer(benchmark: BenchmarkFixture):
+    """Run benchmark for a reused TypeConformer."""
+    number_of_runs = 1_000
+    conformer = TypeConformer(BENCH_SCHEMA, TypeConformanceLevel.RECURSIVE)
+    record = {
+        "id": 1,
+        "created_at": datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc),
+        "count": 10,
+        "amount": 100.0,
+        "is_active": True,
+        "tags": ["tag1", "tag2"],
+        "metadata": {"key": "value"},
+        "nested": {"key": "value", "deep": {"even_deeper": "value"}},
+        "is_nan": float("nan"),
+    }
+
+    def run_type_conformer():
+        for rec in itertools.repeat(record, number_of_runs):
+            conformer.conform_record("test_stream", rec, logger)
+
+    benchmark(run_type_conformer)
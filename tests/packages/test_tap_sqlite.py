@@ -5,13 +5,15 @@ import json
 import typing as t
 
 import pytest
+import sqlalchemy as sa
 import time_machine
 from click.testing import CliRunner
 from tap_sqlite import SQLiteTap
 from target_csv.target import TargetCSV
 
-from singer_sdk.singerlib import MetadataMapping, StreamMetadata
+from singer_sdk.singerlib import Catalog, MetadataMapping, StreamMetadata
 from singer_sdk.testing import (
+    _get_tap_catalog,
     get_standard_tap_tests,
     tap_sync_test,
     tap_to_target_sync_test,
@@ -20,6 +22,8 @@ from singer_sdk.testing import (
 if t.TYPE_CHECKING:
     from pathlib import Path
 
+    from tap_sqlite import SQLiteConnector
+
     from singer_sdk import SQLStream
     from singer_sdk.tap_base import SQLTap
 
@@ -153,3 +157,92 @@ def test_sqlite_state(sqlite_sample_tap_state_messages):
         for message in sqlite_sample_tap_state_messages
         for bookmark in message["value"]["bookmarks"].values()
     )
+
+
+def _keyset_records(table: str) -> list[dict]:
+    return [
+        {
+            "id": i,
+            "updated": None if i % 5 == 0 and table == "t_keyset" else (i * 7) % 4,
+        }
+        for i in range(23)
+    ]
+
+
+@pytest.fixture
+def sqlite_keyset_tap(
+    sqlite_connector: SQLiteConnector,
+    sqlite_sample_db_config: dict,
+) -> SQLiteTap:
+    with sqlite_connector._connect() as conn, conn.begin():
+        conn.execute(
+            sa.text("CREATE TABLE t_keyset (id int PRIMARY KEY NOT NULL, updated int)"),
+        )
+        conn.execute(
+            sa.text(
+                "CREATE TABLE t_keyset_composite "
+                "(id int NOT NULL, updated int NOT NULL, PRIMARY KEY (id, updated))",
+            ),
+        )
+        for table in ("t_keyset", "t_keyset_composite"):
+            conn.execute(
+                sa.text(f"INSERT INTO {table} VALUES (:id, :updated)"),  # noqa: S608
+                _keyset_records(table),
+            )
+
+    catalog = Catalog.from_dict(
+        _get_tap_catalog(SQLiteTap, config=sqlite_sample_db_config, select_all=True),
+    )
+    for table in ("t_keyset", "t_keyset_composite"):
+        stream = catalog.get_stream(f"main-{table}")
+        assert stream is not None
+        stream.replication_key = "updated"
+        stream.replication_method = "INCREMENTAL"
+    return SQLiteTap(config=sqlite_sample_db_config, catalog=catalog.to_dict())
+
+
+@pytest.mark.parametrize("fetch_size", [None, 3])
+@pytest.mark.parametrize("keyset_chunk_size", [None, 1, 4, 100])
+@pytest.mark.parametrize("replication_key", [None, "updated", "id"])
+@pytest.mark.parametrize("table", ["t_keyset", "t_keyset_composite"])
+def test_sqlite_get_records_in_chunks(
+    sqlite_keyset_tap: SQLiteTap,
+    table: str,
+    fetch_size: int | None,
+    keyset_chunk_size: int | None,
+    replication_key: str | None,
+):
+    stream = t.cast("SQLStream", sqlite_keyset_tap.streams[f"main-{table}"])
+    stream.replication_key = replication_key
+    stream.fetch_size = fetch_size
+    stream.keyset_chunk_size = keyset_chunk_size
+
+    records = list(stream.get_records(None))
+    assert sorted(records, key=lambda r: r["id"]) == _keyset_records(table)
+    if replication_key:
+        # Records are sorted by the replication key, with nulls first
+        values = [record[replication_key] for record in records]
+        assert values == sorted(values, key=lambda v: (v is not None, v))
+
+
+@pytest.mark.parametrize("keyset_chunk_size", [None, 1, 4, 100])
+def test_sqlite_get_records_in_chunks_limit(
+    sqlite_keyset_tap: SQLiteTap,
+    keyset_chunk_size: int | None,
+):
+    """A limit set by the stream query applies to all chunks together."""
+    stream = t.cast("SQLStream", sqlite_keyset_tap.streams["main-t_keyset_composite"])
+    stream.keyset_chunk_size = keyset_chunk_size
+    stream.apply_query_limit = lambda query: query.limit(10)  # type: ignore[method-assign]
+
+    records = list(stream.get_records(None))
+    assert len(records) == 10
+    assert records == sorted(records, key=lambda r: (r["updated"], r["id"]))
+
+
+def test_sqlite_sync_in_chunks(sqlite_keyset_tap: SQLiteTap):
+    """Incremental streams with a composite primary key stay sorted."""
+    stream = t.cast("SQLStream", sqlite_keyset_tap.streams["main-t_keyset_composite"])
+    stream.keyset_chunk_size = 3
+    stream.sync()
+    assert stream.stream_state["replication_key_value"] == 3
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import json
 import shutil
 import uuid
+from io import StringIO
 from pathlib import Path
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
+from target_parquet.sink import ParquetSink
 from target_parquet.target import TargetParquet
 
-from singer_sdk.testing import get_target_test_class
+from singer_sdk.testing import get_target_test_class, target_sync_test
 
 SAMPLE_FILEPATH = Path(f".output/test_{uuid.uuid4()}/")
 SAMPLE_FILENAME = SAMPLE_FILEPATH / "testfile.parquet"
@@ -35,3 +40,64 @@ class TestSampleTargetParquet(StandardTests):
         test_output_dir.mkdir(parents=True, exist_ok=True)
         yield test_output_dir
         shutil.rmtree(test_output_dir)
+
+
+def test_target_parquet_arrow_batch(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that Parquet BATCH files are written without a dict per row."""
+    batch_file = tmp_path / "batch.parquet"
+    pq.write_table(
+        pa.table(
+            {
+                "name": ["Africa", "Europe", None],
+                "id": pa.array([1, 2, 3], pa.int32()),
+                "extra": ["a", "b", "c"],
+            }
+        ),
+        batch_file,
+    )
+    output_file = tmp_path / "output.parquet"
+
+    contexts: list[dict] = []
+    process_batch = ParquetSink.process_batch
+
+    def spy(self: ParquetSink, context: dict) -> None:
+        contexts.append(context)
+        process_batch(self, context)
+
+    monkeypatch.setattr(ParquetSink, "process_batch", spy)
+
+    schema_message = {
+        "type": "SCHEMA",
+        "stream": "continents",
+        "key_properties": ["id"],
+        "schema": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer"},
+                "name": {"type": ["string", "null"]},
+            },
+        },
+    }
+    batch_message = {
+        "type": "BATCH",
+        "stream": "continents",
+        "encoding": {"format": "parquet"},
+        "manifest": [batch_file.as_uri()],
+    }
+    tap_output = "\n".join([json.dumps(schema_message), json.dumps(batch_message)])
+
+    target_sync_test(
+        TargetParquet(config={"filepath": str(output_file)}),
+        input=StringIO(tap_output),
+        finalize=True,
+    )
+
+    assert len(contexts) == 1
+    assert "records" not in contexts[0]
+    table = pq.read_table(output_file)
+    assert table.schema == pa.schema([("id", pa.int64()), ("name", pa.string())])
+    assert table.to_pylist() == [
+        {"id": 1, "name": "Africa"},
+        {"id": 2, "name": "Europe"},
+        {"id": 3, "name": None},
+    ]
@@ -10,7 +10,7 @@ from textwrap import dedent
 
 import pytest
 
-from singer_sdk.singerlib import RecordMessage
+from singer_sdk.singerlib import RecordMessage, StateMessage
 from singer_sdk.singerlib.encoding.simple import (
     SimpleSingerReader,
     SimpleSingerWriter,
@@ -69,6 +69,44 @@ def test_process_lines():
     reader.process_lines(input_lines, CALLBACKS)
 
 
+def test_process_lines_record_batches():
+    reader = SimpleSingerReader()
+    input_lines = io.StringIO(
+        dedent("""\
+        {"type": "RECORD", "stream": "users", "record": {"id": 1}}
+        {"type": "RECORD", "stream": "users", "record": {"id": 2}}
+        {"type": "RECORD", "stream": "users", "record": {"id": 3}}
+        {"type": "RECORD", "stream": "orders", "record": {"id": 4}}
+        {"type": "STATE", "value": {"bookmarks": {"users": {"id": 3}}}}
+        {"type": "RECORD", "stream": "orders", "record": {"id": 5}}
+    """)
+    )
+    dispatched = []
+
+    def on_record_batch(message_dicts: list[dict]) -> None:
+        dispatched.append(
+            (message_dicts[0]["stream"], [m["record"]["id"] for m in message_dicts])
+        )
+
+    def on_state(message_dict: dict) -> None:
+        dispatched.append(("STATE", message_dict["value"]))
+
+    counter = reader.process_lines(
+        input_lines,
+        {**CALLBACKS, "STATE": on_state},
+        record_batch_callback=on_record_batch,
+        record_batch_size=2,
+    )
+    assert dispatched == [
+        ("users", [1, 2]),
+        ("users", [3]),
+        ("orders", [4]),
+        ("STATE", {"bookmarks": {"users": {"id": 3}}}),
+        ("orders", [5]),
+    ]
+    assert counter == {"RECORD": 5, "STATE": 1}
+
+
 def test_process_unknown_message():
     reader = SimpleSingerReader()
     input_lines = io.StringIO('{"type": "UNKNOWN"}\n')
@@ -119,3 +157,33 @@ def test_encode_nan_values(float_value):
     assert out.getvalue() == (
         '{"type":"RECORD","stream":"test","record":{"id":1,"name":null}}\n'
     )
+
+
+def test_write_message_buffered():
+    class BufferedWriter(SimpleSingerWriter):
+        buffer_size = 200
+        flush_interval = 3600
+
+    writer = BufferedWriter()
+    records = [RecordMessage(stream="test", record={"id": i}) for i in range(5)]
+    lines = [
+        f'{{"type":"RECORD","stream":"test","record":{{"id":{i}}}}}\n' for i in range(5)
+    ]
+    with redirect_stdout(io.StringIO()) as out:
+        writer.write_message(records[0])
+        writer.write_message(records[1])
+        writer.write_message(records[2])
+        assert not out.getvalue()
+
+        # Other messages are written together with the buffered records
+        writer.write_message(StateMessage(value={"bookmarks": {}}))
+        assert out.getvalue() == "".join(lines[:3]) + (
+            '{"type":"STATE","value":{"bookmarks":{}}}\n'
+        )
+
+        writer.write_message(records[3])
+        writer.write_message(records[4])
+        writer.flush()
+
+    assert out.getvalue().endswith("".join(lines[3:]))
+    assert writer.bytes_written == len(out.getvalue())